@@ -1,41 +1,38 @@
 import streamlit as st
-import yfinance as yf
 from config.stock_categories import stock_categories
-from utils import fundamentals, charts, indicators, metrics
-from pathlib import Path
+from utils.assets import stylesheet
+from utils.catalog import load_catalog
+from utils.data import get_ticker
+from utils.refresh import show_data_age
+from utils.tracing import begin_rerun, end_rerun, show_trace_sidebar
 
-# Load CSS
-def load_css(file_name):
-    with open(file_name, "r") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+# Root span of this run (DASHBOARD_TRACE=1 only)
+trace = begin_rerun()
 
 # Streamlit page config
 st.set_page_config(page_title="📊 Stock Market Dashboard", layout="wide")
-load_css("styles/style.css")
-# NEW: Load Material Icons font to fix arrow rendering
-st.markdown("""
-<link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">
-<style>
-    .stApp [class*="material-icons"] {
-        font-family: 'Material Icons' !important;
-        font-weight: normal;
-        font-style: normal;
-        font-size: 24px;
-        line-height: 1;
-        letter-spacing: normal;
-        text-transform: none;
-        display: inline-block;
-        white-space: nowrap;
-        word-wrap: normal;
-        direction: ltr;
-        -webkit-font-feature-settings: 'liga';
-        -webkit-font-smoothing: antialiased;
-    }
-</style>
-""", unsafe_allow_html=True)
+# CSS (incl. Material Icons font to fix arrow rendering) is read and minified once per process
+st.markdown(stylesheet("style.css", "material_icons.css"), unsafe_allow_html=True)
 
 st.title("📊 Stock Market Dashboard")
 
+# Global search across every category
+catalog = load_catalog()
+
+def jump_to_match():
+    match = st.session_state.get("catalog_match")
+    if match:
+        st.session_state.category_select, st.session_state.company_select = catalog.locations[match][0]
+
+search_col, match_col = st.columns(2)
+with search_col:
+    query = st.text_input(f"🔍 Search {len(catalog):,} companies by name or symbol", key="catalog_search")
+with match_col:
+    matches = catalog.search(query) if query else []
+    st.selectbox("Matches", matches, index=None, format_func=catalog.label, key="catalog_match",
+                 on_change=jump_to_match, placeholder="Pick a match" if matches else "No matches",
+                 disabled=not matches)
+
 # Top selections (replaces sidebar)
 col1, col2 = st.columns(2)
 with col1:
@@ -44,28 +41,50 @@ with col2:
     company = st.selectbox("Select a Company", list(stock_categories[category].keys()), key="company_select")
 ticker = stock_categories[category][company]
 
-if ticker:
-    stock = yf.Ticker(ticker)
+# Closed even when a tab raises, so a failing rerun leaves its trace too
+try:
+    if ticker:
+        # Deferred until the page header and selectors are painted: these pull in pandas and yfinance
+        from utils import fundamentals, charts, indicators, metrics, category_metrics, query_panel, memory
+        stock = get_ticker(ticker)
+        # Filled once the tabs have loaded their data: notes data served past its TTL
+        data_age = st.empty()
     
-    # Use tabs for sections (replaces radio)
-    tab_introduction, tab_metrics, tab_fundamentals, tab_charts, tab_indicators = st.tabs(
-        ["Introduction", "Key Metrics", "Fundamentals", "Charts", "Technical Indicators"]
-    )
+        # Use tabs for sections (replaces radio)
+        (tab_introduction, tab_metrics, tab_fundamentals, tab_charts, tab_indicators, tab_category, tab_sql,
+         tab_diagnostics) = st.tabs(
+            ["Introduction", "Key Metrics", "Fundamentals", "Charts", "Technical Indicators", "Category Metrics",
+             "SQL Query", "Diagnostics"]
+        )
     
-    # Render content inside each tab
-    with tab_introduction:
-        fundamentals.show_introduction(stock, company)
+        # Render content inside each tab. The show_* of tabs with widgets are st.fragments:
+        # a widget reruns its own tab, not this script, the selectors or the other tabs
+        with tab_introduction:
+            fundamentals.show_introduction(stock, company)
     
-    with tab_metrics:
-        metrics.show_metrics(stock, company)
+        with tab_metrics:
+            metrics.show_metrics(stock, company)
     
-    with tab_fundamentals:
-        fundamentals.show_fundamentals(stock, ticker)
+        with tab_fundamentals:
+            fundamentals.show_fundamentals(stock, ticker)
     
-    with tab_charts:
-        charts.show_charts(stock, company)
+        with tab_charts:
+            charts.show_charts(stock, company)
     
-    with tab_indicators:
-        indicators.show_indicators(stock, company)
-else:
-    st.warning("Please select a category and company.")
+        with tab_indicators:
+            indicators.show_indicators(stock, company)
+
+        with tab_category:
+            category_metrics.show_category_metrics(category, stock_categories[category])
+
+        with tab_sql:
+            query_panel.show_query_panel(category, stock_categories[category])
+
+        with tab_diagnostics:
+            memory.show_memory_diagnostics()
+
+        show_data_age(data_age, ticker)
+    else:
+        st.warning("Please select a category and company.")
+finally:
+    show_trace_sidebar(end_rerun(trace, category=category, ticker=ticker))
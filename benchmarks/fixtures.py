@@ -0,0 +1,89 @@
+"""
+Deterministic synthetic market data for offline benchmarks and harnesses.
+
+Shapes follow what yfinance returns: daily OHLCV frames indexed by date,
+statement frames with line items as rows and period ends as columns (latest
+first), and flat `info` dicts.
+"""
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+
+BALANCE_SHEET_ITEMS = [
+    "Total Assets", "Total Debt", "Stockholders Equity", "Current Assets", "Current Liabilities",
+    "Cash And Cash Equivalents", "Accounts Receivable", "Other Short Term Investments", "Prepaid Assets",
+    "Current Debt And Capital Lease Obligation", "Accounts Payable", "Current Accrued Expenses",
+    "Other Payable", "Ordinary Shares Number", "Share Issued", "Inventory", "Goodwill",
+    "Net PPE", "Long Term Debt", "Retained Earnings", "Working Capital", "Tangible Book Value",
+    "Invested Capital", "Net Debt", "Total Capitalization", "Common Stock Equity",
+]
+INCOME_ITEMS = [
+    "Total Revenue", "Operating Revenue", "Cost Of Revenue", "Gross Profit", "Operating Expense",
+    "Selling General And Administration", "Operating Income", "EBITDA", "EBIT", "Net Income",
+    "Interest Expense", "Tax Provision", "Pretax Income", "Diluted EPS", "Basic EPS",
+    "Other Non Interest Expense", "Occupancy And Equipment",
+    "Depreciation And Amortization In Income Statement", "Normalized Income", "Total Expenses",
+]
+CASHFLOW_ITEMS = [
+    "Operating Cash Flow", "Capital Expenditure", "Free Cash Flow", "Investing Cash Flow",
+    "Financing Cash Flow", "End Cash Position", "Changes In Cash", "Repayment Of Debt",
+    "Issuance Of Debt", "Cash Dividends Paid", "Depreciation And Amortization",
+]
+
+
+def make_ohlcv(years=1, seed=0, end="2026-10-16"):
+    """Daily OHLCV frame with a geometric random-walk close."""
+    rng = np.random.default_rng(seed)
+    n = max(1, int(years * TRADING_DAYS_PER_YEAR))
+    index = pd.bdate_range(end=end, periods=n, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n)))
+    open_ = close * (1 + rng.normal(0, 0.004, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.006, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.006, n)))
+    volume = rng.integers(100_000, 5_000_000, n)
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume}, index=index)
+
+
+def make_statement_frame(items, periods=4, quarterly=False, seed=0, end="2026-03-31"):
+    """Statement frame in yfinance layout: line items x period ends, latest first, some gaps."""
+    rng = np.random.default_rng(seed)
+    freq = "3ME" if quarterly else "12ME"
+    columns = pd.date_range(end=end, periods=periods, freq=freq)[::-1]
+    values = rng.uniform(1e8, 5e10, (len(items), periods))
+    values[rng.random(values.shape) < 0.05] = np.nan
+    return pd.DataFrame(values, index=items, columns=columns)
+
+
+def make_statement_frames(periods=4, quarterly=False, seed=0):
+    """{attribute name: frame} for the three statements, named like yfinance Ticker attributes."""
+    prefix = "quarterly_" if quarterly else ""
+    return {
+        f"{prefix}balance_sheet": make_statement_frame(BALANCE_SHEET_ITEMS, periods, quarterly, seed),
+        f"{prefix}financials": make_statement_frame(INCOME_ITEMS, periods, quarterly, seed + 1),
+        f"{prefix}cashflow": make_statement_frame(CASHFLOW_ITEMS, periods, quarterly, seed + 2),
+    }
+
+
+def make_info(seed=0, symbol="SYN.NS"):
+    """`info` dict with the price fields present and fundamentals left to the statements."""
+    rng = np.random.default_rng(seed)
+    price = float(rng.uniform(50, 5000))
+    return {
+        "symbol": symbol,
+        "longName": f"Synthetic {symbol}",
+        "longBusinessSummary": "Synthetic company used for benchmarks.",
+        "currentPrice": price,
+        "open": price * 0.99,
+        "previousClose": price * 0.98,
+        "dayHigh": price * 1.01,
+        "dayLow": price * 0.97,
+        "marketCap": int(price * rng.integers(10**7, 10**9)),
+        "fiftyTwoWeekLow": price * 0.7,
+        "fiftyTwoWeekHigh": price * 1.3,
+        "auditRisk": int(rng.integers(1, 10)),
+        "overallRisk": int(rng.integers(1, 10)),
+        "beta": float(rng.uniform(0.5, 1.5)),
+        "heldPercentInsiders": float(rng.uniform(0, 0.7)),
+        "fiftyTwoWeekRange": f"{price * 0.7:.2f} - {price * 1.3:.2f}",
+    }
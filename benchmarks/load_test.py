@@ -0,0 +1,329 @@
+"""
+Multi-session load test: simulated users against a local dashboard server.
+
+Starts `streamlit` on app.py in a child process with the stub market
+(benchmarks/stub_market.py) as market data provider, then connects N
+websocket sessions at a time. Each session loads the page and replays a
+random walk through `stock_categories`: mostly switching company within a
+category, sometimes switching category, sometimes changing the chart range.
+
+For every concurrency level it reports rerun throughput, p50/p95/p99 rerun
+latency (request sent to script finished), server CPU time and RSS growth
+per session, and the highest level whose p95 stays within --slo-ms.
+
+    python benchmarks/load_test.py                                 # 1, 2, 4, 8, 16 sessions
+    python benchmarks/load_test.py --sessions 8 16 32 --steps 20 --latency-ms 100
+    python benchmarks/load_test.py --fixtures fixtures/ --json load.json
+
+CPU and RSS are read from /proc and are only available on Linux.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+APP_FILE = ROOT / "app.py"
+CATEGORY_LABEL = "Select Stock Category"
+COMPANY_LABEL = "Select a Company"
+RANGE_LABEL = "Time Range"
+# Share of navigation steps per action; the rest switch company within the category
+SWITCH_CATEGORY = 0.2
+CHANGE_RANGE = 0.1
+
+
+# ---- Server ----
+
+def serve(port, fixtures_dir=None, latency_ms=0.0):
+    """Run the app server in this process with the stub market as provider."""
+    from streamlit.web import bootstrap
+
+    from benchmarks.stub_market import StubMarket
+    from utils.providers import set_provider
+
+    set_provider(StubMarket(fixtures_dir, latency_ms / 1000))
+    flag_options = {
+        "server_port": port,
+        "server_address": "127.0.0.1",
+        "server_headless": True,
+        "server_fileWatcherType": "none",
+        "browser_gatherUsageStats": False,
+        "logger_level": "error",
+    }
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run(str(APP_FILE), False, [], flag_options)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(fixtures_dir=None, latency_ms=0.0, shared_cache_dir=None, cache_url="", timeout=60):
+    """Launch the server in a child process; returns (process, port) once it is healthy."""
+    env = dict(os.environ, DASHBOARD_CACHE_URL=cache_url, DASHBOARD_INFO_HISTORY="0")
+    if shared_cache_dir:
+        env["DASHBOARD_SHARED_CACHE_DIR"] = str(shared_cache_dir)
+    port = _free_port()
+    command = [sys.executable, __file__, "--serve", "--port", str(port), "--latency-ms", str(latency_ms)]
+    if fixtures_dir:
+        command += ["--fixtures", str(fixtures_dir)]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, env=env)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process, port
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"server did not become healthy within {timeout}s")
+
+
+# ---- Process stats (Linux /proc) ----
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def cpu_seconds(pid):
+    """User + system CPU time of `pid`, or None where /proc is unavailable."""
+    try:
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def rss_bytes(pid):
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class PeakRss:
+    """Samples the server's RSS in a background thread and keeps the peak."""
+
+    def __init__(self, pid, interval=0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak = rss_bytes(pid)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            rss = rss_bytes(self.pid)
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+# ---- Simulated users ----
+
+class SimulatedUser:
+    """One browser session speaking Streamlit's websocket protocol."""
+
+    def __init__(self, port, categories, rng):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.categories = categories
+        self.rng = rng
+        self.widgets = {}  # label -> widget proto (id, options) from the last run
+        self.states = {}  # widget id -> value sent with every rerun
+        self.latencies = []
+        self.errors = 0
+        self._ws = None
+
+    async def __aenter__(self):
+        import websockets
+
+        self._ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._ws.close()
+
+    async def rerun(self):
+        """Send the current widget states and wait for the script run to finish."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.SetInParent()
+        for widget_id, value in self.states.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_value = value
+        start = time.perf_counter()
+        await self._ws.send(msg.SerializeToString())
+
+        widgets = {}
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self._ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                if element.WhichOneof("type") == "selectbox":
+                    widgets[element.selectbox.label] = element.selectbox
+                elif element.WhichOneof("type") == "exception":
+                    self.errors += 1
+            elif kind == "script_finished":
+                break
+        self.latencies.append(time.perf_counter() - start)
+        self.widgets = widgets
+
+    def _select(self, label, value):
+        self.states[self.widgets[label].id] = value
+
+    def navigate(self):
+        """Pick the next interaction and update the widget states for it."""
+        roll = self.rng.random()
+        if roll < SWITCH_CATEGORY:
+            category = self.rng.choice(self.categories)
+            self._select(CATEGORY_LABEL, category)
+            # The company selectbox gets new options; let it fall back to its default
+            self.states.pop(self.widgets[COMPANY_LABEL].id, None)
+        elif roll < SWITCH_CATEGORY + CHANGE_RANGE and RANGE_LABEL in self.widgets:
+            self._select(RANGE_LABEL, self.rng.choice(self.widgets[RANGE_LABEL].options))
+        else:
+            self._select(COMPANY_LABEL, self.rng.choice(self.widgets[COMPANY_LABEL].options))
+
+    async def run(self, steps, think_time):
+        await self.rerun()
+        for _ in range(steps):
+            if think_time:
+                await asyncio.sleep(self.rng.uniform(0, 2 * think_time))
+            self.navigate()
+            await self.rerun()
+
+
+async def _run_level(port, categories, sessions, steps, think_time, seed):
+    async def one(index):
+        async with SimulatedUser(port, categories, random.Random(seed * 1000 + index)) as user:
+            await user.run(steps, think_time)
+            return user
+
+    return await asyncio.gather(*(one(i) for i in range(sessions)))
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def run_level(server_pid, port, categories, sessions, steps, think_time, seed=0):
+    """Run `sessions` concurrent users; returns the level's measurements."""
+    cpu_before, rss_before = cpu_seconds(server_pid), rss_bytes(server_pid)
+    start = time.perf_counter()
+    with PeakRss(server_pid) as rss:
+        users = asyncio.run(_run_level(port, categories, sessions, steps, think_time, seed))
+    elapsed = time.perf_counter() - start
+    cpu_after = cpu_seconds(server_pid)
+
+    latencies = [latency for user in users for latency in user.latencies]
+    result = {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": sum(user.errors for user in users),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "cpu_s_per_session": None,
+        "rss_mb_per_session": None,
+    }
+    if cpu_before is not None:
+        result["cpu_s_per_session"] = (cpu_after - cpu_before) / sessions
+        result["cpu_utilisation"] = (cpu_after - cpu_before) / elapsed
+    if rss_before is not None:
+        result["rss_mb"] = rss.peak / 2**20
+        result["rss_mb_per_session"] = max(0, rss.peak - rss_before) / sessions / 2**20
+    return result
+
+
+def run(levels, steps=10, think_ms=0.0, fixtures_dir=None, latency_ms=0.0, seed=0, cache_url=""):
+    from config.stock_categories import stock_categories
+
+    categories = list(stock_categories)
+    # Stub data goes to a private shared cache tier and no cache backend unless --cache-url
+    with tempfile.TemporaryDirectory(prefix="dashboard-load-") as shared_dir:
+        process, port = start_server(fixtures_dir, latency_ms, shared_dir, cache_url)
+        try:
+            return [run_level(process.pid, port, categories, sessions, steps, think_ms / 1000, seed)
+                    for sessions in levels]
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="concurrency levels to run, in order")
+    parser.add_argument("--steps", type=int, default=10, help="navigation steps per session after the first load")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean pause between steps")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="artificial latency per data call")
+    parser.add_argument("--fixtures", type=Path, help="recorded fixtures directory (default: synthetic data)")
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="p95 rerun latency target")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-url", default="", help="DASHBOARD_CACHE_URL for the server (default: none)")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.fixtures, args.latency_ms)
+        return
+
+    levels = run(args.sessions, args.steps, args.think_ms, args.fixtures, args.latency_ms, args.seed, args.cache_url)
+
+    print(f"{'sessions':>8}{'reruns':>8}{'rerun/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'CPU s/sess':>12}{'RSS MB/sess':>13}")
+    for level in levels:
+        cpu = level["cpu_s_per_session"]
+        rss = level["rss_mb_per_session"]
+        print(f"{level['sessions']:>8}{level['reruns']:>8}{level['throughput_rps']:>9.1f}"
+              f"{level['p50_ms']:>9.0f}{level['p95_ms']:>9.0f}{level['p99_ms']:>9.0f}"
+              f"{cpu if cpu is not None else float('nan'):>12.2f}{rss if rss is not None else float('nan'):>13.1f}")
+    within = [level["sessions"] for level in levels if level["p95_ms"] <= args.slo_ms]
+    print(f"max sessions with p95 <= {args.slo_ms:g} ms: {max(within) if within else 'none'}")
+    if any(level["errors"] for level in levels):
+        print(f"script errors: {sum(level['errors'] for level in levels)}")
+
+    if args.json:
+        args.json.write_text(json.dumps({"slo_ms": args.slo_ms, "latency_ms": args.latency_ms,
+                                         "steps": args.steps, "levels": levels}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
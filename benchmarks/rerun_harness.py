@@ -0,0 +1,190 @@
+"""
+Headless end-to-end rerun latency harness.
+
+Drives app.py through Streamlit's AppTest with the stub market
+(benchmarks/stub_market.py) as market data provider and, for each scripted
+interaction, reports rerun wall time, market-data calls and the number of
+delta messages (elements and blocks) the rerun produced.
+
+    python benchmarks/rerun_harness.py
+    python benchmarks/rerun_harness.py --latency-ms 150 --repeat 3 --json reruns.json
+    python benchmarks/rerun_harness.py --fixtures fixtures/     # recorded responses
+
+Tab switches are handled in the browser and do not rerun the script; the
+"switch tab" step reruns with no widget change, which is what any other
+no-op interaction costs.
+
+Afterwards a job is started through utils.jobs.session_job from a script run by
+AppTest; its worker must start without running that script and make no data calls.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Stub data goes to a private shared cache tier and no cache backend unless --cache-url,
+# and never into the info history
+SHARED_CACHE_DIR = tempfile.mkdtemp(prefix="dashboard-harness-")
+os.environ["DASHBOARD_SHARED_CACHE_DIR"] = SHARED_CACHE_DIR
+os.environ["DASHBOARD_CACHE_URL"] = ""
+os.environ["DASHBOARD_INFO_HISTORY"] = "0"
+
+import streamlit as st
+from streamlit import logger as streamlit_logger
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.stub_market import StubMarket
+from config import settings
+from utils import cache, providers, refresh
+
+APP_FILE = ROOT / "app.py"
+CATEGORY = "Nifty 50"
+
+
+def _checkbox(app, label):
+    return next(widget for widget in app.checkbox if widget.label == label)
+
+
+def _selectbox(app, label):
+    return next(widget for widget in app.selectbox if widget.label == label)
+
+
+def _second_company(app):
+    companies = app.selectbox(key="company_select").options
+    return companies[1] if len(companies) > 1 else companies[0]
+
+
+# (step name, action applied to the AppTest before rerunning)
+STEPS = [
+    ("initial load", lambda app: None),
+    ("switch company", lambda app: app.selectbox(key="company_select").set_value(_second_company(app))),
+    ("toggle 50-day SMA", lambda app: _checkbox(app, "Show 50-day SMA").uncheck()),
+    ("change time range", lambda app: _selectbox(app, "Time Range").set_value("5 Years")),
+    ("switch tab", lambda app: None),
+]
+
+
+def count_deltas(node):
+    """Elements and blocks in the rendered tree (one delta message each)."""
+    children = getattr(node, "children", None)
+    return 1 + (sum(count_deltas(child) for child in children.values()) if children else 0)
+
+
+def run_session(market):
+    """One scripted session; returns per-step measurements."""
+    app = AppTest.from_file(str(APP_FILE), default_timeout=300)
+    app.session_state["category_select"] = CATEGORY
+    results = []
+    for name, action in STEPS:
+        if results:
+            action(app)
+        calls_before = market.total_calls()
+        start = time.perf_counter()
+        app.run()
+        elapsed = time.perf_counter() - start
+        if app.exception:
+            raise RuntimeError(f"{name}: {app.exception[0].message}")
+        results.append({
+            "step": name,
+            "wall_ms": elapsed * 1000,
+            "data_calls": market.total_calls() - calls_before,
+            "deltas": count_deltas(app._tree) - 1,
+        })
+    return results
+
+
+def _job_script():
+    import streamlit as st
+    from benchmarks.stub_market import worker_report
+    from utils.jobs import session_job
+
+    st.session_state.worker_report = session_job("worker_report", "Worker report", worker_report).result(timeout=120)
+
+
+def check_jobs():
+    """Run a job through session_job under AppTest; raises if its worker re-ran the script or fetched data."""
+    app = AppTest.from_function(_job_script, default_timeout=300)
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"job check: {app.exception[0].message}")
+    report = app.session_state["worker_report"]
+    if report["main_script"] is not None or report["data_calls"]:
+        raise RuntimeError(f"job check: a worker ran {report['main_script']} "
+                           f"and made {report['data_calls']} data calls at start")
+    return report
+
+
+def run(fixtures_dir=None, latency_ms=0.0, repeat=1, warm=False):
+    market = StubMarket(fixtures_dir, latency_ms / 1000)
+    sessions = []
+    previous = providers.set_provider(market)
+    try:
+        for i in range(repeat):
+            # Each session starts cold unless --warm: process-wide caches are shared across sessions
+            if not warm or i == 0:
+                st.cache_data.clear()
+                st.cache_resource.clear()
+                refresh.clear()
+                shutil.rmtree(SHARED_CACHE_DIR, ignore_errors=True)
+                # A fresh backend object: memory:// starts empty, external stores keep their entries
+                cache.get_backend.cache_clear()
+            sessions.append(run_session(market))
+        job_check = check_jobs()
+    finally:
+        providers.set_provider(previous)
+
+    summary = []
+    for index, (name, _) in enumerate(STEPS):
+        steps = [session[index] for session in sessions]
+        summary.append({
+            "step": name,
+            "wall_ms_median": statistics.median(s["wall_ms"] for s in steps),
+            "wall_ms_max": max(s["wall_ms"] for s in steps),
+            "data_calls": statistics.median(s["data_calls"] for s in steps),
+            "deltas": statistics.median(s["deltas"] for s in steps),
+        })
+    return {"latency_ms": latency_ms, "repeat": repeat, "warm": warm, "calls_by_kind": dict(market.calls),
+            "job_check": job_check, "steps": summary, "sessions": sessions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, help="recorded fixtures directory (default: synthetic data)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="artificial latency per data call")
+    parser.add_argument("--repeat", type=int, default=1, help="number of scripted sessions")
+    parser.add_argument("--warm", action="store_true", help="keep caches between sessions")
+    parser.add_argument("--cache-url", default="", help="DASHBOARD_CACHE_URL for the run (default: none)")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    args = parser.parse_args()
+
+    # Settings are read once at import, so set the attribute rather than the environment
+    settings.CACHE_URL = args.cache_url
+
+    streamlit_logger.set_log_level(logging.ERROR)
+    try:
+        report = run(args.fixtures, args.latency_ms, args.repeat, args.warm)
+    finally:
+        shutil.rmtree(SHARED_CACHE_DIR, ignore_errors=True)
+
+    print(f"{'step':<22}{'median ms':>12}{'max ms':>10}{'data calls':>12}{'deltas':>8}")
+    for step in report["steps"]:
+        print(f"{step['step']:<22}{step['wall_ms_median']:>12.1f}{step['wall_ms_max']:>10.1f}"
+              f"{step['data_calls']:>12g}{step['deltas']:>8g}")
+    print(f"calls by kind: {report['calls_by_kind']}")
+    print(f"job worker: no app script, {report['job_check']['data_calls']} data calls")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Local stand-in for a Redis server, speaking enough RESP2 for utils.cache.RedisBackend.
+
+Supports PING, ECHO, AUTH, SELECT, GET, SET (EX/PX/NX/XX), DEL, EXISTS, TTL, PTTL,
+DBSIZE, FLUSHDB/FLUSHALL, WATCH/UNWATCH/MULTI/EXEC/DISCARD and QUIT, with one
+shared keyspace and optional maxmemory-style LRU eviction by value bytes.
+
+    python benchmarks/resp_server.py --port 6380
+    DASHBOARD_CACHE_URL=redis://127.0.0.1:6380/0 streamlit run app.py
+
+In-process, e.g. to exercise the backend:
+
+    with RespServer() as server:
+        backend = RedisBackend(*server.address)
+"""
+import argparse
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+
+
+class Keyspace:
+    """Values with expiry and a per-key version for WATCH."""
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.entries = OrderedDict()  # key -> (value, expires_at or None)
+        self.versions = {}
+        self.lock = threading.RLock()
+
+    def _live(self, key):
+        entry = self.entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            self.delete(key)
+            return None
+        return entry
+
+    def get(self, key):
+        entry = self._live(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key, value, expires_at):
+        self.delete(key)
+        self.entries[key] = (value, expires_at)
+        self.nbytes += len(value)
+        self.versions[key] = self.versions.get(key, 0) + 1
+        while self.max_bytes and self.nbytes > self.max_bytes and len(self.entries) > 1:
+            self.delete(next(iter(self.entries)))
+
+    def delete(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        self.nbytes -= len(entry[0])
+        self.versions[key] = self.versions.get(key, 0) + 1
+        return True
+
+    def pttl(self, key):
+        entry = self._live(key)
+        if entry is None:
+            return -2
+        return -1 if entry[1] is None else max(0, int((entry[1] - time.monotonic()) * 1000))
+
+    def flush(self):
+        for key in list(self.entries):
+            self.delete(key)
+
+
+class _Error(Exception):
+    pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def setup(self):
+        super().setup()
+        self.keyspace = self.server.keyspace
+        self.watched = {}
+        self.queue = None
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()  # inline command (e.g. typed into telnet)
+        args = []
+        for _ in range(int(line[1:])):
+            size = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def _encode(self, reply):
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, _Error):
+            return b"-ERR %s\r\n" % str(reply).encode()
+        if isinstance(reply, bool):
+            return b":%d\r\n" % reply
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, str):
+            return b"+%s\r\n" % reply.encode()
+        if isinstance(reply, bytes):
+            return b"$%d\r\n%s\r\n" % (len(reply), reply)
+        if isinstance(reply, list):
+            return b"*%d\r\n" % len(reply) + b"".join(self._encode(item) for item in reply)
+        raise TypeError(reply)
+
+    def handle(self):
+        while True:
+            args = self._read_command()
+            if not args:
+                return
+            name = args[0].decode().upper()
+            if name == "QUIT":
+                self.wfile.write(b"+OK\r\n")
+                return
+            try:
+                reply = self._dispatch(name, args[1:])
+            except _Error as e:
+                reply = e
+            except (ValueError, IndexError):
+                reply = _Error(f"syntax error in '{name}'")
+            self.wfile.write(self._encode(reply))
+
+    def _dispatch(self, name, args):
+        if self.queue is not None and name not in ("EXEC", "DISCARD", "MULTI", "WATCH"):
+            self.queue.append((name, args))
+            return "QUEUED"
+        if name == "MULTI":
+            if self.queue is not None:
+                raise _Error("MULTI calls can not be nested")
+            self.queue = []
+            return "OK"
+        if name == "DISCARD":
+            self.queue, self.watched = None, {}
+            return "OK"
+        if name == "EXEC":
+            if self.queue is None:
+                raise _Error("EXEC without MULTI")
+            queue, self.queue = self.queue, None
+            with self.keyspace.lock:
+                changed = any(self.keyspace.versions.get(key, 0) != version for key, version in self.watched.items())
+                self.watched = {}
+                if changed:
+                    return None
+                return [self._run(command, command_args) for command, command_args in queue]
+        if name == "WATCH":
+            with self.keyspace.lock:
+                for key in args:
+                    self.keyspace._live(key)
+                    self.watched[key] = self.keyspace.versions.get(key, 0)
+            return "OK"
+        if name == "UNWATCH":
+            self.watched = {}
+            return "OK"
+        with self.keyspace.lock:
+            return self._run(name, args)
+
+    def _run(self, name, args):
+        keyspace = self.keyspace
+        if name == "PING":
+            return args[0] if args else "PONG"
+        if name == "ECHO":
+            return args[0]
+        if name in ("AUTH", "SELECT"):
+            return "OK"
+        if name == "GET":
+            return keyspace.get(args[0])
+        if name == "SET":
+            key, value, expires_at = args[0], args[1], None
+            options = [arg.decode().upper() for arg in args[2:]]
+            i = 0
+            while i < len(options):
+                if options[i] in ("EX", "PX"):
+                    seconds = float(options[i + 1]) / (1000 if options[i] == "PX" else 1)
+                    expires_at = time.monotonic() + seconds
+                    i += 2
+                    continue
+                if options[i] == "NX" and keyspace._live(key) is not None:
+                    return None
+                if options[i] == "XX" and keyspace._live(key) is None:
+                    return None
+                i += 1
+            keyspace.set(key, value, expires_at)
+            return "OK"
+        if name == "DEL":
+            return sum(keyspace.delete(key) for key in args)
+        if name == "EXISTS":
+            return sum(keyspace._live(key) is not None for key in args)
+        if name == "PTTL":
+            return keyspace.pttl(args[0])
+        if name == "TTL":
+            millis = keyspace.pttl(args[0])
+            return millis if millis < 0 else -(-millis // 1000)
+        if name == "DBSIZE":
+            return len(keyspace.entries)
+        if name in ("FLUSHDB", "FLUSHALL"):
+            keyspace.flush()
+            return "OK"
+        raise _Error(f"unknown command '{name}'")
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=0, max_bytes=None):
+        super().__init__((host, port), _Handler)
+        self.keyspace = Keyspace(max_bytes)
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.server_address[:2]
+
+    @property
+    def url(self):
+        return f"redis://{self.address[0]}:{self.address[1]}/0"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--max-bytes", type=int, help="evict least recently used values above this size")
+    args = parser.parse_args()
+    server = RespServer(args.host, args.port, args.max_bytes)
+    print(f"listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
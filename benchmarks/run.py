@@ -0,0 +1,191 @@
+"""
+Offline micro-benchmarks for the dashboard's compute paths on synthetic data.
+
+Covers indicator maths (RSI/MACD from the Technical Indicators tab, moving
+averages from Charts), statement parsing, `fundamentals.format_df`, key-metric
+evaluation (`metrics.calculate_key_metrics`, which replaced
+`calculate_metric_from_statements`, and the batched plan behind Category
+Metrics) and `metrics.format_value`, at sizes from 1 to 30 years of bars and
+1 to 250 tickers.
+
+    python benchmarks/run.py                       # writes benchmarks/results/<commit>.json
+    python benchmarks/run.py -k rsi --quick
+    python benchmarks/run.py --compare benchmarks/results/<base>.json --fail-over 1.25
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import fixtures
+from config.metric_name import key_metrics_list
+from utils import charts, fundamentals, indicators, metrics
+from utils.formulas import evaluate_latest
+from utils.statements import Statement, StatementStore
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+YEARS = [1, 5, 10, 30]
+TICKERS = [1, 10, 50, 250]
+QUICK_YEARS = [1, 5]
+QUICK_TICKERS = [1, 10]
+
+
+def _stores(n_tickers):
+    stores = []
+    for seed in range(n_tickers):
+        frames = fixtures.make_statement_frames(seed=seed)
+        stores.append(StatementStore(f"SYN{seed}.NS", {
+            "balance_sheet": Statement.from_frame(frames["balance_sheet"]),
+            "income": Statement.from_frame(frames["financials"]),
+            "cashflow": Statement.from_frame(frames["cashflow"]),
+        }))
+    return stores
+
+
+def _case_rsi(years):
+    close = fixtures.make_ohlcv(years)["Close"]
+    return lambda: indicators.compute_rsi(close)
+
+
+def _case_macd(years):
+    close = fixtures.make_ohlcv(years)["Close"]
+    return lambda: indicators.compute_macd(close)
+
+
+def _case_moving_averages(years):
+    close = fixtures.make_ohlcv(years)["Close"]
+    return lambda: charts.compute_moving_averages(close)
+
+
+def _case_statement_parse(n_tickers):
+    frames = [fixtures.make_statement_frames(seed=seed)["financials"] for seed in range(n_tickers)]
+    return lambda: [Statement.from_frame(frame) for frame in frames]
+
+
+def _case_format_df(n_tickers):
+    frame = pd.concat([fixtures.make_statement_frames(seed=seed)["financials"] for seed in range(n_tickers)])
+    return lambda: fundamentals.format_df(frame)
+
+
+def _case_key_metrics(n_tickers):
+    infos = [fixtures.make_info(seed) for seed in range(n_tickers)]
+    stores = _stores(n_tickers)
+    return lambda: [metrics.calculate_key_metrics(info, {}, store) for info, store in zip(infos, stores)]
+
+
+def _case_key_metrics_batch(n_tickers):
+    infos = [fixtures.make_info(seed) for seed in range(n_tickers)]
+    stores = _stores(n_tickers)
+    return lambda: evaluate_latest(metrics.KEY_METRICS_PLAN, infos, stores)
+
+
+def _case_format_value(n_tickers):
+    rows = [metrics.calculate_key_metrics(fixtures.make_info(seed), {}, store)
+            for seed, store in enumerate(_stores(n_tickers))]
+    return lambda: [metrics.format_value(metric, row[metric], row) for row in rows for metric in key_metrics_list]
+
+
+# name -> (setup(size) returning a zero-argument callable, size unit, full sizes, quick sizes)
+CASES = {
+    "indicators.rsi": (_case_rsi, "years", YEARS, QUICK_YEARS),
+    "indicators.macd": (_case_macd, "years", YEARS, QUICK_YEARS),
+    "charts.moving_averages": (_case_moving_averages, "years", YEARS, QUICK_YEARS),
+    "statements.from_frame": (_case_statement_parse, "tickers", TICKERS, QUICK_TICKERS),
+    "fundamentals.format_df": (_case_format_df, "tickers", TICKERS, QUICK_TICKERS),
+    "metrics.calculate_key_metrics": (_case_key_metrics, "tickers", TICKERS, QUICK_TICKERS),
+    "formulas.evaluate_latest": (_case_key_metrics_batch, "tickers", TICKERS, QUICK_TICKERS),
+    "metrics.format_value": (_case_format_value, "tickers", TICKERS, QUICK_TICKERS),
+}
+
+
+def measure(func, repeat=5):
+    """Per-call seconds (min and median over `repeat` runs), timeit-style."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    runs = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return {"min_s": min(runs), "median_s": statistics.median(runs), "loops": loops, "repeat": repeat}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(selected=None, quick=False, repeat=5):
+    results = []
+    for name, (setup, unit, sizes, quick_sizes) in CASES.items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        for size in (quick_sizes if quick else sizes):
+            result = {"name": name, "size": size, "unit": unit, **measure(setup(size), repeat)}
+            results.append(result)
+            print(f"{name:<32}{size:>5} {unit:<8}{result['min_s'] * 1e3:>12.3f} ms")
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline):
+    """Print current/baseline ratios of min times; returns the worst ratio."""
+    base = {(r["name"], r["size"]): r["min_s"] for r in baseline["results"]}
+    worst = 0.0
+    print(f"\nvs {baseline['meta']['commit']}:")
+    for result in report["results"]:
+        key = (result["name"], result["size"])
+        if key not in base:
+            continue
+        ratio = result["min_s"] / base[key]
+        worst = max(worst, ratio)
+        print(f"{result['name']:<32}{result['size']:>5} {result['unit']:<8}{ratio:>10.2f}x")
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="selected", action="append", help="only run cases whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="small sizes only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="JSON output (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare against")
+    parser.add_argument("--fail-over", type=float, help="exit 1 if any case is slower than baseline by this factor")
+    args = parser.parse_args()
+
+    # Read the baseline first: it may be the file this run overwrites
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    report = run(args.selected, args.quick, args.repeat)
+    output = args.output or RESULTS_DIR / f"{report['meta']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nWrote {output}")
+
+    if baseline:
+        worst = compare(report, baseline)
+        if args.fail_over and worst > args.fail_over:
+            print(f"Regression: slowest case is {worst:.2f}x the baseline (limit {args.fail_over}x)")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
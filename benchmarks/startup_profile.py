@@ -0,0 +1,144 @@
+"""
+Cold-start profiler for the dashboard.
+
+Runs app.py headless (Streamlit's AppTest) in a fresh interpreter started with
+`-X importtime`, then reports import time per top-level package and the
+time from process start to the end of the first render.
+
+By default market data is stubbed out (empty responses) so the numbers measure
+our own start-up cost rather than Yahoo's latency; yfinance is still imported
+when the app asks for a ticker. Use --network to render against live data.
+
+    python benchmarks/startup_profile.py
+    python benchmarks/startup_profile.py --budget-ms 2500 --json startup.json
+"""
+import time
+
+PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_FILE = ROOT / "app.py"
+
+
+def _offline_provider():
+    """Provider returning empty data without network calls."""
+    import pandas as pd
+    from utils.providers import MarketDataProvider
+
+    class OfflineProvider(MarketDataProvider):
+        name = "offline"
+
+        def ticker(self, symbol):
+            import yfinance  # noqa: F401  (keep yfinance's import cost in the profile)
+            return super().ticker(symbol)
+
+        def history(self, symbol, period="max", interval="1d"):
+            return pd.DataFrame()
+
+        def info(self, symbol):
+            return {}
+
+        def statement(self, symbol, attribute):
+            return pd.DataFrame()
+
+    return OfflineProvider()
+
+
+def run_child(network):
+    """Render the app once and print timings as JSON on stdout."""
+    sys.path.insert(0, str(ROOT))
+    os.chdir(ROOT)
+
+    from streamlit.testing.v1 import AppTest
+    if not network:
+        from utils.providers import set_provider
+        set_provider(_offline_provider())
+
+    app = AppTest.from_file(str(APP_FILE), default_timeout=120)
+    render_start = time.perf_counter()
+    app.run()
+    end = time.perf_counter()
+
+    print(json.dumps({
+        "harness_ms": (render_start - PROCESS_START) * 1000,
+        "first_render_ms": (end - render_start) * 1000,
+        "total_ms": (end - PROCESS_START) * 1000,
+        "exceptions": [e.message for e in app.exception],
+    }))
+
+
+def parse_importtime(stderr):
+    """Sum `-X importtime` self times (microseconds) per top-level package."""
+    per_package = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|", 2)
+        per_package[name.strip().split(".")[0]] += int(self_us)
+    return dict(sorted(per_package.items(), key=lambda item: item[1], reverse=True))
+
+
+def profile(network=False):
+    command = [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), "--child"]
+    if network:
+        command.append("--network")
+    # A fresh shared cache tier and no cache backend keep the run cold and stub data out of real caches
+    with tempfile.TemporaryDirectory(prefix="dashboard-startup-") as shared_dir:
+        env = {**os.environ, "DASHBOARD_SHARED_CACHE_DIR": shared_dir, "DASHBOARD_CACHE_URL": "",
+               "DASHBOARD_INFO_HISTORY": "0"}
+        result = subprocess.run(command, capture_output=True, text=True, cwd=ROOT, env=env)
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(f"Profiling run failed:\n{result.stderr[-4000:]}")
+
+    report = json.loads(lines[-1])
+    imports_us = parse_importtime(result.stderr)
+    report["import_ms"] = sum(imports_us.values()) / 1000
+    report["imports_by_package_ms"] = {name: us / 1000 for name, us in imports_us.items()}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--network", action="store_true", help="use live market data instead of empty stubs")
+    parser.add_argument("--top", type=int, default=15, help="packages to list in the import breakdown")
+    parser.add_argument("--budget-ms", type=float, help="fail (exit 1) if start-to-first-render exceeds this")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.network)
+        return
+
+    report = profile(args.network)
+    print(f"{'package':<28}{'import ms':>12}")
+    for name, ms in list(report["imports_by_package_ms"].items())[:args.top]:
+        print(f"{name:<28}{ms:>12.1f}")
+    print(f"{'all imports':<28}{report['import_ms']:>12.1f}")
+    print()
+    print(f"harness start-up    {report['harness_ms']:>10.1f} ms")
+    print(f"first render        {report['first_render_ms']:>10.1f} ms")
+    print(f"start to rendered   {report['total_ms']:>10.1f} ms")
+    for message in report["exceptions"]:
+        print(f"app exception: {message}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        print(f"\nStart-up budget exceeded: {report['total_ms']:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Offline market data provider that serves recorded (or synthetic) responses
+with configurable artificial latency and counts every data call.
+
+Recorded fixtures use utils.providers.LocalProvider's layout, one directory per symbol:
+    <fixtures>/<SYMBOL>/info.json                  stock.info
+    <fixtures>/<SYMBOL>/history.parquet|csv        daily bars for period="max"
+    <fixtures>/<SYMBOL>/<attribute>.parquet|csv    statements (balance_sheet, quarterly_cashflow, ...)
+Symbols without a recording get deterministic synthetic data (benchmarks.fixtures).
+
+    python benchmarks/stub_market.py --record fixtures/ TCS.NS INFY.NS   # capture live responses
+
+Install with `utils.providers.set_provider(StubMarket(...))`.
+"""
+import argparse
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks import fixtures
+from utils.providers import STATEMENT_ATTRIBUTES, LocalProvider, MarketDataProvider, window
+
+SYNTHETIC_YEARS = 30
+
+
+class StubMarket(MarketDataProvider):
+    """Provider over fixtures, with shared call counters."""
+
+    name = "stub"
+
+    def __init__(self, fixtures_dir=None, latency=0.0):
+        self.recorded = LocalProvider(fixtures_dir) if fixtures_dir else None
+        self.latency = latency
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def __getstate__(self):
+        # Job workers (utils.jobs) get their own counters and parsed responses
+        return {"recorded": self.recorded, "latency": self.latency}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.__dict__.update(state)
+
+    def record_call(self, kind):
+        with self._lock:
+            self.calls[kind] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def total_calls(self):
+        with self._lock:
+            return sum(self.calls.values())
+
+    def load(self, symbol, name):
+        """Recorded or synthetic response, parsed once per symbol."""
+        key = (symbol, name)
+        if key not in self._cache:
+            self._cache[key] = self._read(symbol, name)
+        return self._cache[key]
+
+    def _read(self, symbol, name):
+        if self.recorded is not None:
+            try:
+                if name == "info":
+                    return self.recorded.info(symbol)
+                if name == "history":
+                    return self.recorded.history(symbol)
+                return self.recorded.statement(symbol, name)
+            except LookupError:
+                pass
+        seed = zlib.crc32(symbol.encode()) % 10_000
+        if name == "info":
+            return fixtures.make_info(seed, symbol)
+        if name == "history":
+            return fixtures.make_ohlcv(SYNTHETIC_YEARS, seed)
+        quarterly = name.startswith("quarterly_")
+        frames = fixtures.make_statement_frames(8 if quarterly else 4, quarterly, seed)
+        attribute = name.replace("income_stmt", "financials")
+        return frames[attribute]
+
+
+    def info(self, symbol):
+        self.record_call("info")
+        return dict(self.load(symbol, "info"))
+
+    def fast_info(self, symbol):
+        self.record_call("fast_info")
+        info = self.load(symbol, "info")
+        return {"lastPrice": info.get("currentPrice"), "previousClose": info.get("previousClose"),
+                "marketCap": info.get("marketCap")}
+
+    def history(self, symbol, period="max", interval="1d"):
+        self.record_call("history")
+        return window(self.load(symbol, "history"), period)
+
+    def statement(self, symbol, attribute):
+        self.record_call("statements")
+        return self.load(symbol, attribute).copy()
+
+
+def worker_report(progress=None):
+    """
+    Job for checking utils.jobs workers: the script the worker ran as its main
+    module at start (None when it ran none) and the data calls it has made.
+    """
+    from utils.providers import get_provider
+
+    provider = get_provider()
+    return {"main_script": getattr(sys.modules.get("__mp_main__"), "__file__", None),
+            "data_calls": provider.total_calls() if isinstance(provider, StubMarket) else None}
+
+
+def record(fixtures_dir, symbols):
+    """Capture live Yahoo Finance responses for `symbols` into `fixtures_dir`."""
+    from utils.providers import RecordingProvider, YFinanceProvider
+
+    recorder = RecordingProvider(YFinanceProvider(), fixtures_dir)
+    for symbol in symbols:
+        recorder.info(symbol)
+        recorder.fast_info(symbol)
+        recorder.history(symbol)
+        for attribute in STATEMENT_ATTRIBUTES:
+            recorder.statement(symbol, attribute)
+        print(f"recorded {symbol} -> {Path(fixtures_dir) / symbol}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", type=Path, required=True, metavar="DIR", help="fixtures directory to write")
+    parser.add_argument("symbols", nargs="+")
+    args = parser.parse_args()
+    record(args.record, args.symbols)
+
+
+if __name__ == "__main__":
+    main()
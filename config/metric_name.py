@@ -9,29 +9,68 @@ key_metrics_list = [
     "Price to Sales", "EPS Forward"
 ]
 
-# Mapping metrics to possible keys in info / fi / balance sheets
-key_metric_mapping = {
-    "Current Price": ["currentPrice", "lastPrice"],
-    "Open": ["open", "regularMarketOpen"],
-    "Previous Close": ["previousClose", "regularMarketPreviousClose"],
-    "Day High": ["dayHigh", "regularMarketDayHigh"],
-    "Day Low": ["dayLow", "regularMarketDayLow"],
-    "Market Cap": ["marketCap"],
-    "52-Week Low": ["fiftyTwoWeekLow"],
-    "52-Week High": ["fiftyTwoWeekHigh"],
-    "EBITDA": ["ebitda"],
-    "Debt to Equity": ["debtToEquity", "totalDebt", "bookValue"],
-    "Current Ratio": ["currentRatio", "totalCurrentAssets", "totalCurrentLiabilities"],
-    "Return on Equity": ["returnOnEquity", "netIncomeToCommon", "bookValue"],
-    "Return on Assets": ["returnOnAssets", "netIncomeToCommon", "totalAssets"],
-    "Free Cashflow": ["freeCashflow", "operatingCashflow", "capitalExpenditures"],
-    "Net Profit Margin": ["netProfitMargin", "netIncomeToCommon", "totalRevenue"],
-    "Operating Margin": ["operatingMargins", "operatingIncome", "totalRevenue"],
-    "Gross Margin": ["grossMargins", "grossProfits", "totalRevenue"],
-    "Price to Sales": ["priceToSales", "marketCap", "totalRevenue"],
-    "EPS Forward": ["epsForward", "netIncomeToCommon", "sharesOutstanding"]
+# Ratios charted over every reported period (computed from statements only)
+ratio_history_metrics = [
+    "Net Profit Margin", "Operating Margin", "Gross Margin", "EBITDA Margin",
+    "Return on Assets", "Return on Equity", "Debt to Equity", "Current Ratio"
+]
+
+# Formulas are Python expressions over:
+#   info.<key> / fi.<key>                                -> stock.info / stock.fast_info values
+#   income["..."], balance_sheet["..."], cashflow["..."] -> statement line items
+#   first(a, b, ...)                                     -> first available value (fallback chain)
+#   total(a, b, ...)                                     -> sum, treating missing parts as 0
+# plus the shared terms below. They are compiled once by utils.formulas.
+metric_terms = {
+    "revenue": 'first(info.totalRevenue, income["Total Revenue"])',
+    "net_income": 'first(info.netIncomeToCommon, income["Net Income"])',
+    "operating_income": 'first(info.operatingIncome, income["Operating Income"])',
+    "gross_profit": 'first(info.grossProfits, income["Gross Profit"])',
+    "market_cap": "first(info.marketCap, fi.marketCap)",
+    # Banks report no EBITDA line, so rebuild it from operating revenue and expenses
+    "ebitda": """first(info.ebitda, income["EBITDA"], total(
+        income["Operating Revenue"], -income["Selling General And Administration"],
+        -income["Other Non Interest Expense"], -income["Occupancy And Equipment"],
+        income["Depreciation And Amortization In Income Statement"]))""",
+    "current_assets": """first(balance_sheet["Current Assets"], total(
+        balance_sheet["Cash And Cash Equivalents"], balance_sheet["Accounts Receivable"],
+        balance_sheet["Other Short Term Investments"], balance_sheet["Prepaid Assets"]))""",
+    "current_liabilities": """first(balance_sheet["Current Liabilities"], total(
+        balance_sheet["Current Debt And Capital Lease Obligation"], balance_sheet["Accounts Payable"],
+        balance_sheet["Current Accrued Expenses"], balance_sheet["Other Payable"]))""",
+    "shares_outstanding": 'first(info.sharesOutstanding, balance_sheet["Ordinary Shares Number"], balance_sheet["Share Issued"])',
+    # Capital expenditure is reported as a negative cash flow
+    "free_cashflow": 'first(info.freeCashflow, cashflow["Free Cash Flow"], cashflow["Operating Cash Flow"] + cashflow["Capital Expenditure"])',
 }
 
+# Metric name -> formula
+metric_formulas = {
+    "Current Price": "first(info.currentPrice, info.lastPrice, fi.lastPrice)",
+    "Open": "first(info.open, info.regularMarketOpen, fi.open)",
+    "Previous Close": "first(info.previousClose, info.regularMarketPreviousClose, fi.previousClose, fi.regularMarketPreviousClose)",
+    "Day High": "first(info.dayHigh, info.regularMarketDayHigh, fi.dayHigh)",
+    "Day Low": "first(info.dayLow, info.regularMarketDayLow, fi.dayLow)",
+    "Market Cap": "market_cap",
+    "52-Week Low": "first(info.fiftyTwoWeekLow, fi.yearLow)",
+    "52-Week High": "first(info.fiftyTwoWeekHigh, fi.yearHigh)",
+    "EBITDA": "ebitda",
+    # Yahoo reports debtToEquity in percent (45 for a 0.45 ratio); the statement ratio is scaled to match
+    "Debt to Equity": 'first(info.debtToEquity, balance_sheet["Total Debt"] / balance_sheet["Stockholders Equity"] * 100)',
+    "Current Ratio": "first(info.currentRatio, current_assets / current_liabilities)",
+    "Return on Equity": 'first(info.returnOnEquity, net_income / balance_sheet["Stockholders Equity"])',
+    "Return on Assets": 'first(info.returnOnAssets, net_income / balance_sheet["Total Assets"])',
+    "Free Cashflow": "free_cashflow",
+    "Net Profit Margin": "first(info.netProfitMargin, info.profitMargins, net_income / revenue)",
+    "Operating Margin": "first(info.operatingMargins, operating_income / revenue)",
+    "EBITDA Margin": "first(info.ebitdaMargins, ebitda / revenue)",
+    "Gross Margin": "first(info.grossMargins, gross_profit / revenue)",
+    "Price to Sales": "first(info.priceToSales, info.priceToSalesTrailing12Months, market_cap / revenue)",
+    "EPS Forward": "first(info.epsForward, net_income / shares_outstanding)",
+}
+
+# Metrics whose values are already in percent (45 means 45%), labelled as such
+percent_metrics = {"Debt to Equity"}
+
 # ---------------- Other Metrics ----------------
 other_metrics_mapping = {
     "auditRisk": "Audit Risk",
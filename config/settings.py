@@ -0,0 +1,64 @@
+"""
+Runtime settings, read once from environment variables.
+
+    DASHBOARD_PROVIDER               market data source (default yfinance; see utils/providers.py)
+                                       local:PATH, record:DIR, replay:DIR
+    DASHBOARD_CACHE_URL              cache backend shared by server processes (unset: none)
+                                       memory://                      in-process LRU
+                                       sqlite:///.cache/cache.sqlite  local file, shared by processes on one host
+                                       redis://host:6379/0            Redis or any RESP-compatible server
+    DASHBOARD_CACHE_MAX_BYTES        byte budget of the memory and SQLite backends (default 256 MiB)
+    DASHBOARD_CACHE_MAX_VALUE_BYTES  larger values are not cached (default 32 MiB)
+    DASHBOARD_MEMORY_BUDGET          bytes of data all in-process caches hold together (default 512 MiB)
+    DASHBOARD_SHARED_CACHE           memory-mapped Arrow tier on/off (default on)
+    DASHBOARD_SHARED_CACHE_DIR       its directory (default .cache/shared)
+    DASHBOARD_OHLCV_FLOAT32          store prices as float32 (default off)
+    DASHBOARD_JOB_WORKERS            processes running background jobs (default: CPU count, at most 4)
+    DASHBOARD_STORE                  SQL store for cross-ticker queries (default .cache/market.sqlite)
+    DASHBOARD_INFO_HISTORY           daily info snapshots in that store on/off (default on)
+    DASHBOARD_TRACE                  per-rerun tracing on/off (default off)
+    DASHBOARD_TRACE_FILE             trace output (default .cache/traces.jsonl)
+"""
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = BASE_DIR / ".cache"
+
+
+def _flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _int(name, default):
+    value = os.environ.get(name)
+    return int(float(value)) if value and value.strip() else default
+
+
+def _path(name, default):
+    value = os.environ.get(name)
+    return Path(value) if value and value.strip() else default
+
+
+PROVIDER = os.environ.get("DASHBOARD_PROVIDER", "").strip() or "yfinance"
+
+CACHE_URL = os.environ.get("DASHBOARD_CACHE_URL", "").strip()
+CACHE_MAX_BYTES = _int("DASHBOARD_CACHE_MAX_BYTES", 256 * 2**20)
+CACHE_MAX_VALUE_BYTES = _int("DASHBOARD_CACHE_MAX_VALUE_BYTES", 32 * 2**20)
+MEMORY_BUDGET = _int("DASHBOARD_MEMORY_BUDGET", 512 * 2**20)
+
+SHARED_CACHE_ENABLED = _flag("DASHBOARD_SHARED_CACHE", True)
+SHARED_CACHE_DIR = _path("DASHBOARD_SHARED_CACHE_DIR", CACHE_DIR / "shared")
+
+OHLCV_FLOAT32 = _flag("DASHBOARD_OHLCV_FLOAT32")
+
+JOB_WORKERS = _int("DASHBOARD_JOB_WORKERS", min(4, os.cpu_count() or 1))
+
+STORE_PATH = _path("DASHBOARD_STORE", CACHE_DIR / "market.sqlite")
+INFO_HISTORY = _flag("DASHBOARD_INFO_HISTORY", True)
+
+TRACE_ENABLED = _flag("DASHBOARD_TRACE")
+TRACE_FILE = _path("DASHBOARD_TRACE_FILE", CACHE_DIR / "traces.jsonl")
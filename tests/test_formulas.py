@@ -0,0 +1,63 @@
+"""
+Compiled key metric formulas (utils.formulas) against the values the
+per-metric code they replaced produced for the same synthetic data.
+"""
+import math
+
+import pytest
+
+from benchmarks import fixtures
+from config.metric_name import metric_formulas, metric_terms
+from utils.formulas import compile_metrics, evaluate_latest
+from utils.statements import Statement, StatementStore
+
+METRICS = ["Current Price", "Market Cap", "52-Week High", "Debt to Equity", "Return on Assets",
+           "Net Profit Margin", "Gross Margin"]
+PLAN = compile_metrics(metric_formulas, METRICS, metric_terms)
+
+# calculate_metric_from_statements / key_metric_mapping output for make_info(2) and
+# make_statement_frames(seed=2). Debt to Equity was a plain ratio (2.17...) and is now in
+# percent like Yahoo's info.debtToEquity.
+OLD_VALUES = {
+    "Current Price": 1344.980064534116,
+    "Market Cap": 410899790285,
+    "52-Week High": 1748.474083894351,
+    "Debt to Equity": 2.1738715209619843 * 100,
+    "Return on Assets": 1.138652193655566,
+    "Net Profit Margin": 3.4244863135501427,
+    "Gross Margin": 4.9357256898245785,
+}
+
+
+def _store(drop=()):
+    frames = fixtures.make_statement_frames(seed=2)
+    return StatementStore("SYN.NS", {
+        "balance_sheet": Statement.from_frame(frames["balance_sheet"].drop(index=list(drop))),
+        "income": Statement.from_frame(frames["financials"]),
+        "cashflow": Statement.from_frame(frames["cashflow"]),
+    })
+
+
+def _evaluate(info, store):
+    values = evaluate_latest(PLAN, [info], [store])[:, 0]
+    return dict(zip(PLAN.metrics, values))
+
+
+def test_matches_old_values():
+    values = _evaluate(fixtures.make_info(2), _store())
+    for metric, expected in OLD_VALUES.items():
+        assert values[metric] == pytest.approx(expected, rel=1e-12), metric
+
+
+def test_missing_statement_item():
+    # Without Total Assets the old code showed "Information not available" for Return on Assets
+    values = _evaluate(fixtures.make_info(2), _store(drop=["Total Assets"]))
+    assert math.isnan(values["Return on Assets"])
+    assert values["Net Profit Margin"] == pytest.approx(OLD_VALUES["Net Profit Margin"], rel=1e-12)
+
+
+def test_info_value_wins_over_statements():
+    info = dict(fixtures.make_info(2), debtToEquity=45.0, returnOnAssets=0.12)
+    values = _evaluate(info, _store())
+    assert values["Debt to Equity"] == 45.0
+    assert values["Return on Assets"] == 0.12
@@ -0,0 +1,68 @@
+import hashlib
+import html
+import re
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+STYLES_DIR = BASE_DIR / "styles"
+TEMPLATES_DIR = BASE_DIR / "templates"
+
+# External font stylesheets (Material Icons fixes arrow rendering)
+FONT_LINKS = '<link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">'
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_STRING = re.compile(r"""("[^"]*"|'[^']*')""")
+_CSS_SPACE = re.compile(r"\s+")
+# Whitespace before ":" is kept, since "a :hover" and "a:hover" differ
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*|:\s+")
+_PLACEHOLDER = re.compile(r"{{\s*(\w+)\s*}}")
+
+
+def minify_css(css):
+    """Drop comments and redundant whitespace, leaving quoted strings untouched."""
+    parts = _CSS_STRING.split(_CSS_COMMENT.sub("", css))
+    for i in range(0, len(parts), 2):
+        text = _CSS_SPACE.sub(" ", parts[i])
+        parts[i] = _CSS_PUNCTUATION.sub(lambda m: m.group(1) or ":", text)
+    return "".join(parts).replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=None)
+def stylesheet(*names):
+    """
+    <style> markup for files in styles/, read and minified once per process.
+    The content hash is embedded so unchanged CSS is an identical message on every rerun.
+    """
+    css = "".join(minify_css((STYLES_DIR / name).read_text(encoding="utf-8")) for name in names)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    return f'{FONT_LINKS}<style data-hash="{digest}">{css}</style>'
+
+
+def _minify_html(text):
+    lines = (line.strip() for line in text.splitlines())
+    return re.sub(r">\s+<", "><", " ".join(line for line in lines if line))
+
+
+@lru_cache(maxsize=None)
+def template(name):
+    """
+    Render function for templates/<name>, parsed once per process.
+    `{{ field }}` placeholders are filled with HTML-escaped values:
+        template("intro.html")(description=text)
+    """
+    parts = _PLACEHOLDER.split(_minify_html((TEMPLATES_DIR / name).read_text(encoding="utf-8")))
+    literals, fields = parts[0::2], parts[1::2]
+
+    def render(**context):
+        missing = set(fields) - context.keys()
+        if missing:
+            raise KeyError(f"{name}: missing template fields {sorted(missing)}")
+        out = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            out.append(html.escape(str(context[field])))
+            out.append(literal)
+        return "".join(out)
+
+    render.fields = tuple(dict.fromkeys(fields))
+    return render
@@ -0,0 +1,520 @@
+"""
+Pluggable cache backend for market data shared beyond one server process.
+
+A backend stores bytes under string keys with an optional TTL:
+
+    get(key) -> bytes | None
+    set(key, value, ttl=None) -> bool                  False if the value exceeds max_value_bytes
+    delete(key)
+    ttl(key) -> seconds left | math.inf | None          None when the key is missing
+    compare_and_set(key, expected, value, ttl=None) -> bool   expected=None means "must not exist"
+
+Implementations: MemoryBackend (in-process, byte-budgeted LRU), SQLiteBackend
+(one file shared by the processes of a host) and RedisBackend (RESP protocol;
+benchmarks/resp_server.py is a local stand-in). DASHBOARD_CACHE_URL picks one,
+see config/settings.py.
+
+Values go through `dumps`/`loads`: Arrow IPC (zstd) for DataFrames and Arrow
+tables, zlib-compressed JSON for dicts and lists. No pickle, so a shared
+backend never executes data it reads.
+"""
+import io
+import json
+import logging
+import math
+import socket
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from config import settings
+from utils import memory
+from utils.ttl_policy import resolve
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "dashboard:v2:"
+# Stored entries start with their write time (unix seconds), see cached_entry
+_WRITTEN_AT = struct.Struct("<d")
+
+
+class CacheError(Exception):
+    """A backend failed (connection lost, server error, corrupt value)."""
+
+
+# ---- Serialization ----
+# pandas and pyarrow are imported on first use: app.py imports this module (through
+# utils.data) before the page header is painted
+
+@lru_cache(maxsize=None)
+def _arrow_options():
+    import pyarrow as pa
+    return pa.ipc.IpcWriteOptions(compression="zstd" if pa.Codec.is_available("zstd") else None)
+
+
+def _arrow_bytes(table):
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema, options=_arrow_options()) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def dumps(value):
+    """Compact bytes for a DataFrame, Arrow table, dict/list (JSON) or bytes; one-byte type tag first."""
+    import pandas as pd
+    import pyarrow as pa
+
+    if isinstance(value, pd.DataFrame):
+        # Arrow column names must be strings; the original labels travel in the pandas metadata
+        return b"F" + _arrow_bytes(pa.Table.from_pandas(value, preserve_index=True))
+    if isinstance(value, pa.Table):
+        return b"T" + _arrow_bytes(value)
+    if isinstance(value, (bytes, bytearray)):
+        return b"B" + bytes(value)
+    return b"J" + zlib.compress(json.dumps(value, default=str, separators=(",", ":")).encode("utf-8"))
+
+
+def loads(data):
+    import pyarrow as pa
+
+    tag, body = data[:1], memoryview(data)[1:]
+    try:
+        if tag in (b"F", b"T"):
+            table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+            return table.to_pandas() if tag == b"F" else table
+        if tag == b"J":
+            return json.loads(zlib.decompress(body))
+        if tag == b"B":
+            return bytes(body)
+    except (pa.ArrowException, zlib.error, ValueError) as e:
+        raise CacheError(f"corrupt cache value: {e}") from e
+    raise CacheError(f"unknown cache value tag {tag!r}")
+
+
+# ---- Backends ----
+
+class CacheBackend:
+    """Interface; values are bytes, TTLs are seconds (None = no expiry)."""
+
+    def __init__(self, max_value_bytes=None):
+        self.max_value_bytes = max_value_bytes or settings.CACHE_MAX_VALUE_BYTES
+
+    def _fits(self, value):
+        return len(value) <= self.max_value_bytes
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def ttl(self, key):
+        raise NotImplementedError
+
+    def compare_and_set(self, key, expected, value, ttl=None):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU bounded by the total size of its values."""
+
+    def __init__(self, max_bytes=None, max_value_bytes=None):
+        super().__init__(max_value_bytes)
+        self.max_bytes = max_bytes or settings.CACHE_MAX_BYTES
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (value, expires_at or None)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def sized_entries(self):
+        """(key, bytes, position) from least to most recently used, for utils.memory."""
+        with self._lock:
+            return [(key, len(value), position) for position, (key, (value, _)) in enumerate(self._entries.items())]
+
+    def _live(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            self._remove(key)
+            return None
+        return entry
+
+    def _remove(self, key):
+        value, _ = self._entries.pop(key)
+        self.nbytes -= len(value)
+
+    def _store(self, key, value, ttl):
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self.nbytes += len(value)
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        if not self._fits(value):
+            return False
+        with self._lock:
+            self._store(key, value, ttl)
+        return True
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def ttl(self, key):
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return None
+            return math.inf if entry[1] is None else entry[1] - time.monotonic()
+
+    def compare_and_set(self, key, expected, value, ttl=None):
+        if not self._fits(value):
+            return False
+        with self._lock:
+            entry = self._live(key)
+            if (entry[0] if entry else None) != expected:
+                return False
+            self._store(key, value, ttl)
+            return True
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Cache table in a local SQLite file (WAL mode), shared by every process on the
+    host. Least recently read rows are evicted once values exceed `max_bytes`.
+    """
+
+    # Reads refresh a row's access time at most this often, to keep reads from writing
+    TOUCH_INTERVAL = 60
+
+    def __init__(self, path, max_bytes=None, max_value_bytes=None):
+        super().__init__(max_value_bytes)
+        self.path = Path(path)
+        self.max_bytes = max_bytes or settings.CACHE_MAX_BYTES
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )""")
+            db.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _row(self, db, key):
+        row = db.execute("SELECT value, expires_at, accessed_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is not None and row[1] is not None and row[1] <= time.time():
+            db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+        return row
+
+    def _store(self, db, key, value, ttl):
+        now = time.time()
+        db.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                   (key, value, len(value), now + ttl if ttl is not None else None, now))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total > self.max_bytes:
+            # Drop expired rows first, then the least recently read ones
+            db.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            excess = db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0] - self.max_bytes
+            for old_key, size in db.execute(
+                    "SELECT key, size FROM cache WHERE key != ? ORDER BY accessed_at", (key,)).fetchall():
+                if excess <= 0:
+                    break
+                db.execute("DELETE FROM cache WHERE key = ?", (old_key,))
+                excess -= size
+
+    def _transaction(self, work):
+        db = self._connection()
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(db)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+            return result
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+
+    def get(self, key):
+        try:
+            db = self._connection()
+            row = self._row(db, key)
+            if row is None:
+                return None
+            if time.time() - row[2] > self.TOUCH_INTERVAL:
+                db.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return bytes(row[0])
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+
+    def set(self, key, value, ttl=None):
+        if not self._fits(value):
+            return False
+        self._transaction(lambda db: self._store(db, key, value, ttl))
+        return True
+
+    def delete(self, key):
+        self._transaction(lambda db: db.execute("DELETE FROM cache WHERE key = ?", (key,)))
+
+    def ttl(self, key):
+        try:
+            row = self._row(self._connection(), key)
+        except sqlite3.Error as e:
+            raise CacheError(str(e)) from e
+        if row is None:
+            return None
+        return math.inf if row[1] is None else row[1] - time.time()
+
+    def compare_and_set(self, key, expected, value, ttl=None):
+        if not self._fits(value):
+            return False
+
+        def work(db):
+            row = self._row(db, key)
+            if (bytes(row[0]) if row else None) != expected:
+                return False
+            self._store(db, key, value, ttl)
+            return True
+        return self._transaction(work)
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+
+class RedisBackend(CacheBackend):
+    """
+    Minimal RESP2 client (GET/SET PX/DEL/PTTL, WATCH/MULTI/EXEC for compare-and-set),
+    one connection per thread. Size limits are left to the server's maxmemory policy.
+    """
+
+    def __init__(self, host="127.0.0.1", port=6379, db=0, password=None, timeout=5.0, max_value_bytes=None):
+        super().__init__(max_value_bytes)
+        self.address = (host, port)
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._local.sock = sock
+        self._local.reader = sock.makefile("rb")
+        if self.password:
+            self._call("AUTH", self.password)
+        if self.db:
+            self._call("SELECT", self.db)
+
+    def _disconnect(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            self._local.reader.close()
+            sock.close()
+        self._local.sock = None
+
+    def _send(self, *args):
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._local.sock.sendall(b"".join(parts))
+
+    def _read(self):
+        line = self._local.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise CacheError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            size = int(payload)
+            if size < 0:
+                return None
+            data = self._local.reader.read(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            return None if count < 0 else [self._read() for _ in range(count)]
+        raise CacheError(f"unexpected reply {line!r}")
+
+    def _call(self, *args):
+        self._send(*args)
+        return self._read()
+
+    def _command(self, *args):
+        """Run one command, reconnecting once if the connection was lost."""
+        for attempt in (0, 1):
+            try:
+                if getattr(self._local, "sock", None) is None:
+                    self._connect()
+                return self._call(*args)
+            except OSError as e:
+                self._disconnect()
+                if attempt:
+                    raise CacheError(f"redis {self.address[0]}:{self.address[1]}: {e}") from e
+
+    def get(self, key):
+        return self._command("GET", key)
+
+    def set(self, key, value, ttl=None):
+        if not self._fits(value):
+            return False
+        if ttl is None:
+            self._command("SET", key, value)
+        else:
+            self._command("SET", key, value, "PX", max(1, int(ttl * 1000)))
+        return True
+
+    def delete(self, key):
+        self._command("DEL", key)
+
+    def ttl(self, key):
+        millis = self._command("PTTL", key)
+        if millis == -2:
+            return None
+        return math.inf if millis == -1 else millis / 1000
+
+    def compare_and_set(self, key, expected, value, ttl=None):
+        if not self._fits(value):
+            return False
+        self._command("WATCH", key)
+        try:
+            if self._call("GET", key) != expected:
+                self._call("UNWATCH")
+                return False
+            self._call("MULTI")
+            if ttl is None:
+                self._call("SET", key, value)
+            else:
+                self._call("SET", key, value, "PX", max(1, int(ttl * 1000)))
+            # EXEC returns nil when the watched key changed in between
+            return self._call("EXEC") is not None
+        except (OSError, CacheError) as e:
+            # Drop the connection rather than leave it inside a transaction
+            self._disconnect()
+            raise CacheError(f"redis {self.address[0]}:{self.address[1]}: {e}") from e
+
+    def close(self):
+        self._disconnect()
+
+
+# ---- Configuration ----
+
+def backend_from_url(url):
+    """Backend for a DASHBOARD_CACHE_URL value, or None for an empty URL."""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+    max_bytes = int(float(query["max_bytes"])) if "max_bytes" in query else None
+    max_value_bytes = int(float(query["max_value_bytes"])) if "max_value_bytes" in query else None
+    if parts.scheme == "memory":
+        return MemoryBackend(max_bytes, max_value_bytes)
+    if parts.scheme == "sqlite":
+        # sqlite:///relative/path or sqlite:////absolute/path, as in SQLAlchemy
+        path = Path(unquote(parts.path[1:] if parts.path.startswith("/") else parts.path) or "cache.sqlite")
+        return SQLiteBackend(path if path.is_absolute() else settings.BASE_DIR / path, max_bytes, max_value_bytes)
+    if parts.scheme == "redis":
+        db = int(parts.path.strip("/") or 0)
+        password = unquote(parts.password) if parts.password else None
+        return RedisBackend(parts.hostname or "127.0.0.1", parts.port or 6379, db, password,
+                            max_value_bytes=max_value_bytes)
+    raise ValueError(f"Unsupported cache URL scheme: {parts.scheme!r}")
+
+
+@lru_cache(maxsize=None)
+def get_backend():
+    """The configured backend (one per process), or None when DASHBOARD_CACHE_URL is unset."""
+    backend = backend_from_url(settings.CACHE_URL)
+    if isinstance(backend, MemoryBackend):
+        # Counts against the process memory budget too, beside its own max_bytes
+        memory.register("backend", backend.sized_entries, backend.delete)
+    return backend
+
+
+def cached(key, ttl, produce):
+    """
+    `produce()` through the configured backend: a hit is decoded and returned,
+    a miss is produced and stored for `ttl` (seconds or a utils.ttl_policy policy). Backend failures are logged
+    and fall through to `produce()`, so a cache outage never breaks a page.
+    """
+    return cached_entry(key, ttl, produce)[0]
+
+
+def cached_entry(key, ttl, produce):
+    """
+    `cached` returning (value, fetched_at): the time the backend entry was written
+    (by whichever process produced it), or None when the value was produced just now.
+    """
+    import pyarrow as pa
+
+    backend = get_backend()
+    if backend is None:
+        return produce(), None
+    key = KEY_PREFIX + key
+    try:
+        data = backend.get(key)
+        if data is not None:
+            if len(data) <= _WRITTEN_AT.size:
+                raise CacheError(f"corrupt cache value: {len(data)} bytes")
+            written, = _WRITTEN_AT.unpack_from(data)
+            return loads(data[_WRITTEN_AT.size:]), written
+    except CacheError as e:
+        logger.warning("cache get %s failed: %s", key, e)
+    value = produce()
+    try:
+        backend.set(key, _WRITTEN_AT.pack(time.time()) + dumps(value), resolve(ttl))
+    except (CacheError, TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning("cache set %s failed: %s", key, e)
+    return value, None
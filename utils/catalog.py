@@ -0,0 +1,104 @@
+import streamlit as st
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from config.stock_categories import stock_categories
+
+_WORD = re.compile(r"[a-z0-9&]+")
+
+
+def _normalize(text):
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+class Catalog:
+    """
+    Deduplicated ticker catalog built once from `stock_categories`, with:
+      - a ticker -> [(category, company name)] reverse map
+      - a sorted prefix index over symbols, full names and name words
+      - a trigram index for typo-tolerant matching, scored by Jaccard similarity
+        against the full name, the symbol and each name word
+    """
+
+    def __init__(self, categories):
+        self.tickers = []
+        self.names = {}
+        self.locations = defaultdict(list)
+        for category, companies in categories.items():
+            for name, ticker in companies.items():
+                if ticker not in self.names:
+                    self.tickers.append(ticker)
+                    self.names[ticker] = name
+                self.locations[ticker].append((category, name))
+
+        keys = []
+        self._trigram_index = defaultdict(list)
+        self._entry_trigrams = []
+        for entry, ticker in enumerate(self.tickers):
+            symbol = ticker.split(".")[0].lower()
+            name = _normalize(self.names[ticker])
+            entry_keys = {symbol, name, *name.split()}
+            keys.extend((key, entry) for key in entry_keys if key)
+            # Full name first: search breaks ties on it
+            trigram_sets = [_trigrams(key) for key in (name, symbol, *name.split())]
+            self._entry_trigrams.append(trigram_sets)
+            for trigram in set().union(*trigram_sets):
+                self._trigram_index[trigram].append(entry)
+        keys.sort()
+        self._prefix_keys = [key for key, _ in keys]
+        self._prefix_entries = [entry for _, entry in keys]
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def categories_of(self, ticker):
+        return [category for category, _ in self.locations.get(ticker, [])]
+
+    def label(self, ticker):
+        return f"{self.names[ticker]} ({ticker}) · {', '.join(self.categories_of(ticker))}"
+
+    def search(self, query, limit=10):
+        """
+        Tickers matching `query`, best first: exact symbol, then prefix matches on
+        symbol/name/words, then fuzzy trigram matches.
+        """
+        query = _normalize(query)
+        if not query:
+            return []
+
+        scores = {}
+        start = bisect_left(self._prefix_keys, query)
+        for key, entry in zip(self._prefix_keys[start:], self._prefix_entries[start:]):
+            if not key.startswith(query):
+                break
+            ticker = self.tickers[entry]
+            tier = 0 if key == query and key == ticker.split(".")[0].lower() else 1
+            scores[entry] = min(scores.get(entry, (2, 0)), (tier, -len(query) / len(key)))
+
+        if len(scores) < limit and len(query) >= 3:
+            query_trigrams = _trigrams(query)
+            candidates = {entry for trigram in query_trigrams for entry in self._trigram_index.get(trigram, ())}
+            for entry in candidates - scores.keys():
+                similarities = [_jaccard(query_trigrams, trigrams) for trigrams in self._entry_trigrams[entry]]
+                similarity = max(similarities)
+                if similarity >= 0.3:
+                    # A typo of a word many names share ranks the name it covers most first
+                    scores[entry] = (2, -similarity, -similarities[0])
+
+        best = sorted(scores, key=lambda entry: (scores[entry], self.names[self.tickers[entry]]))
+        return [self.tickers[entry] for entry in best[:limit]]
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog():
+    """Catalog index built once per process."""
+    return Catalog(stock_categories)
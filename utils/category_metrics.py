@@ -0,0 +1,160 @@
+import streamlit as st
+import pandas as pd
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from config.metric_name import key_metrics_list
+from utils.data import INFO_TTL, get_ticker, load_info
+from utils.formulas import evaluate_latest
+from utils.jobs import forget, session_job, show_progress
+from utils.metrics import KEY_METRICS_PLAN
+from utils.refresh import export, peek, seed
+from utils.statements import load_statements, StatementStore
+from utils.tracing import span, traced
+
+# Fetching is network-bound, so threads are enough; warm loads are plain cache hits
+MAX_WORKERS = 16
+
+# A finished computation is reused by the session for this long (the live quote TTL)
+RESULT_MAX_AGE = 300
+
+# Metrics where a lower value ranks higher
+LOWER_IS_BETTER = {"Debt to Equity", "Price to Sales"}
+
+# Price levels are not comparable across companies, so they are not ranked by default
+RANKABLE_METRICS = [m for m in key_metrics_list if m not in (
+    "Current Price", "Open", "Previous Close", "Day High", "Day Low", "52-Week Low", "52-Week High"
+)]
+
+
+def _load_constituent(ticker):
+    """Cached info and statement store for one ticker (empty on failure)."""
+    stock = get_ticker(ticker)
+    try:
+        info = load_info(stock)
+    except Exception:
+        info = {}
+    try:
+        statements = load_statements(stock)
+    except Exception:
+        statements = StatementStore.empty(ticker)
+    return info, statements
+
+
+def _all_cached(tickers):
+    """True when this process holds the info and statements of every ticker."""
+    return all(peek(("info", ticker)) is not None and peek(("statements", ticker, "annual")) is not None
+               for ticker in tickers)
+
+
+@traced("compute")
+def compute_category_metrics(companies, infos=None, progress=None):
+    """
+    Tickers x key metrics matrix for a {company: ticker} mapping.
+    Inputs are loaded through the shared caches in a thread pool, then every
+    metric is evaluated for all tickers in one pass of the compiled plan.
+    `infos` are info snapshots exported by the calling process (utils.refresh.export):
+    info is not in the shared Arrow tier, so a job process would otherwise refetch it.
+    `progress(done, total, ticker)` is called as constituents load (utils.jobs).
+    """
+    tickers = list(companies.values())
+    if infos:
+        seed(infos, INFO_TTL)
+    loaded = [None] * len(tickers)
+    with span("load constituents", "fetch", tickers=len(tickers)):
+        pool = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tickers) or 1))
+        try:
+            futures = {pool.submit(_load_constituent, ticker): i for i, ticker in enumerate(tickers)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                loaded[futures[future]] = future.result()
+                if progress is not None:
+                    progress(done, len(tickers), tickers[futures[future]])
+        finally:
+            # A cancelled job stops here instead of loading the rest
+            pool.shutdown(cancel_futures=True)
+
+    infos = [info for info, _ in loaded]
+    stores = [statements for _, statements in loaded]
+    values = evaluate_latest(KEY_METRICS_PLAN, infos, stores)
+
+    matrix = pd.DataFrame(values.T, index=pd.Index(list(companies.keys()), name="Company"),
+                          columns=list(KEY_METRICS_PLAN.metrics))
+    matrix.insert(0, "Ticker", tickers)
+    return matrix
+
+
+def percentile_ranks(matrix, metrics):
+    """Percentile rank (0-1, higher is better) of each company for each metric."""
+    ranks = pd.DataFrame(index=matrix.index)
+    for metric in metrics:
+        ranks[metric] = matrix[metric].rank(pct=True, ascending=metric not in LOWER_IS_BETTER)
+    return ranks
+
+
+@st.fragment
+@traced(root=True)
+def show_category_metrics(category, companies):
+    st.header(f"🏷️ Category Metrics - {category}")
+
+    # Cold loads fetch every constituent, so only start once asked to
+    if not st.toggle(f"Compute key metrics for all {len(companies)} companies", key="category_metrics_enabled"):
+        st.info("Turn on to load and rank key metrics for every company in this category.")
+        return
+
+    key = ("category_metrics", category)
+    tickers = list(companies.values())
+    if _all_cached(tickers):
+        # Everything is in memory here: evaluating takes well under a second
+        start = time.perf_counter()
+        matrix = compute_category_metrics(companies)
+        elapsed = time.perf_counter() - start
+    else:
+        # Loading runs in a job process, so the other tabs stay usable meanwhile;
+        # the job starts from the info dicts already cached here
+        job = session_job(key, f"Loading {category}", compute_category_metrics, companies,
+                          infos=export([("info", ticker) for ticker in tickers]), max_age=RESULT_MAX_AGE)
+        if not job.finished:
+            show_progress(job)
+            return
+        if job.state != "done":
+            st.warning(f"Category metrics were not computed ({job.state}).")
+            if job.state == "failed":
+                st.write(job.future.exception())
+            if st.button("Retry", key="category_metrics_retry"):
+                forget(key)
+                st.rerun()
+            return
+        matrix = job.result()
+        elapsed = job.elapsed
+    st.caption(f"{len(matrix)} companies in {elapsed * 1000:,.0f} ms")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        rank_metrics = st.multiselect("Rank by", RANKABLE_METRICS, default=RANKABLE_METRICS,
+                                      key="category_rank_metrics")
+    with col2:
+        min_percentile = st.slider("Minimum score percentile", 0, 100, 0, key="category_min_percentile")
+    with col3:
+        hide_incomplete = st.checkbox("Hide companies with missing metrics", value=False,
+                                      key="category_hide_incomplete")
+
+    table = matrix.copy()
+    if rank_metrics:
+        ranks = percentile_ranks(matrix, rank_metrics)
+        table.insert(1, "Score", ranks.mean(axis=1) * 100)
+        table = table[table["Score"].fillna(0) >= min_percentile]
+        table = table.sort_values("Score", ascending=False)
+    if hide_incomplete:
+        table = table.dropna(subset=rank_metrics or list(KEY_METRICS_PLAN.metrics))
+
+    column_config = {
+        "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%.0f")
+    }
+    with span("table", "render", rows=len(table)):
+        st.dataframe(table, column_config=column_config, use_container_width=True, height=600)
+
+    st.download_button(
+        f"📥 Download {category} metrics as CSV",
+        data=table.to_csv().encode("utf-8"),
+        file_name=f"{category}_metrics.csv",
+        mime="text/csv"
+    )
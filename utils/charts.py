@@ -1,7 +1,25 @@
 import streamlit as st
-import plotly.graph_objects as go
+from utils.ohlcv import load_history
+from utils.tracing import span, traced
 
+@traced("compute")
+def compute_moving_averages(close):
+    """50/200-day simple and exponential moving averages of a close series."""
+    return {
+        "SMA_50": close.rolling(window=50).mean(),
+        "SMA_200": close.rolling(window=200).mean(),
+        "EMA_50": close.ewm(span=50, adjust=False).mean(),
+        "EMA_200": close.ewm(span=200, adjust=False).mean(),
+    }
+
+# A fragment: chart type, range and moving-average toggles rerun this tab only
+@st.fragment
+@traced(root=True)
 def show_charts(stock, company):
+    # Plotting stack is imported only when a chart is drawn (here, in the indicators and
+    # ratio history tabs), so app start and tabs without charts do not pay for it
+    import plotly.graph_objects as go
+
     st.header(f"📈 Charts - {company}")
 
     col1, col2 = st.columns([1, 1])
@@ -15,14 +33,17 @@ def show_charts(stock, company):
         time_choice = st.selectbox("Time Range", list(time_ranges.keys()), index=3)
         period = time_ranges[time_choice]
 
-    hist = stock.history(period=period, interval="1d")
+    # Shared read-only bars; moving averages are computed once over the full history
+    try:
+        hist = load_history(stock, period)
+    except Exception as e:
+        st.warning("Historical data not available.")
+        st.write(e)
+        return
 
     if not hist.empty:
         # Moving averages
-        hist["SMA_50"] = hist["Close"].rolling(window=50).mean()
-        hist["SMA_200"] = hist["Close"].rolling(window=200).mean()
-        hist["EMA_50"] = hist["Close"].ewm(span=50, adjust=False).mean()
-        hist["EMA_200"] = hist["Close"].ewm(span=200, adjust=False).mean()
+        averages = hist.derived("moving_averages", lambda full: compute_moving_averages(full.series("Close")))
 
         st.subheader("Moving Averages")
         col3, col4 = st.columns([1, 1])
@@ -43,40 +64,41 @@ def show_charts(stock, company):
             }
         }
 
-        if chart_type == "Line Chart":
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=hist.index, y=hist["Close"], mode="lines", name="Close Price", line=dict(color="#60a5fa")))
-            if show_sma50: fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA_50"], name="50-day SMA", line=dict(color="#94a3b8")))
-            if show_sma200: fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA_200"], name="200-day SMA", line=dict(color="#64748b")))
-            if show_ema50: fig.add_trace(go.Scatter(x=hist.index, y=hist["EMA_50"], name="50-day EMA", line=dict(color="#3b82f6")))
-            if show_ema200: fig.add_trace(go.Scatter(x=hist.index, y=hist["EMA_200"], name="200-day EMA", line=dict(color="#1d4ed8")))
-            fig.update_layout(
-                title=f"{company} - Line Chart",
-                yaxis_title="Price (&#x20B9;)",
-                template=dark_template,
-                showlegend=True,
-                legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            fig = go.Figure(data=[go.Candlestick(
-                x=hist.index, open=hist['Open'], high=hist['High'],
-                low=hist['Low'], close=hist['Close'],
-                increasing_line_color="#10b981", decreasing_line_color="#ef4444",
-                name="Candlestick"
-            )])
-            if show_sma50: fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA_50"], name="50-day SMA", line=dict(color="#94a3b8")))
-            if show_sma200: fig.add_trace(go.Scatter(x=hist.index, y=hist["SMA_200"], name="200-day SMA", line=dict(color="#64748b")))
-            if show_ema50: fig.add_trace(go.Scatter(x=hist.index, y=hist["EMA_50"], name="50-day EMA", line=dict(color="#3b82f6")))
-            if show_ema200: fig.add_trace(go.Scatter(x=hist.index, y=hist["EMA_200"], name="200-day EMA", line=dict(color="#1d4ed8")))
-            fig.update_layout(
-                xaxis_rangeslider_visible=False,
-                title=f"{company} - Candlestick Chart",
-                yaxis_title="Price (&#x20B9;)",
-                template=dark_template,
-                showlegend=True,
-                legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        with span("plot", "render", chart=chart_type):
+            if chart_type == "Line Chart":
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=hist.index, y=hist.close, mode="lines", name="Close Price", line=dict(color="#60a5fa")))
+                if show_sma50: fig.add_trace(go.Scatter(x=hist.index, y=averages["SMA_50"], name="50-day SMA", line=dict(color="#94a3b8")))
+                if show_sma200: fig.add_trace(go.Scatter(x=hist.index, y=averages["SMA_200"], name="200-day SMA", line=dict(color="#64748b")))
+                if show_ema50: fig.add_trace(go.Scatter(x=hist.index, y=averages["EMA_50"], name="50-day EMA", line=dict(color="#3b82f6")))
+                if show_ema200: fig.add_trace(go.Scatter(x=hist.index, y=averages["EMA_200"], name="200-day EMA", line=dict(color="#1d4ed8")))
+                fig.update_layout(
+                    title=f"{company} - Line Chart",
+                    yaxis_title="Price (&#x20B9;)",
+                    template=dark_template,
+                    showlegend=True,
+                    legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                fig = go.Figure(data=[go.Candlestick(
+                    x=hist.index, open=hist.open, high=hist.high,
+                    low=hist.low, close=hist.close,
+                    increasing_line_color="#10b981", decreasing_line_color="#ef4444",
+                    name="Candlestick"
+                )])
+                if show_sma50: fig.add_trace(go.Scatter(x=hist.index, y=averages["SMA_50"], name="50-day SMA", line=dict(color="#94a3b8")))
+                if show_sma200: fig.add_trace(go.Scatter(x=hist.index, y=averages["SMA_200"], name="200-day SMA", line=dict(color="#64748b")))
+                if show_ema50: fig.add_trace(go.Scatter(x=hist.index, y=averages["EMA_50"], name="50-day EMA", line=dict(color="#3b82f6")))
+                if show_ema200: fig.add_trace(go.Scatter(x=hist.index, y=averages["EMA_200"], name="200-day EMA", line=dict(color="#1d4ed8")))
+                fig.update_layout(
+                    xaxis_rangeslider_visible=False,
+                    title=f"{company} - Candlestick Chart",
+                    yaxis_title="Price (&#x20B9;)",
+                    template=dark_template,
+                    showlegend=True,
+                    legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
+                )
+                st.plotly_chart(fig, use_container_width=True)
     else:
         st.warning("No historical data found for this ticker.")
@@ -0,0 +1,37 @@
+from utils.cache import cached_entry
+from utils.info_history import record_quietly
+from utils.providers import EmptyResponse, get_provider
+from utils.refresh import revalidate
+from utils.tracing import traced
+from utils.ttl_policy import QUOTE
+
+# Info carries quote fields (price, market cap, ratios), so it follows market hours
+INFO_TTL = QUOTE
+
+
+def get_ticker(symbol):
+    """Ticker-like handle for a symbol on the configured market data provider (utils.providers)."""
+    return get_provider().ticker(symbol)
+
+
+def _fetch_info(ticker, stock):
+    # Shared with other server processes through the configured cache backend
+    def produce():
+        info = stock.info
+        if not info:
+            raise EmptyResponse(f"no info returned for {ticker}")
+        return info
+
+    # A copy from the backend keeps the time it was fetched, so its age and TTL count from then
+    info, fetched_at = cached_entry(f"{stock.provider.name}/info/{ticker}", INFO_TTL, produce)
+    record_quietly(ticker, info)
+    return info, fetched_at
+
+
+@traced("fetch")
+def load_info(stock):
+    """
+    Cached `stock.info` dict, shared across sessions (treat as read-only).
+    Past INFO_TTL the old dict is served while it refreshes in the background.
+    """
+    return revalidate(("info", stock.ticker), INFO_TTL, lambda: _fetch_info(stock.ticker, stock)).value
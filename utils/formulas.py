@@ -0,0 +1,243 @@
+import ast
+import numpy as np
+
+# Sources a formula can read from
+MAPPING_SOURCES = ("info", "fi")
+STATEMENT_SOURCES = ("income", "balance_sheet", "cashflow")
+FUNCTIONS = ("first", "total")
+
+BINARY_OPS = {ast.Add: "add", ast.Sub: "sub", ast.Mult: "mul", ast.Div: "div"}
+
+
+class MetricPlan:
+    """
+    Compiled metric formulas.
+
+    Registers are rows of one (n_registers x n_columns) float64 array. The first
+    `len(loads)` rows hold raw inputs (info keys and statement line items), the
+    rest are filled by `steps` in order. Columns are independent (tickers or
+    statement periods), so one pass evaluates every metric for all of them.
+    """
+
+    def __init__(self, metrics, loads, steps, outputs, fi_loads, mapping_loads):
+        self.metrics = tuple(metrics)
+        self.loads = tuple(loads)            # (source, key) per load register
+        self.steps = tuple(steps)            # (op, out_register, arg_registers or constant)
+        self.outputs = np.asarray(outputs)   # register holding each metric
+        self.fi_loads = fi_loads             # metric index -> fast_info load registers it depends on
+        self.mapping_loads = mapping_loads   # metric index -> (source, key) of info/fast_info values it can be, as is
+
+    @property
+    def n_registers(self):
+        return len(self.loads) + len(self.steps)
+
+
+class _Compiler:
+    def __init__(self, terms, statements_first=False):
+        self.terms = terms
+        self.statements_first = statements_first
+        self.loads = {}        # (source, key) -> load index
+        self.steps = {}        # (op, args) -> step index
+        self.term_nodes = {}   # term name -> compiled reference
+        self.fi_deps = {}      # reference -> frozenset of fi load indices
+        self.reads_statements = set()  # references depending on a statement line item
+        self.passthrough = {}  # reference -> load indices whose value it can be unchanged
+
+    def load(self, source, key):
+        ref = ("L", self.loads.setdefault((source, key), len(self.loads)))
+        self.fi_deps[ref] = frozenset([ref[1]]) if source == "fi" else frozenset()
+        if source in STATEMENT_SOURCES:
+            self.reads_statements.add(ref)
+        self.passthrough[ref] = (ref[1],)
+        return ref
+
+    def step(self, op, args):
+        key = (op, args)
+        if key not in self.steps:
+            self.steps[key] = len(self.steps)
+        ref = ("S", self.steps[key])
+        if op == "const":
+            self.fi_deps[ref] = frozenset()
+        else:
+            self.fi_deps[ref] = frozenset().union(*(self.fi_deps[arg] for arg in args))
+            if any(arg in self.reads_statements for arg in args):
+                self.reads_statements.add(ref)
+        self.passthrough[ref] = sum((self.passthrough[arg] for arg in args), ()) if op == "first" else ()
+        return ref
+
+    def compile(self, formula):
+        return self.node(ast.parse(formula.strip(), mode="eval").body, formula)
+
+    def node(self, node, formula):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) \
+                and node.value.id in MAPPING_SOURCES:
+            return self.load(node.value.id, node.attr)
+
+        if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) \
+                and node.value.id in STATEMENT_SOURCES \
+                and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str):
+            return self.load(node.value.id, node.slice.value)
+
+        if isinstance(node, ast.Name) and node.id in self.terms:
+            if node.id not in self.term_nodes:
+                self.term_nodes[node.id] = self.compile(self.terms[node.id])
+            return self.term_nodes[node.id]
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return self.step("const", float(node.value))
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self.node(node.operand, formula)
+            return self.step("neg", (operand,)) if isinstance(node.op, ast.USub) else operand
+
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPS:
+            args = (self.node(node.left, formula), self.node(node.right, formula))
+            return self.step(BINARY_OPS[type(node.op)], args)
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+                and node.func.id in FUNCTIONS and node.args and not node.keywords:
+            args = tuple(self.node(arg, formula) for arg in node.args)
+            if self.statements_first and node.func.id == "first":
+                args = tuple(sorted(args, key=lambda arg: arg not in self.reads_statements))
+            return args[0] if len(args) == 1 and node.func.id == "first" else self.step(node.func.id, args)
+
+        raise ValueError(f"Unsupported expression '{ast.unparse(node)}' in metric formula: {formula}")
+
+
+def compile_metrics(formulas, metrics=None, terms=None, statements_first=False):
+    """
+    Compile metric formulas (see config.metric_name) into a MetricPlan.
+    Shared sub-expressions and inputs are computed once. With `statements_first`,
+    `first(...)` tries the arguments built on statement line items before info and
+    fast_info values (for statements other than the latest annual report, e.g. TTM).
+    """
+    metrics = list(metrics or formulas)
+    compiler = _Compiler(terms or {}, statements_first)
+    refs = [compiler.compile(formulas[metric]) for metric in metrics]
+
+    n_loads = len(compiler.loads)
+
+    def register(ref):
+        kind, index = ref
+        return index if kind == "L" else n_loads + index
+
+    steps = []
+    for (op, args), index in sorted(compiler.steps.items(), key=lambda item: item[1]):
+        operands = args if op == "const" else tuple(register(arg) for arg in args)
+        steps.append((op, n_loads + index, operands))
+
+    loads = [key for key, _ in sorted(compiler.loads.items(), key=lambda item: item[1])]
+    fi_loads = {i: sorted(compiler.fi_deps[ref]) for i, ref in enumerate(refs) if compiler.fi_deps[ref]}
+    mapping_loads = {i: [loads[index] for index in compiler.passthrough[ref] if loads[index][0] in MAPPING_SOURCES]
+                     for i, ref in enumerate(refs)}
+    return MetricPlan(metrics, loads, steps, [register(ref) for ref in refs], fi_loads, mapping_loads)
+
+
+def evaluate(plan, load_values):
+    """Run the plan on a (n_loads x n_columns) input array; returns (n_metrics x n_columns)."""
+    n_columns = load_values.shape[1]
+    registers = np.empty((plan.n_registers, n_columns))
+    registers[:len(plan.loads)] = load_values
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for op, out, args in plan.steps:
+            if op == "const":
+                registers[out] = args
+            elif op == "neg":
+                registers[out] = -registers[args[0]]
+            elif op == "add":
+                registers[out] = registers[args[0]] + registers[args[1]]
+            elif op == "sub":
+                registers[out] = registers[args[0]] - registers[args[1]]
+            elif op == "mul":
+                registers[out] = registers[args[0]] * registers[args[1]]
+            elif op == "div":
+                result = registers[args[0]] / registers[args[1]]
+                result[~np.isfinite(result)] = np.nan
+                registers[out] = result
+            elif op == "first":
+                result = registers[args[0]].copy()
+                for arg in args[1:]:
+                    missing = np.isnan(result)
+                    result[missing] = registers[arg][missing]
+                registers[out] = result
+            elif op == "total":
+                parts = registers[list(args)]
+                result = np.nansum(parts, axis=0)
+                result[np.isnan(parts).all(axis=0)] = np.nan
+                registers[out] = result
+
+    return registers[plan.outputs]
+
+
+def to_number(value):
+    """Numeric value of an info field, NaN for anything else (strings, None, bools)."""
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        return float(value)
+    return np.nan
+
+
+def _mapping_value(mapping, key):
+    try:
+        return to_number(mapping.get(key))
+    except Exception:
+        return np.nan
+
+
+def load_periods(plan, store):
+    """
+    Input array with one column per statement period (union of all statements,
+    oldest first). Only statement line items are loaded, so info fallbacks are
+    skipped and every formula is computed from the reported figures.
+    """
+    periods = store[STATEMENT_SOURCES[0]].periods
+    for kind in STATEMENT_SOURCES[1:]:
+        periods = periods.union(store[kind].periods)
+
+    values = np.full((len(plan.loads), len(periods)), np.nan)
+    positions = {kind: periods.get_indexer(store[kind].periods) for kind in STATEMENT_SOURCES}
+    for i, (source, key) in enumerate(plan.loads):
+        if source in STATEMENT_SOURCES:
+            values[i, positions[source]] = store[source].row(key)
+    return values, periods
+
+
+def evaluate_periods(plan, store):
+    """Evaluate all metrics for every period of a statement store; returns (values, periods)."""
+    load_values, periods = load_periods(plan, store)
+    return evaluate(plan, load_values), periods
+
+
+def load_latest(plan, infos, stores):
+    """
+    Input array with one column per ticker: info values and statement line items
+    at each store's latest period. fast_info rows are left NaN (see evaluate_latest).
+    """
+    values = np.full((len(plan.loads), len(infos)), np.nan)
+    for i, (source, key) in enumerate(plan.loads):
+        if source == "info":
+            values[i] = [_mapping_value(info, key) for info in infos]
+        elif source in STATEMENT_SOURCES:
+            values[i] = [store[source].latest(key) for store in stores]
+    return values
+
+
+def evaluate_latest(plan, infos, stores, fis=None):
+    """
+    Evaluate all metrics for one or more tickers at their latest statement period.
+    fast_info keys may trigger network requests, so they are read only for
+    metrics still unresolved after a first pass.
+    """
+    load_values = load_latest(plan, infos, stores)
+    results = evaluate(plan, load_values)
+    if fis is None or not plan.fi_loads:
+        return results
+
+    unresolved = np.isnan(results).any(axis=1)
+    needed = {i for metric, loads in plan.fi_loads.items() if unresolved[metric] for i in loads}
+    if not needed:
+        return results
+    for i in needed:
+        load_values[i] = [_mapping_value(fi, plan.loads[i][1]) for fi in fis]
+    return evaluate(plan, load_values)
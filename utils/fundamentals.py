@@ -1,10 +1,12 @@
 import streamlit as st
 import pandas as pd
 import io
-from pathlib import Path
 import re
-
-BASE_DIR = Path(__file__).resolve().parent.parent 
+from utils.assets import template
+from utils.data import load_info
+from utils.ohlcv import load_history
+from utils.statements import load_statements, STATEMENT_TITLES
+from utils.tracing import traced
 
 def clean_officer_name(full_name):
     """
@@ -38,17 +40,16 @@ def clean_officer_name(full_name):
 # -------------------------
 # Introduction Page
 # -------------------------
+@traced()
 def show_introduction(stock, company):
     st.header(f"Know about - {company}")
     try:
-        info = stock.info
+        info = load_info(stock)
         description = info.get("longBusinessSummary", "Description not available.")
 
-        # ✅ Company description - Using intro.html
-        intro_file = BASE_DIR / "templates" / "intro.html"
-        intro_html = intro_file.read_text(encoding="utf-8")
+        # ✅ Company description - Using intro.html (pre-parsed, escapes the description)
         st.markdown(
-            f'<div class="intro-text">{intro_html.replace("{{ description }}", description)}</div>',
+            f'<div class="intro-text">{template("intro.html")(description=description)}</div>',
             unsafe_allow_html=True
         )
 
@@ -97,19 +98,11 @@ def show_introduction(stock, company):
                 else:
                     total_pay = "N/A"
 
-                # Custom HTML toggle
-                st.markdown(f"""
-                <div class="custom-toggle">
-                    <input type="checkbox" id="toggle_{i}">
-                    <label for="toggle_{i}">{collapsed_name}</label>
-                    <div class="content">
-                        <strong>Full Name:</strong> {full_name}<br>
-                        <strong>Title:</strong> {title}<br>
-                        <strong>Age:</strong> {age}<br>
-                        <strong>Total Pay:</strong> {total_pay}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                # Custom HTML toggle - Using officer_toggle.html
+                st.markdown(template("officer_toggle.html")(
+                    index=i, collapsed_name=collapsed_name, full_name=full_name,
+                    title=title, age=age, total_pay=total_pay
+                ), unsafe_allow_html=True)
         else:
             st.info("No valid officer information available.")
 
@@ -119,7 +112,7 @@ def show_introduction(stock, company):
         # ✅ Current price with arrow + % change - Custom card
         st.subheader("💰 Current Price")
         try:
-            price = stock.history(period="1d")['Close'].iloc[-1]
+            price = load_history(stock, "1d").close[-1]
             prev_close = info.get("previousClose")
 
             if prev_close:
@@ -161,7 +154,8 @@ def show_introduction(stock, company):
 # -------------------------
 # Fundamentals Page
 # -------------------------
-def format_df(df):
+@traced("compute")
+def format_df(df, number_format="{:,.0f}"):
     df_formatted = df.copy()
 
     new_columns = []
@@ -174,20 +168,23 @@ def format_df(df):
 
     for col in df_formatted.columns:
         if pd.api.types.is_numeric_dtype(df_formatted[col]):
-            df_formatted[col] = df_formatted[col].apply(lambda x: f"{x:,.0f}" if pd.notnull(x) else "")
+            df_formatted[col] = df_formatted[col].apply(lambda x: number_format.format(x) if pd.notnull(x) else "")
         elif pd.api.types.is_datetime64_any_dtype(df_formatted[col]) or "date" in str(df_formatted[col].dtype).lower():
             df_formatted[col] = pd.to_datetime(df_formatted[col], errors='coerce').dt.strftime('%Y-%m-%d')
 
     return df_formatted
 
 
+@st.fragment
+@traced(root=True)
 def show_fundamentals(stock, ticker):
     st.header(f"📖 Fundamentals - {ticker}")
 
-    def show_df(df, title):
+    @traced("render")
+    def show_df(df, title, number_format="{:,.0f}"):
         if df is not None and not df.empty:
             st.subheader(title)
-            df_display = format_df(df)
+            df_display = format_df(df, number_format)
             st.dataframe(df_display, height=500, width=1200, use_container_width=True)  # Added use_container_width for mobile
 
             csv = df.to_csv().encode('utf-8')
@@ -210,17 +207,34 @@ def show_fundamentals(stock, ticker):
         else:
             st.warning(f"{title} not available.")
 
-    fundamentals = {
-        "Financials (Income Statement)": lambda: stock.financials,
-        "Balance Sheet": lambda: stock.balance_sheet,
-        "Cashflow": lambda: stock.cashflow,
-        "Income Statement (Alternative)": lambda: getattr(stock, 'income_stmt', None)
-    }
+    col1, col2 = st.columns(2)
+    with col1:
+        frequency = st.radio("Frequency", ["Annual", "Quarterly"], horizontal=True, key="fundamentals_frequency")
+    with col2:
+        views = ["Reported", "YoY Growth"]
+        if frequency == "Quarterly":
+            views += ["TTM", "QoQ Growth"]
+        view = st.selectbox("View", views, key="fundamentals_view")
 
-    for label, func in fundamentals.items():
-        try:
-            df = func()
-            show_df(df, label)
-        except Exception as e:
-            st.warning(f"{label} not available.")
-            st.write(e)
+    # Income statement is fetched once: `financials` and `income_stmt` are the same data
+    try:
+        statements = load_statements(stock, frequency.lower())
+    except Exception as e:
+        st.warning("Fundamentals not available.")
+        st.write(e)
+        return
+
+    number_format = "{:,.0f}"
+    if view == "TTM":
+        statements = statements.ttm()
+    elif view == "YoY Growth":
+        statements = statements.growth(4 if frequency == "Quarterly" else 1)
+        number_format = "{:+.1%}"
+    elif view == "QoQ Growth":
+        statements = statements.growth(1)
+        number_format = "{:+.1%}"
+
+    for kind, label in STATEMENT_TITLES.items():
+        statement = statements[kind]
+        title = label if frequency == "Annual" and view == "Reported" else f"{label} ({frequency}, {view})"
+        show_df(None if statement.empty else statement.to_frame(), title, number_format)
@@ -1,19 +1,41 @@
 import streamlit as st
-import plotly.graph_objects as go
+from utils.ohlcv import load_history
+from utils.tracing import span, traced
 
+@traced("compute")
+def compute_rsi(close, window=14):
+    """Relative Strength Index over simple rolling averages of gains and losses."""
+    delta = close.diff()
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    avg_gain = gain.rolling(window=window).mean()
+    avg_loss = loss.rolling(window=window).mean()
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+@traced("compute")
+def compute_macd(close, fast=12, slow=26, signal=9):
+    """MACD line and its signal line."""
+    macd = close.ewm(span=fast, adjust=False).mean() - close.ewm(span=slow, adjust=False).mean()
+    return macd, macd.ewm(span=signal, adjust=False).mean()
+
+@st.fragment
+@traced(root=True)
 def show_indicators(stock, company):
+    import plotly.graph_objects as go
+
     st.header(f"📊 Technical Indicators - {company}")
-    hist = stock.history(period="1y", interval="1d")
+    # Indicators are computed once over the full history and sliced to the last year
+    try:
+        hist = load_history(stock, "1y")
+    except Exception as e:
+        st.warning("Historical data not available for indicators.")
+        st.write(e)
+        return
 
     if not hist.empty:
         # RSI
-        delta = hist["Close"].diff()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        rs = avg_gain / avg_loss
-        hist["RSI"] = 100 - (100 / (1 + rs))
+        rsi = hist.derived("rsi", lambda full: compute_rsi(full.series("Close")))
 
         dark_template = {
             "layout": {
@@ -25,34 +47,33 @@ def show_indicators(stock, company):
             }
         }
 
-        fig_rsi = go.Figure()
-        fig_rsi.add_trace(go.Scatter(x=hist.index, y=hist["RSI"], mode="lines", name="RSI", line=dict(color="#60a5fa")))
-        fig_rsi.add_hline(y=70, line=dict(color="#ef4444", dash="dash"), annotation_text="Overbought")
-        fig_rsi.add_hline(y=30, line=dict(color="#10b981", dash="dash"), annotation_text="Oversold")
-        fig_rsi.update_layout(
-            yaxis_title="RSI",
-            template=dark_template,
-            showlegend=True,
-            legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
-        )
-        st.plotly_chart(fig_rsi, use_container_width=True)
+        with span("plot RSI", "render"):
+            fig_rsi = go.Figure()
+            fig_rsi.add_trace(go.Scatter(x=hist.index, y=rsi, mode="lines", name="RSI", line=dict(color="#60a5fa")))
+            fig_rsi.add_hline(y=70, line=dict(color="#ef4444", dash="dash"), annotation_text="Overbought")
+            fig_rsi.add_hline(y=30, line=dict(color="#10b981", dash="dash"), annotation_text="Oversold")
+            fig_rsi.update_layout(
+                yaxis_title="RSI",
+                template=dark_template,
+                showlegend=True,
+                legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
+            )
+            st.plotly_chart(fig_rsi, use_container_width=True)
 
         # MACD
-        hist["EMA_12"] = hist["Close"].ewm(span=12, adjust=False).mean()
-        hist["EMA_26"] = hist["Close"].ewm(span=26, adjust=False).mean()
-        hist["MACD"] = hist["EMA_12"] - hist["EMA_26"]
-        hist["Signal"] = hist["MACD"].ewm(span=9, adjust=False).mean()
-
-        fig_macd = go.Figure()
-        fig_macd.add_trace(go.Scatter(x=hist.index, y=hist["MACD"], mode="lines", name="MACD", line=dict(color="#3b82f6")))
-        fig_macd.add_trace(go.Scatter(x=hist.index, y=hist["Signal"], mode="lines", name="Signal", line=dict(color="#f59e0b")))
-        fig_macd.update_layout(
-            yaxis_title="MACD",
-            template=dark_template,
-            showlegend=True,
-            legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
-        )
-        st.plotly_chart(fig_macd, use_container_width=True)
+        macd, signal = hist.derived("macd", lambda full: compute_macd(full.series("Close")))
+
+        with span("plot MACD", "render"):
+            fig_macd = go.Figure()
+            fig_macd.add_trace(go.Scatter(x=hist.index, y=macd, mode="lines", name="MACD", line=dict(color="#3b82f6")))
+            fig_macd.add_trace(go.Scatter(x=hist.index, y=signal, mode="lines", name="Signal", line=dict(color="#f59e0b")))
+            fig_macd.update_layout(
+                yaxis_title="MACD",
+                template=dark_template,
+                showlegend=True,
+                legend=dict(bgcolor="#334155", bordercolor="#475569", font=dict(color="#e2e8f0"))
+            )
+            st.plotly_chart(fig_macd, use_container_width=True)
 
     else:
         st.warning("No historical data for indicators.")
@@ -0,0 +1,181 @@
+"""
+Daily snapshots of `stock.info`, kept as deltas, for comparing against past dates.
+
+Each info fetch records the ticker's dict for the current (IST) day in the SQL
+store's `info_snapshots` table; later fetches on the same day replace that day's
+row, so a row holds the day's last state. A day with nothing changed gets no row.
+
+Most rows are deltas against the previous snapshot, {"set": {...}, "unset": [...]};
+every KEYFRAME_EVERY-th row holds the full dict, so rebuilding any date reads at
+most KEYFRAME_EVERY rows. Rows older than RETENTION_DAYS are pruned (down to the
+keyframe that later rows need).
+
+    record("TCS.NS", info)
+    day, past = as_of("TCS.NS", date(2026, 3, 31))
+    changed_fields(past, info)
+
+The JSON stays queryable from the SQL panel:
+
+    SELECT day, json_extract(data, '$.set.targetMeanPrice') FROM info_snapshots WHERE symbol = 'TCS.NS'
+"""
+import json
+import logging
+import threading
+import zlib
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from config import settings
+from utils.ttl_policy import IST
+
+logger = logging.getLogger(__name__)
+
+KEYFRAME_EVERY = 30
+RETENTION_DAYS = 3 * 365
+
+_recorded = {}  # symbol -> (day, checksum) of the last row written by this process
+_lock = threading.Lock()
+
+
+def today():
+    return datetime.now(IST).date()
+
+
+# ---- Deltas ----
+
+def _canonical(info):
+    """JSON-safe copy of an info dict (what a stored snapshot decodes to)."""
+    return json.loads(json.dumps(info or {}, default=str))
+
+
+def delta(old, new):
+    """Changes turning dict `old` into `new`."""
+    return {
+        "set": {key: value for key, value in new.items() if key not in old or old[key] != value},
+        "unset": sorted(key for key in old if key not in new),
+    }
+
+
+def apply_delta(base, change):
+    """Dict `base` with a delta applied (`base` is modified)."""
+    base.update(change["set"])
+    for key in change["unset"]:
+        base.pop(key, None)
+    return base
+
+
+def _replay(rows):
+    """Dict rebuilt from (keyframe, data) rows that start at a keyframe, or None."""
+    state = None
+    for keyframe, data in rows:
+        change = json.loads(data)
+        state = change if keyframe else apply_delta(state, change)
+    return state
+
+
+def changed_fields(past, current):
+    """{key: (then, now)} for fields whose value differs between two info dicts."""
+    current = _canonical(current)
+    return {key: (past.get(key), current.get(key))
+            for key in sorted(past.keys() | current.keys()) if past.get(key) != current.get(key)}
+
+
+# ---- Store ----
+
+_CHAIN = (
+    "SELECT day, keyframe, data FROM info_snapshots WHERE symbol = ? AND day {op} ? AND day >= COALESCE("
+    "(SELECT MAX(day) FROM info_snapshots WHERE symbol = ? AND day {op} ? AND keyframe), '') ORDER BY day"
+)
+
+
+def _chain(db, symbol, day, inclusive=True):
+    """Rows from the latest keyframe up to `day` (ISO), as (day, keyframe, data)."""
+    op = "<=" if inclusive else "<"
+    return db.execute(_CHAIN.format(op=op), (symbol, day, symbol, day)).fetchall()
+
+
+def _store():
+    from utils.market_store import get_store
+    return get_store()
+
+
+def record(symbol, info, day=None, store=None):
+    """
+    Store `info` as the snapshot of `symbol` for `day` (default today, IST).
+    Only the latest day can be rewritten. Returns True when a row was written.
+    """
+    day = (day or today()).isoformat()
+    state = _canonical(info)
+    checksum = zlib.crc32(json.dumps(state, sort_keys=True).encode())
+    with _lock:
+        if _recorded.get(symbol) == (day, checksum):
+            return False
+    store = store or _store()
+
+    def work(db):
+        latest = db.execute("SELECT MAX(day) FROM info_snapshots WHERE symbol = ?", (symbol,)).fetchone()[0]
+        if latest is not None and latest > day:
+            raise ValueError(f"{symbol} has snapshots after {day}")
+        rows = _chain(db, symbol, day, inclusive=False)
+        previous = _replay((keyframe, data) for _, keyframe, data in rows)
+        if previous == state:
+            # Back to the previous day's state: that snapshot already covers today
+            return db.execute("DELETE FROM info_snapshots WHERE symbol = ? AND day = ?", (symbol, day)).rowcount > 0
+        keyframe = previous is None or len(rows) >= KEYFRAME_EVERY
+        data = state if keyframe else delta(previous, state)
+        db.execute("INSERT OR REPLACE INTO info_snapshots VALUES (?, ?, ?, ?)",
+                   (symbol, day, int(keyframe), json.dumps(data, separators=(",", ":"))))
+        if keyframe:
+            _prune(db, symbol, date.fromisoformat(day) - timedelta(days=RETENTION_DAYS))
+        return True
+
+    written = store.transaction(work)
+    with _lock:
+        _recorded[symbol] = (day, checksum)
+    return written
+
+
+def _prune(db, symbol, cutoff):
+    """Drop rows before `cutoff` except the chain that rebuilds the cutoff date."""
+    keep = db.execute("SELECT MAX(day) FROM info_snapshots WHERE symbol = ? AND day <= ? AND keyframe",
+                      (symbol, cutoff.isoformat())).fetchone()[0]
+    if keep is not None:
+        db.execute("DELETE FROM info_snapshots WHERE symbol = ? AND day < ?", (symbol, keep))
+
+
+def record_quietly(symbol, info):
+    """`record` for the info loader: a snapshot failure never fails the fetch."""
+    if not settings.INFO_HISTORY:
+        return
+    try:
+        record(symbol, info)
+    except Exception as e:
+        logger.warning("info snapshot of %s failed: %s", symbol, e)
+
+
+def as_of(symbol, day, store=None):
+    """(snapshot day, info dict) of the latest snapshot on or before `day`, or (None, None)."""
+    store = store or _store()
+    if day >= today():
+        return _as_of(store, symbol, day.isoformat())
+    # Past days no longer change; rebuilding them once per process is enough
+    return _as_of_past(store, symbol, day.isoformat())
+
+
+def _as_of(store, symbol, day):
+    rows = _chain(store._connection(), symbol, day)
+    if not rows:
+        return None, None
+    return date.fromisoformat(rows[-1][0]), _replay((keyframe, data) for _, keyframe, data in rows)
+
+
+@lru_cache(maxsize=256)
+def _as_of_past(store, symbol, day):
+    return _as_of(store, symbol, day)
+
+
+def snapshot_days(symbol, store=None):
+    """Days with a stored snapshot of `symbol`, oldest first."""
+    db = (store or _store())._connection()
+    return [date.fromisoformat(day) for (day,) in
+            db.execute("SELECT day FROM info_snapshots WHERE symbol = ? ORDER BY day", (symbol,))]
@@ -0,0 +1,300 @@
+"""
+Background jobs on a process pool, for work too heavy for the script thread.
+
+    job = submit("Category metrics", compute_category_metrics, companies)
+    job.state                  queued, running, done, failed or cancelled
+    job.progress               (done, total, note) as last reported
+    job.result()               the return value (re-raises the job's exception)
+    job.cancel()
+
+A job is a function of an importable module (it is pickled to a worker process by
+name; workers never run the app script, see `_neutral_main`) that takes
+a `progress` keyword argument and calls `progress(done, total, note)` as it goes;
+once the job is cancelled that call raises JobCancelled inside the worker.
+
+Workers start with the parent's settings and market data provider. Large inputs
+are not pickled: jobs get tickers and load history and statements themselves,
+which maps the shared Arrow tier (utils.shared_cache) written by any process,
+so every worker reads the same pages zero-copy.
+
+In the app, `session_job` keeps one job per key in the session and
+`show_progress` polls it in a fragment, so the rest of the page stays usable.
+Jobs of sessions that have ended are cancelled.
+
+DASHBOARD_JOB_WORKERS sets the pool size (default: CPU count, at most 4).
+"""
+import itertools
+import logging
+import multiprocessing
+import queue as queue_module
+import sys
+import threading
+import time
+import types
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from contextlib import contextmanager
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cancellation flags live in shared memory, one slot per job id modulo CANCEL_SLOTS
+CANCEL_SLOTS = 1024
+# How often the monitor thread looks for jobs of closed sessions
+SESSION_CHECK_INTERVAL = 5
+POLL_INTERVAL = 0.5
+
+
+class JobCancelled(Exception):
+    """Raised in a job's worker by `progress()` once the job is cancelled."""
+
+
+# ---- Worker side ----
+
+_worker_queue = None
+_worker_flags = None
+
+
+def _init_worker(progress_queue, cancel_flags, overrides, provider):
+    global _worker_queue, _worker_flags
+    _worker_queue, _worker_flags = progress_queue, cancel_flags
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    if provider is not None:
+        from utils.providers import set_provider
+        set_provider(provider)
+
+
+def _run(job_id, func, args, kwargs):
+    slot = job_id % CANCEL_SLOTS
+
+    def progress(done, total, note=""):
+        if _worker_flags[slot]:
+            raise JobCancelled(f"job {job_id} was cancelled")
+        _worker_queue.put((job_id, done, total, str(note)))
+
+    progress(0, 0)
+    return func(*args, progress=progress, **kwargs)
+
+
+# ---- Handles ----
+
+class Job:
+    """Handle of a submitted job."""
+
+    def __init__(self, job_id, name, future, session_id=None):
+        self.id = job_id
+        self.name = name
+        self.future = future
+        self.session_id = session_id
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = (0, 0, "")
+
+    @property
+    def finished(self):
+        return self.future.done()
+
+    @property
+    def state(self):
+        if not self.future.done():
+            return "running" if self.started_at else "queued"
+        if self.future.cancelled():
+            return "cancelled"
+        error = self.future.exception()
+        if error is None:
+            return "done"
+        return "cancelled" if isinstance(error, JobCancelled) else "failed"
+
+    @property
+    def fraction(self):
+        done, total, _ = self.progress
+        return min(done / total, 1.0) if total else 0.0
+
+    @property
+    def elapsed(self):
+        """Seconds from start to finish (or until now), None while queued."""
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.time()) - self.started_at
+
+    def result(self, timeout=None):
+        try:
+            return self.future.result(timeout)
+        except CancelledError:
+            raise JobCancelled(f"{self.name} was cancelled") from None
+
+    def cancel(self):
+        """Stop the job: dropped if still queued, interrupted at its next progress report if running."""
+        _flags[self.id % CANCEL_SLOTS] = 1
+        self.future.cancel()
+
+
+# ---- Pool ----
+
+_pool = None
+_queue = None
+_flags = None
+_jobs = {}  # job id -> Job, while running
+_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+def _settings_overrides():
+    """Settings as the parent has them (tools assign some after import), for the workers."""
+    return {name: value for name, value in vars(settings).items() if name.isupper()}
+
+
+@contextmanager
+def _neutral_main():
+    """
+    Start processes under a bare `__main__`. spawn re-runs the parent's main module
+    (its `__file__` or `__spec__`) in every child as `__mp_main__`; under Streamlit
+    that module is the app script, so each worker would render the dashboard and
+    fetch data at import. Callers hold `_lock`; the script runner may install a new
+    `__main__` meanwhile, which is left in place.
+    """
+    main = sys.modules["__main__"]
+    neutral = sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        if sys.modules.get("__main__") is neutral:
+            sys.modules["__main__"] = main
+
+
+def _get_pool():
+    """The process pool, started on first use (or again after a worker died)."""
+    global _pool, _queue, _flags
+    with _lock:
+        if _pool is None or getattr(_pool, "_broken", False):
+            from utils.providers import get_provider
+
+            # spawn: forking a server process that runs threads can copy held locks
+            context = multiprocessing.get_context("spawn")
+            _queue = context.Queue()
+            _flags = context.Array("b", CANCEL_SLOTS, lock=False)
+            _pool = ProcessPoolExecutor(
+                settings.JOB_WORKERS, mp_context=context, initializer=_init_worker,
+                initargs=(_queue, _flags, _settings_overrides(), get_provider()))
+            threading.Thread(target=_monitor, args=(_queue,), name="jobs-monitor", daemon=True).start()
+        return _pool
+
+
+def _monitor(progress_queue):
+    """Apply progress reports and cancel jobs whose session has ended."""
+    checked_at = time.monotonic()
+    while True:
+        try:
+            job_id, done, total, note = progress_queue.get(timeout=SESSION_CHECK_INTERVAL)
+        except queue_module.Empty:
+            pass
+        except (EOFError, OSError):
+            return
+        else:
+            job = _jobs.get(job_id)
+            if job is not None:
+                job.started_at = job.started_at or time.time()
+                job.progress = (done, total, note)
+        if time.monotonic() - checked_at >= SESSION_CHECK_INTERVAL:
+            checked_at = time.monotonic()
+            _cancel_orphans()
+
+
+def _cancel_orphans():
+    try:
+        from streamlit.runtime import Runtime
+    except ImportError:
+        return
+    if not Runtime.exists():
+        return
+    runtime = Runtime.instance()
+    for job in list(_jobs.values()):
+        if job.session_id is not None and not runtime.is_active_session(job.session_id):
+            logger.info("cancelling %s: its session ended", job.name)
+            job.cancel()
+
+
+def _finished(job, future):
+    job.finished_at = time.time()
+    with _lock:
+        _jobs.pop(job.id, None)
+
+
+def submit(name, func, *args, session_id=None, **kwargs):
+    """Run `func(*args, progress=..., **kwargs)` in the pool; returns its Job."""
+    pool = _get_pool()
+    job_id = next(_ids)
+    _flags[job_id % CANCEL_SLOTS] = 0
+    # Registered before the job can finish and unregister itself. With spawn,
+    # pool.submit starts a worker when none is idle (up to JOB_WORKERS)
+    with _lock, _neutral_main():
+        job = _jobs[job_id] = Job(job_id, name, pool.submit(_run, job_id, func, args, kwargs), session_id)
+    future = job.future
+    future.add_done_callback(lambda future: _finished(job, future))
+    return job
+
+
+def running():
+    """Jobs not finished yet, oldest first."""
+    with _lock:
+        return list(_jobs.values())
+
+
+# ---- Streamlit ----
+
+def session_job(key, name, func, *args, max_age=None, **kwargs):
+    """
+    The current session's job under `key`, submitting `func` when there is none or
+    when its result is older than `max_age` seconds. A failed or cancelled job stays
+    until `forget(key)`, so the page can show why.
+    """
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    jobs = st.session_state.setdefault("jobs", {})
+    job = jobs.get(key)
+    if job is not None and job.finished:
+        if max_age is not None and job.state == "done" and time.time() - (job.finished_at or time.time()) > max_age:
+            job = None
+    if job is None:
+        context = get_script_run_ctx()
+        job = jobs[key] = submit(name, func, *args, session_id=context.session_id if context else None, **kwargs)
+    return job
+
+
+def job_for(key):
+    """The current session's job under `key`, or None."""
+    import streamlit as st
+
+    return st.session_state.get("jobs", {}).get(key)
+
+
+def forget(key):
+    """Drop the session's job under `key` (cancelling it if it still runs)."""
+    import streamlit as st
+
+    job = st.session_state.get("jobs", {}).pop(key, None)
+    if job is not None and not job.finished:
+        job.cancel()
+
+
+def show_progress(job):
+    """Progress bar and Cancel button for a running job, refreshed in a fragment; reruns the page when it ends."""
+    import streamlit as st
+
+    @st.fragment(run_every=POLL_INTERVAL)
+    def poll():
+        if job.finished:
+            st.rerun()
+        done, total, note = job.progress
+        label = f"{job.name}: {'waiting for a worker' if job.state == 'queued' else note or 'starting'}"
+        if total:
+            label += f" ({done}/{total})"
+        st.progress(job.fraction, text=label)
+        if st.button("Cancel", key=f"job_cancel_{job.id}"):
+            job.cancel()
+            st.rerun()
+
+    poll()
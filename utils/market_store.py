@@ -0,0 +1,383 @@
+"""
+Embedded SQL store (SQLite) of cached market data for cross-ticker queries.
+
+`sync` loads each symbol's history, info and statements through the regular
+loaders (so it reuses every cache) and upserts only what changed: new bars,
+statements whose content moved, the latest info. The file uses
+utils.providers.SQLiteProvider's tables, so DASHBOARD_PROVIDER=local:<store>
+also runs the dashboard from it offline.
+
+Tables and views:
+
+    universe(category, company, symbol)              the catalog (config/stock_categories.csv)
+    history(symbol, date, open, high, low, close, volume)
+    price_stats(symbol, date, close, sma_50, sma_200, high_52w, low_52w, return_1y)
+    info(symbol, data)                               raw info JSON; `companies` has the common fields
+    statement_values(symbol, freq, statement, line_item, period, value)
+    info_snapshots(symbol, day, keyframe, data)      daily info history (utils.info_history)
+
+    store = MarketStore()
+    sync(store, stock_categories["Nifty 50"])
+    store.query("SELECT symbol, close / sma_200 - 1 AS above FROM price_stats ORDER BY above DESC")
+
+    python -m utils.market_store sync --category "Nifty 50"
+    python -m utils.market_store query "SELECT COUNT(*) FROM history"
+
+DASHBOARD_STORE sets the file (default .cache/market.sqlite).
+"""
+import argparse
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import settings
+from utils.providers import SQLiteProvider
+from utils.statements import STATEMENT_SOURCES
+
+# Queries from the panel are cancelled after this many seconds
+QUERY_TIMEOUT = 10
+MAX_ROWS = 10_000
+
+SCHEMA = SQLiteProvider.SCHEMA + """
+    CREATE TABLE IF NOT EXISTS universe (
+        category TEXT NOT NULL, company TEXT NOT NULL, symbol TEXT NOT NULL,
+        PRIMARY KEY (category, symbol)
+    );
+    CREATE INDEX IF NOT EXISTS universe_symbol ON universe (symbol);
+    CREATE TABLE IF NOT EXISTS price_stats (
+        symbol TEXT PRIMARY KEY, date TEXT NOT NULL, close REAL,
+        sma_50 REAL, sma_200 REAL, high_52w REAL, low_52w REAL, return_1y REAL
+    );
+    CREATE TABLE IF NOT EXISTS statement_sources (
+        attribute TEXT PRIMARY KEY, freq TEXT NOT NULL, statement TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS statements_item ON statements (attribute, line_item);
+    CREATE TABLE IF NOT EXISTS sync_log (
+        symbol TEXT NOT NULL, dataset TEXT NOT NULL, fingerprint TEXT NOT NULL, synced_at REAL NOT NULL,
+        PRIMARY KEY (symbol, dataset)
+    );
+    CREATE TABLE IF NOT EXISTS info_snapshots (
+        symbol TEXT NOT NULL, day TEXT NOT NULL, keyframe INTEGER NOT NULL, data TEXT NOT NULL,
+        PRIMARY KEY (symbol, day)
+    );
+    CREATE VIEW IF NOT EXISTS statement_values AS
+        SELECT s.symbol, src.freq, src.statement, s.line_item, s.period, s.value
+        FROM statements s JOIN statement_sources src USING (attribute);
+    CREATE VIEW IF NOT EXISTS companies AS
+        SELECT symbol,
+               json_extract(data, '$.longName') AS name,
+               json_extract(data, '$.sector') AS sector,
+               json_extract(data, '$.industry') AS industry,
+               json_extract(data, '$.marketCap') AS market_cap,
+               json_extract(data, '$.trailingPE') AS pe,
+               json_extract(data, '$.priceToBook') AS pb,
+               json_extract(data, '$.returnOnEquity') AS roe,
+               json_extract(data, '$.debtToEquity') AS debt_to_equity,
+               json_extract(data, '$.dividendYield') AS dividend_yield,
+               json_extract(data, '$.beta') AS beta
+        FROM info;
+"""
+
+EXAMPLE_QUERIES = {
+    "Operating margin up three years running, price above SMA-200": """
+WITH margins AS (
+    SELECT symbol, period,
+           MAX(CASE WHEN line_item = 'Operating Income' THEN value END)
+         / MAX(CASE WHEN line_item = 'Total Revenue' THEN value END) AS margin
+    FROM statement_values
+    WHERE freq = 'annual' AND statement = 'income'
+    GROUP BY symbol, period
+), trend AS (
+    SELECT symbol, margin,
+           LAG(margin, 1) OVER w AS prev1, LAG(margin, 2) OVER w AS prev2, LAG(margin, 3) OVER w AS prev3,
+           ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY period DESC) AS recency
+    FROM margins
+    WINDOW w AS (PARTITION BY symbol ORDER BY period)
+)
+SELECT u.category, u.company, t.symbol, ROUND(t.margin * 100, 1) AS margin_pct,
+       ROUND(p.close, 2) AS close, ROUND(p.sma_200, 2) AS sma_200
+FROM trend t
+JOIN universe u ON u.symbol = t.symbol
+JOIN price_stats p ON p.symbol = t.symbol
+WHERE t.recency = 1 AND t.margin > t.prev1 AND t.prev1 > t.prev2 AND t.prev2 > t.prev3
+  AND p.close > p.sma_200
+ORDER BY margin_pct DESC""",
+    "Closest to 52-week high": """
+SELECT u.company, p.symbol, ROUND(p.close, 2) AS close, ROUND(p.high_52w, 2) AS high_52w,
+       ROUND(100 * (p.close / p.high_52w - 1), 1) AS from_high_pct
+FROM price_stats p JOIN universe u USING (symbol)
+GROUP BY p.symbol
+ORDER BY from_high_pct DESC
+LIMIT 25""",
+    "Cheapest by P/E per sector": """
+SELECT sector, name, symbol, ROUND(pe, 1) AS pe
+FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY sector ORDER BY pe) AS rank
+      FROM companies WHERE pe > 0)
+WHERE rank <= 3
+ORDER BY sector, pe""",
+    "Rows per table": """
+SELECT 'history' AS "table", COUNT(*) AS rows FROM history
+UNION ALL SELECT 'statements', COUNT(*) FROM statements
+UNION ALL SELECT 'info', COUNT(*) FROM info
+UNION ALL SELECT 'universe', COUNT(*) FROM universe""",
+}
+
+
+class MarketStore:
+    """One SQLite file (WAL mode), with a connection per thread."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or settings.STORE_PATH)
+        self._local = threading.local()
+        self._counts = None  # (counted at, {table: rows}), see row_counts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = self._connection()
+        db.executescript(SCHEMA)
+        db.executemany("INSERT OR REPLACE INTO statement_sources VALUES (?, ?, ?)", [
+            (attribute, freq, statement)
+            for freq, sources in STATEMENT_SOURCES.items() for statement, attribute in sources.items()
+        ])
+
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def transaction(self, work):
+        """`work(db)` inside one write transaction."""
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            result = work(db)
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        return result
+
+    def query(self, sql, params=(), timeout=None, max_rows=None):
+        """
+        Result of a read-only query as a DataFrame. With `timeout` (seconds) a
+        slow query is cancelled; with `max_rows` only that many rows are fetched.
+        """
+        db = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+        try:
+            if timeout:
+                deadline = time.perf_counter() + timeout
+                db.set_progress_handler(lambda: time.perf_counter() > deadline, 10_000)
+            cursor = db.execute(sql, params)
+            rows = cursor.fetchall() if max_rows is None else cursor.fetchmany(max_rows)
+            columns = [column[0] for column in cursor.description or ()]
+            return pd.DataFrame.from_records(rows, columns=columns)
+        finally:
+            db.close()
+
+    def row_counts(self, since=None):
+        """
+        Rows per table. COUNT(*) scans the large tables, so the counts are kept and
+        taken again only after a sync here, or when older than `since` (a timestamp,
+        e.g. the end of a sync in another process).
+        """
+        if self._counts is None or (since is not None and self._counts[0] < since):
+            db = self._connection()
+            self._counts = (time.time(), {
+                table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("universe", "history", "statements", "info", "info_snapshots")})
+        return self._counts[1]
+
+    # ---- Upserts ----
+
+    def _fingerprint(self, db, symbol, dataset):
+        row = db.execute("SELECT fingerprint FROM sync_log WHERE symbol = ? AND dataset = ?",
+                         (symbol, dataset)).fetchone()
+        return row[0] if row else None
+
+    def _log(self, db, symbol, dataset, fingerprint):
+        db.execute("INSERT OR REPLACE INTO sync_log VALUES (?, ?, ?, ?)", (symbol, dataset, fingerprint, time.time()))
+
+    def set_universe(self, categories):
+        """Replace the universe with a {category: {company: symbol}} mapping."""
+        rows = [(category, company, symbol)
+                for category, companies in categories.items() for company, symbol in companies.items()]
+
+        def work(db):
+            db.execute("DELETE FROM universe")
+            db.executemany("INSERT OR IGNORE INTO universe VALUES (?, ?, ?)", rows)
+        self.transaction(work)
+        self._counts = None
+
+    def upsert_history(self, history):
+        """
+        Bars of a full PriceHistory: appends bars from the last stored date on, or
+        rewrites the symbol when earlier bars changed (prices are split/dividend adjusted).
+        Returns the number of rows written.
+        """
+        symbol = history.ticker
+        if history.empty:
+            return 0
+        dates = history.index.strftime("%Y-%m-%d")
+        first, last = float(history.close[0]), float(history.close[-1])
+        fingerprint = f"{len(history)}:{dates[0]}:{first!r}:{dates[-1]}:{last!r}"
+
+        def work(db):
+            previous = self._fingerprint(db, symbol, "history")
+            if previous == fingerprint:
+                return 0
+            start = 0
+            if previous is not None and previous.split(":")[1:3] == [dates[0], repr(first)]:
+                stored = db.execute("SELECT MAX(date) FROM history WHERE symbol = ?", (symbol,)).fetchone()[0]
+                start = int(dates.searchsorted(stored)) if stored else 0
+            else:
+                db.execute("DELETE FROM history WHERE symbol = ?", (symbol,))
+            columns = [history[name][start:].tolist() for name in ("Open", "High", "Low", "Close", "Volume")]
+            db.executemany(
+                "INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (symbol, date) DO UPDATE SET "
+                "open = excluded.open, high = excluded.high, low = excluded.low, "
+                "close = excluded.close, volume = excluded.volume",
+                zip([symbol] * (len(dates) - start), dates[start:], *columns))
+            db.execute("INSERT OR REPLACE INTO price_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (symbol, dates[-1], *price_stats(history)))
+            self._log(db, symbol, "history", fingerprint)
+            return len(dates) - start
+        return self.transaction(work)
+
+    def upsert_info(self, symbol, info):
+        data = json.dumps(info, default=str, sort_keys=True)
+        fingerprint = f"{zlib.crc32(data.encode()):08x}"
+
+        def work(db):
+            if self._fingerprint(db, symbol, "info") == fingerprint:
+                return 0
+            db.execute("INSERT INTO info (symbol, data) VALUES (?, ?) "
+                       "ON CONFLICT (symbol) DO UPDATE SET data = excluded.data", (symbol, data))
+            self._log(db, symbol, "info", fingerprint)
+            return 1
+        return self.transaction(work)
+
+    def upsert_statements(self, store):
+        """Statements of a StatementStore; each statement is rewritten only if its values changed."""
+        written = 0
+        for kind, statement in store.statements.items():
+            attribute = STATEMENT_SOURCES[store.freq][kind]
+            if statement.empty:
+                continue
+            n_items, n_periods = statement.values.shape
+            periods = statement.periods.strftime("%Y-%m-%d")
+            items = np.repeat(np.arange(n_items), n_periods)
+            values = statement.values.ravel()
+            keep = ~np.isnan(values)
+            rows = [(store.ticker, attribute, statement.items[i], periods[j], value, int(i))
+                    for i, j, value in zip(items[keep], np.tile(np.arange(n_periods), n_items)[keep], values[keep])]
+            fingerprint = f"{zlib.crc32(repr(rows).encode()):08x}"
+
+            def work(db):
+                if self._fingerprint(db, store.ticker, attribute) == fingerprint:
+                    return 0
+                db.execute("DELETE FROM statements WHERE symbol = ? AND attribute = ?", (store.ticker, attribute))
+                db.executemany("INSERT INTO statements VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._log(db, store.ticker, attribute, fingerprint)
+                return len(rows)
+            written += self.transaction(work)
+        return written
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The store at settings.STORE_PATH (one per process)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MarketStore()
+        return _store
+
+
+def price_stats(history):
+    """(close, sma_50, sma_200, high_52w, low_52w, return_1y) at the last bar of a full history."""
+    close = np.asarray(history.close, dtype=np.float64)
+    year = history.window("1y")
+    year_close = np.asarray(year.close, dtype=np.float64)
+    return (
+        close[-1],
+        close[-50:].mean() if len(close) >= 50 else None,
+        close[-200:].mean() if len(close) >= 200 else None,
+        float(np.max(year.high)) if len(year) else None,
+        float(np.min(year.low)) if len(year) else None,
+        close[-1] / year_close[0] - 1 if len(year_close) > 1 and year_close[0] else None,
+    )
+
+
+def sync(store, companies, progress=None):
+    """
+    Load {company: symbol} through the cached loaders and upsert what changed.
+    `progress(done, total, symbol)` is called after each symbol.
+    Returns {"symbols", "rows", "failed": [symbols]}.
+    """
+    from utils.data import get_ticker, load_info
+    from utils.ohlcv import load_history
+    from utils.statements import load_statements
+
+    symbols = list(dict.fromkeys(companies.values()))
+    rows, failed = 0, []
+    for done, symbol in enumerate(symbols, start=1):
+        stock = get_ticker(symbol)
+        try:
+            # Info first: the statements' freshness check reads the earnings dates from it
+            rows += store.upsert_info(symbol, load_info(stock))
+            rows += store.upsert_history(load_history(stock))
+            for freq in STATEMENT_SOURCES:
+                rows += store.upsert_statements(load_statements(stock, freq))
+        except Exception:
+            failed.append(symbol)
+        if progress is not None:
+            progress(done, len(symbols), symbol)
+    store._counts = None
+    return {"symbols": len(symbols), "rows": rows, "failed": failed}
+
+
+def sync_file(path, companies, progress=None):
+    """`sync` into the store at `path`, for job workers (utils.jobs), which open their own connection."""
+    return sync(MarketStore(path), companies, progress)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", type=Path, help="SQLite file (default DASHBOARD_STORE)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    sync_parser = commands.add_parser("sync", help="load symbols into the store")
+    sync_parser.add_argument("--category", action="append", help="catalog category (default: all)")
+    query_parser = commands.add_parser("query", help="run a read-only query")
+    query_parser.add_argument("sql")
+    args = parser.parse_args()
+
+    from config.stock_categories import stock_categories
+
+    store = MarketStore(args.store)
+    if args.command == "sync":
+        store.set_universe(stock_categories)
+        companies = {}
+        for category in args.category or stock_categories:
+            companies.update(stock_categories[category])
+        result = sync(store, companies, lambda done, total, symbol: print(f"[{done}/{total}] {symbol}", flush=True))
+        print(f"{result['rows']} rows written for {result['symbols']} symbols; failed: {result['failed'] or 'none'}")
+    else:
+        start = time.perf_counter()
+        result = store.query(args.sql, timeout=QUERY_TIMEOUT, max_rows=MAX_ROWS)
+        print(result.to_string(index=False))
+        print(f"{len(result)} rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Byte budget shared by the in-process caches.
+
+Each cache registers a Layer reporting its entries as (key, nbytes, last_used)
+and able to drop one. Once the layers together hold more than
+settings.MEMORY_BUDGET (DASHBOARD_MEMORY_BUDGET, default 512 MiB), `enforce`
+evicts least recently used entries until usage is back under LOW_WATER of the
+budget, always from the layer furthest over its share. Shares split the budget
+in proportion to LAYER_WEIGHTS, so heavy but cheap-to-rebuild layers give way
+first.
+
+    history, info, statements   the utils.refresh store (evicted keys are refetched
+                                through the shared tier and cache backend)
+    indicators                  series and tables derived from history and statements
+                                (recomputed on demand)
+    backend                     the memory:// cache backend
+
+Usage and eviction counts are shown in the Diagnostics tab.
+"""
+import os
+import sys
+import threading
+import time
+
+from config import settings
+from utils.tracing import traced
+
+LAYER_WEIGHTS = {"history": 4, "statements": 2, "indicators": 2, "info": 1, "backend": 1}
+DEFAULT_WEIGHT = 1
+LOW_WATER = 0.9
+# Entries used this recently likely belong to a running script and are not evicted
+IN_USE_SECONDS = 10
+
+
+class Layer:
+    """
+    A cache taking part in the budget: `entries()` yields (key, nbytes, last_used) and
+    `evict(key)` drops one. `last_used` is a time.monotonic() reading, or any lower
+    number ordering entries from least to most recently used.
+    """
+
+    def __init__(self, name, entries, evict, weight=None):
+        self.name = name
+        self.entries = entries
+        self.evict = evict
+        self.weight = weight or LAYER_WEIGHTS.get(name, DEFAULT_WEIGHT)
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+
+_layers = {}
+_lock = threading.Lock()
+
+
+def register(name, entries, evict, weight=None):
+    """Add a layer (or return the one already registered under `name`)."""
+    with _lock:
+        layer = _layers.get(name)
+        if layer is None:
+            layer = _layers[name] = Layer(name, entries, evict, weight)
+        return layer
+
+
+def sizeof(value):
+    """Approximate bytes held by a value: `nbytes` or pandas memory usage when known, else a deep getsizeof."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int) and not isinstance(value, type):
+        return nbytes
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage) and not isinstance(value, type):
+        usage = memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sizeof(key) + sizeof(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sizeof(item) for item in value)
+    return size
+
+
+def _shares(layers, budget):
+    total_weight = sum(layer.weight for layer in layers) or 1
+    return {layer.name: budget * layer.weight / total_weight for layer in layers}
+
+
+def enforce(budget=None):
+    """Evict until the layers fit LOW_WATER of the budget, if they exceed it. Returns bytes evicted."""
+    budget = settings.MEMORY_BUDGET if budget is None else budget
+    # One pass at a time; a caller arriving meanwhile relies on the running one
+    if not _lock.acquire(blocking=False):
+        return 0
+    try:
+        layers = list(_layers.values())
+        entries = {layer.name: sorted(layer.entries(), key=lambda entry: entry[2]) for layer in layers}
+        used = {name: sum(entry[1] for entry in items) for name, items in entries.items()}
+        total = sum(used.values())
+        if total <= budget:
+            return 0
+        shares = _shares(layers, budget)
+        in_use = time.monotonic() - IN_USE_SECONDS
+        for name, items in entries.items():
+            entries[name] = [entry for entry in items if entry[2] < in_use]
+        evicted = 0
+        while total > budget * LOW_WATER:
+            candidates = [layer for layer in layers if entries[layer.name]]
+            if not candidates:
+                break
+            layer = max(candidates, key=lambda layer: used[layer.name] / max(shares[layer.name], 1))
+            key, nbytes, _ = entries[layer.name].pop(0)
+            layer.evict(key)
+            layer.evictions += 1
+            layer.evicted_bytes += nbytes
+            used[layer.name] -= nbytes
+            total -= nbytes
+            evicted += nbytes
+        return evicted
+    finally:
+        _lock.release()
+
+
+def stats(budget=None):
+    """One row per layer: entries, bytes, share of the budget, weight and evictions so far."""
+    budget = settings.MEMORY_BUDGET if budget is None else budget
+    with _lock:
+        layers = list(_layers.values())
+    shares = _shares(layers, budget)
+    rows = []
+    for layer in layers:
+        items = list(layer.entries())
+        rows.append({
+            "layer": layer.name,
+            "entries": len(items),
+            "bytes": sum(entry[1] for entry in items),
+            "share": shares[layer.name],
+            "weight": layer.weight,
+            "evictions": layer.evictions,
+            "evicted_bytes": layer.evicted_bytes,
+        })
+    return rows
+
+
+def resident_bytes():
+    """Resident set size of this process (Linux), or None."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+@traced()
+def show_memory_diagnostics():
+    import streamlit as st
+
+    st.header("🩺 Diagnostics")
+    rows = stats()
+    budget = settings.MEMORY_BUDGET
+    used = sum(row["bytes"] for row in rows)
+    rss = resident_bytes()
+    st.caption(f"Cached data: {used / 2**20:,.1f} MiB of a {budget / 2**20:,.0f} MiB budget"
+               + (f" · process RSS {rss / 2**20:,.0f} MiB" if rss else "")
+               + " · set with DASHBOARD_MEMORY_BUDGET")
+    mib = 1 / 2**20
+    st.dataframe([{
+        "Layer": row["layer"],
+        "Entries": row["entries"],
+        "MiB": round(row["bytes"] * mib, 2),
+        "Share MiB": round(row["share"] * mib, 1),
+        "Weight": row["weight"],
+        "Evictions": row["evictions"],
+        "Evicted MiB": round(row["evicted_bytes"] * mib, 2),
+    } for row in rows], hide_index=True, use_container_width=True)
@@ -1,15 +1,16 @@
 import streamlit as st
-from datetime import datetime
-import pandas as pd
-import sys
+from datetime import datetime, timedelta
 import math
-from config.metric_name import INFO_NOT_AVAILABLE, key_metrics_list, key_metric_mapping, other_metrics_mapping
-
-def safe_val(x):
-    """Return 0 if x is None or NaN"""
-    if x is None or (isinstance(x, float) and math.isnan(x)):
-        return 0
-    return x
+import pandas as pd
+from config import settings
+from config.metric_name import (INFO_NOT_AVAILABLE, key_metrics_list, metric_formulas, metric_terms,
+                                other_metrics_mapping, percent_metrics, ratio_history_metrics)
+from utils.data import load_info
+from utils.formulas import compile_metrics, evaluate_latest, evaluate_periods, to_number
+from utils.info_history import as_of, changed_fields, snapshot_days, today
+from utils.providers import fast_info_from
+from utils.statements import load_statements
+from utils.tracing import span, traced
 
 # ---------------- Helper Functions ----------------
 def get_metric(info_dict, keys, default=INFO_NOT_AVAILABLE):
@@ -20,15 +21,6 @@ def get_metric(info_dict, keys, default=INFO_NOT_AVAILABLE):
             return value
     return default
 
-def df_to_serializable_dict(df):
-    """Convert DataFrame to dict with string keys to avoid JSON errors."""
-    if df.empty:
-        return {}
-    df_copy = df.copy()
-    df_copy.index = df_copy.index.map(str)
-    df_copy.columns = df_copy.columns.map(str)
-    return df_copy.to_dict()
-
 def format_value(key, value, key_metrics=None):
     """Format numbers, percentages, and prices for display."""
     if value is None or value == INFO_NOT_AVAILABLE:
@@ -53,6 +45,8 @@ def format_value(key, value, key_metrics=None):
 
     # Numeric formatting
     if isinstance(value, (int, float)):
+        if key in percent_metrics:
+            return f"{round_if_needed(value)}%"
         if "percent" in key.lower() or "yield" in key.lower() or "margins" in key.lower():
             return f"{round_if_needed(value*100)}%" if value < 1 else f"{round_if_needed(value)}%"
         elif "ratio" in key.lower() or "pe" in key.lower():
@@ -80,139 +74,157 @@ def round_if_needed(value, is_float=False):
         return value
     return value
 
-def calculate_metric_from_statements(metric_name, info, fi, balance_sheet, income_statement, cashflow):
-    """Calculate key metrics from latest fiscal year if not available in info or fi."""
-    try:
-        # Get latest year from statements
-        latest_year_bs = max(balance_sheet.keys(), default=None)
-        latest_year_is = max(income_statement.keys(), default=None)
-        latest_year_cf = max(cashflow.keys(), default=None)
-
-        # Helper to get value safely
-        def get_val(d, key, year=None):
-            if year and year in d:
-                return d[year].get(key, 0)
-            return d.get(key, 0)
-
-        # ---------------- Metric Calculations ----------------
-        if metric_name == "EBITDA":
-            # EBITDA = Operating Revenue - SG&A - Other Non Interest Expense - Occupancy And Equipment + Depreciation + Amortization
-            operating_rev = safe_val(get_val(income_statement, "Operating Revenue", latest_year_is))
-            sg_a = safe_val(get_val(income_statement, "Selling General And Administration", latest_year_is))
-            other_exp = safe_val(get_val(income_statement, "Other Non Interest Expense", latest_year_is))
-            occupancy = safe_val(get_val(income_statement, "Occupancy And Equipment", latest_year_is))
-            depreciation = safe_val(get_val(income_statement, "Depreciation And Amortization In Income Statement", latest_year_is))
-            
-            if None in (operating_rev, sg_a, other_exp, occupancy, depreciation):
-                return INFO_NOT_AVAILABLE
-            
-            ebitda = operating_rev - sg_a - other_exp - occupancy + depreciation
-            return ebitda
-
-        if metric_name == "Current Ratio":
-            # Current Assets / Current Liabilities
-            current_assets = sum([
-                safe_val(get_val(balance_sheet, "Cash And Cash Equivalents", latest_year_bs)),
-                safe_val(get_val(balance_sheet, "Accounts Receivable", latest_year_bs)),
-                safe_val(get_val(balance_sheet, "Other Short Term Investments", latest_year_bs)),
-                safe_val(get_val(balance_sheet, "Prepaid Assets", latest_year_bs))
-            ])
-            current_liabilities = sum([
-                safe_val(get_val(balance_sheet, "Current Debt And Capital Lease Obligation", latest_year_bs)),
-                safe_val(get_val(balance_sheet, "Accounts Payable", latest_year_bs)),
-                safe_val(get_val(balance_sheet, "Current Accrued Expenses", latest_year_bs)),
-                safe_val(get_val(balance_sheet, "Other Payable", latest_year_bs))
-            ])
-            if current_assets and current_liabilities:
-                return current_assets / current_liabilities
-            return INFO_NOT_AVAILABLE
-
-        if metric_name == "Debt to Equity":
-            total_debt = safe_val(get_val(balance_sheet, "Total Debt", latest_year_bs))
-            equity = safe_val(get_val(balance_sheet, "Stockholders Equity", latest_year_bs))
-            if total_debt and equity:
-                return total_debt / equity
-            return INFO_NOT_AVAILABLE
-        
-        if metric_name == "Return on Assets":
-            net_income = get_val(info, "netIncomeToCommon") or get_val(income_statement, "Net Income", latest_year_is)
-            assets = get_val(balance_sheet, "Total Assets", latest_year_bs)
-            return net_income / assets if net_income and assets else INFO_NOT_AVAILABLE
-
-        if metric_name == "Free Cashflow":
-            operating_cf = get_val(info, "operatingCashflow") or get_val(cashflow, "Operating Cash Flow", latest_year_cf)
-            capex = get_val(info, "capitalExpenditures") or get_val(cashflow, "Capital Expenditure", latest_year_cf)
-            return operating_cf - capex if operating_cf is not None and capex is not None else INFO_NOT_AVAILABLE
-
-        if metric_name == "Net Profit Margin":
-            net_income = get_val(info, "netIncomeToCommon") or get_val(income_statement, "Net Income", latest_year_is)
-            revenue = get_val(info, "totalRevenue") or get_val(income_statement, "Total Revenue", latest_year_is)
-            return net_income / revenue if revenue else INFO_NOT_AVAILABLE
-
-        if metric_name == "Operating Margin":
-            operating_income = get_val(info, "operatingIncome") or get_val(income_statement, "Operating Income", latest_year_is)
-            revenue = get_val(info, "totalRevenue") or get_val(income_statement, "Total Revenue", latest_year_is)
-            return operating_income / revenue if revenue else INFO_NOT_AVAILABLE
-
-        if metric_name == "EBITDA Margin":
-            ebitda = get_val(info, "ebitda") or get_val(income_statement, "EBITDA", latest_year_is)
-            revenue = get_val(info, "totalRevenue") or get_val(income_statement, "Total Revenue", latest_year_is)
-            return ebitda / revenue if revenue else INFO_NOT_AVAILABLE
-
-        if metric_name == "Price to Sales":
-            market_cap = get_val(info, "marketCap") or get_val(fi, "marketCap")
-            revenue = get_val(info, "totalRevenue") or get_val(income_statement, "Total Revenue", latest_year_is)
-            return market_cap / revenue if revenue else INFO_NOT_AVAILABLE
-
-        if metric_name == "Gross Margin":
-            revenue = get_val(info, "totalRevenue") or get_val(income_statement, "Total Revenue", latest_year_is)
-            gross_profit = get_val(info, "grossProfits") or get_val(income_statement, "Gross Profit", latest_year_is)
-            return gross_profit / revenue if revenue else INFO_NOT_AVAILABLE
-
-        if metric_name == "EPS Forward":
-            net_income = get_val(info, "netIncomeToCommon") or get_val(income_statement, "Net Income", latest_year_is)
-            shares_out = get_val(info, "sharesOutstanding") or get_val(balance_sheet, "Shares Outstanding", latest_year_bs)
-            return net_income / shares_out if shares_out else INFO_NOT_AVAILABLE
-
-    except:
-        return INFO_NOT_AVAILABLE
-    return INFO_NOT_AVAILABLE
+# Compiled once at import; all key metrics are then evaluated together in one pass
+KEY_METRICS_PLAN = compile_metrics(metric_formulas, key_metrics_list, metric_terms)
+# Info holds Yahoo's latest annual/trailing figures; with TTM statements those are only the fallback
+KEY_METRICS_TTM_PLAN = compile_metrics(metric_formulas, key_metrics_list, metric_terms, statements_first=True)
+RATIO_HISTORY_PLAN = compile_metrics(metric_formulas, ratio_history_metrics, metric_terms)
+
+@traced("compute")
+def calculate_key_metrics(info, fi, statements, plan=KEY_METRICS_PLAN):
+    """Evaluate every key metric from info, fast_info and the statement store (latest period)."""
+    values = evaluate_latest(plan, [info], [statements], [fi])[:, 0]
+    key_metrics = {}
+    for i, (metric, value) in enumerate(zip(plan.metrics, values)):
+        if math.isnan(value):
+            key_metrics[metric] = INFO_NOT_AVAILABLE
+            continue
+        # A value read straight from info or fast_info is shown as reported (an int stays an int,
+        # 3500.0 stays a float); computed values are floats
+        key_metrics[metric] = float(value)
+        for source, key in plan.mapping_loads.get(i, ()):
+            raw = get_metric(info if source == "info" else fi, [key], None)
+            if raw is not None and to_number(raw) == value:
+                key_metrics[metric] = raw
+                break
+    return key_metrics
+
+
+@traced("compute")
+def ratio_history(statements):
+    """
+    Periods x ratios frame for every period of a statement store, computed in one
+    pass over the statement arrays and kept with the cached store.
+    """
+    def compute(store):
+        values, periods = evaluate_periods(RATIO_HISTORY_PLAN, store)
+        return pd.DataFrame(values.T, index=periods, columns=list(RATIO_HISTORY_PLAN.metrics)).dropna(how="all")
+    return statements.cached("ratio_history", compute)
+
+
+# Nested in show_metrics: the period switch redraws just these charts
+@st.fragment
+@traced(root=True)
+def show_ratio_history(stock, company):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    st.subheader("📈 Ratio History")
+    frequency = st.radio("Periods", ["Annual", "Quarterly", "TTM"], horizontal=True, key="ratio_history_frequency")
+    statements = load_statements(stock, "annual" if frequency == "Annual" else "quarterly")
+    if frequency == "TTM":
+        statements = statements.ttm()
+    history = ratio_history(statements)
+    if history.empty:
+        st.info("Not enough statement data to chart ratio history.")
+        return
+
+    cols = 4
+    rows = -(-len(history.columns) // cols)
+    with span("plot", "render"):
+        titles = [f"{metric} (%)" if metric in percent_metrics else metric for metric in history.columns]
+        fig = make_subplots(rows=rows, cols=cols, subplot_titles=titles, vertical_spacing=0.18)
+        for i, metric in enumerate(history.columns):
+            fig.add_trace(
+                go.Scatter(x=history.index, y=history[metric], mode="lines+markers", name=metric,
+                           line=dict(color="#60a5fa"), connectgaps=False),
+                row=i // cols + 1, col=i % cols + 1
+            )
+        fig.update_layout(
+            height=260 * rows,
+            showlegend=False,
+            paper_bgcolor="#1e293b",
+            plot_bgcolor="#1e293b",
+            font=dict(color="#e2e8f0"),
+            margin=dict(t=40, b=20),
+        )
+        fig.update_xaxes(gridcolor="#334155", color="#e2e8f0")
+        fig.update_yaxes(gridcolor="#334155", color="#e2e8f0")
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def pick_snapshot(ticker):
+    """(day, info) of the stored snapshot chosen to compare against, or (None, None)."""
+    if not settings.INFO_HISTORY:
+        return None, None
+    days = [day for day in snapshot_days(ticker) if day < today()]
+    if not days:
+        st.caption("🕰️ Daily snapshots are being recorded; comparisons with past dates start tomorrow.")
+        return None, None
+    day = st.date_input("Compare with", value=None, min_value=days[0], max_value=today() - timedelta(days=1),
+                        key="metrics_compare_day", format="YYYY-MM-DD",
+                        help=f"Info snapshots are kept daily since {days[0]}; the latest one on or before "
+                             "this date is used")
+    if day is None:
+        return None, None
+    return as_of(ticker, day)
+
+
+def show_changes(past_day, past_info, info):
+    changes = changed_fields(past_info, info)
+    with st.expander(f"🕰️ {len(changes)} fields changed since {past_day}"):
+        if changes:
+            st.dataframe(pd.DataFrame(
+                [(other_metrics_mapping.get(key, key), str(then), str(now)) for key, (then, now) in changes.items()],
+                columns=["Field", str(past_day), "Now"]), hide_index=True, use_container_width=True)
 
 
 # ---------------- Main Show Metrics ----------------
+@st.fragment
+@traced(root=True)
 def show_metrics(stock, company):
     st.header(f"📊 Key Performance Indicators - {company}")
     try:
-        info = stock.info
+        info = load_info(stock)
         fi = stock.fast_info
 
-        # Convert DataFrames to dict
-        balance_sheet = df_to_serializable_dict(getattr(stock, "balance_sheet", pd.DataFrame()))
-        income_statement = df_to_serializable_dict(getattr(stock, "financials", pd.DataFrame()))
-        cashflow = df_to_serializable_dict(getattr(stock, "cashflow", pd.DataFrame()))
+        # Statements come from the shared store (fetched and parsed once per ticker).
+        # TTM sums the last four quarters instead of relying on the last annual report.
+        use_ttm = st.toggle("Use TTM figures", value=False, key="metrics_use_ttm",
+                            help="Compute metrics from the trailing four quarters before Yahoo's summary figures")
+        statements = load_statements(stock, "quarterly").ttm() if use_ttm else load_statements(stock)
+        plan = KEY_METRICS_TTM_PLAN if use_ttm else KEY_METRICS_PLAN
         # ---------------- Key Metrics ----------------
-        key_metrics = {}
-        for metric in key_metrics_list:
-            keys = key_metric_mapping.get(metric, [])
-            value = get_metric(info, keys) or get_metric(fi, keys)
-            if value in (None, INFO_NOT_AVAILABLE):
-                value = calculate_metric_from_statements(metric, info, fi, balance_sheet, income_statement, cashflow)
-            key_metrics[metric] = value if value is not None else INFO_NOT_AVAILABLE
+        key_metrics = calculate_key_metrics(info, fi, statements, plan)
+        past_day, past_info = pick_snapshot(stock.ticker)
+        past_metrics = {}
+        if past_info is not None:
+            # Statements are not snapshotted; metrics built on them use the current ones
+            past_metrics = calculate_key_metrics(past_info, fast_info_from(past_info), statements, plan)
+            show_changes(past_day, past_info, info)
 
         st.subheader("🔥 Key Metrics")
-        cols_per_row = 4
-        keys_list_ordered = list(key_metrics.keys())
-        for i in range(0, len(keys_list_ordered), cols_per_row):
-            row_metrics = keys_list_ordered[i:i+cols_per_row]
-            cols = st.columns(len(row_metrics))
-            for col, metric in zip(cols, row_metrics):
-                value = format_value(metric, key_metrics[metric], key_metrics)
-                col.markdown(f"""
-                    <div class='metric-card'>
-                        <div style='font-size:14px'>{metric}</div>
-                        <div style='font-size:20px;margin-top:5px'>{value}</div>
-                    </div>
-                """, unsafe_allow_html=True)
+        with span("metric cards", "render"):
+            cols_per_row = 4
+            keys_list_ordered = list(key_metrics.keys())
+            for i in range(0, len(keys_list_ordered), cols_per_row):
+                row_metrics = keys_list_ordered[i:i+cols_per_row]
+                cols = st.columns(len(row_metrics))
+                for col, metric in zip(cols, row_metrics):
+                    value = format_value(metric, key_metrics[metric], key_metrics)
+                    past = ""
+                    if past_metrics:
+                        past = (f"<div style='font-size:12px;color:#94a3b8;margin-top:3px'>"
+                                f"{past_day}: {format_value(metric, past_metrics[metric])}</div>")
+                    col.markdown(f"""
+                        <div class='metric-card'>
+                            <div style='font-size:14px'>{metric}</div>
+                            <div style='font-size:20px;margin-top:5px'>{value}</div>
+                            {past}
+                        </div>
+                    """, unsafe_allow_html=True)
+
+        show_ratio_history(stock, company)
 
         # ---------------- Other Metrics ----------------
         st.subheader("📌 Other Metrics")
@@ -222,6 +234,8 @@ def show_metrics(stock, company):
             value = get_metric(info, [key])
             if value != INFO_NOT_AVAILABLE:
                 formatted_value = format_value(key, value)
+                if past_info is not None and past_info.get(key) != value:
+                    formatted_value += f" (was {format_value(key, past_info.get(key))} on {past_day})"
                 if j % 3 == 0:
                     col1.write(f"**{label}:** {formatted_value}")
                 elif j % 3 == 1:
@@ -0,0 +1,196 @@
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from config import settings
+from utils import memory
+from utils.providers import EmptyResponse
+from utils.refresh import revalidate
+from utils.shared_cache import column_array, shared_table, written_at
+from utils.tracing import traced
+from utils.ttl_policy import PRICE
+
+COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+PRICE_COLUMNS = COLUMNS[:4]
+
+# Prices are float64 unless DASHBOARD_OHLCV_FLOAT32=1 (half the memory, ~7 significant digits)
+PRICE_DTYPE = np.float32 if settings.OHLCV_FLOAT32 else np.float64
+
+# yfinance-style periods, counted back from the last bar
+PERIOD_OFFSETS = {
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+# The last bar moves while NSE trades; outside the session bars keep until the next open
+HISTORY_TTL = PRICE
+
+
+def _freeze(value):
+    """Read-only numpy arrays for an array, Series, or a dict/tuple of them."""
+    if isinstance(value, dict):
+        return {key: _freeze(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    array = np.asarray(value.to_numpy() if isinstance(value, pd.Series) else value)
+    array.flags.writeable = False
+    return array
+
+
+def _slice(value, window):
+    if isinstance(value, dict):
+        return {key: _slice(item, window) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_slice(item, window) for item in value)
+    return value[window]
+
+
+class PriceHistory:
+    """
+    Immutable daily bars for one ticker, stored once per process as read-only
+    numpy columns. `window(period)` returns zero-copy views over the same arrays,
+    and derived series (moving averages, RSI, ...) are computed once over the
+    full history and kept beside the bars instead of as extra frame columns.
+    """
+
+    def __init__(self, ticker, index, columns, base=None, window=slice(None)):
+        self.ticker = ticker
+        self.index = index
+        self.columns = columns
+        self._base = self if base is None else base
+        self._window = window
+        if base is None:
+            self._derived = {}
+            self._derived_sizes = {}
+            self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, ticker, df):
+        columns = {}
+        for name in COLUMNS:
+            dtype = PRICE_DTYPE if name in PRICE_COLUMNS else np.int64
+            values = df[name].to_numpy(dtype=dtype, copy=True) if name in df else np.zeros(len(df), dtype)
+            values.flags.writeable = False
+            columns[name] = values
+        return cls(ticker, pd.DatetimeIndex(df.index, name="Date"), columns)
+
+    def to_table(self):
+        """Arrow table of the full history: Date plus the OHLCV columns."""
+        base = self._base
+        return pa.table({"Date": pa.array(base.index), **{name: values for name, values in base.columns.items()}})
+
+    @classmethod
+    def from_table(cls, ticker, table):
+        """From an Arrow table (typically memory-mapped); OHLCV columns are zero-copy views."""
+        index = pd.DatetimeIndex(table.column("Date").to_pandas(), name="Date")
+        return cls(ticker, index, {name: column_array(table, name) for name in COLUMNS})
+
+    @property
+    def empty(self):
+        return len(self.index) == 0
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the bars of the full history (views share them)."""
+        base = self._base
+        return sum(values.nbytes for values in base.columns.values()) + base.index.nbytes
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    @property
+    def open(self):
+        return self.columns["Open"]
+
+    @property
+    def high(self):
+        return self.columns["High"]
+
+    @property
+    def low(self):
+        return self.columns["Low"]
+
+    @property
+    def close(self):
+        return self.columns["Close"]
+
+    @property
+    def volume(self):
+        return self.columns["Volume"]
+
+    def series(self, column="Close"):
+        """Column as a pandas Series over the same (read-only) buffer."""
+        return pd.Series(self.columns[column], index=self.index, name=column, copy=False)
+
+    def window(self, period="max"):
+        """View of the last `period` ("1d", "5d", "1mo", ... "10y", "max") of the full history."""
+        base = self._base
+        if period == "max" or base.empty:
+            start = 0
+        elif period == "1d":
+            start = len(base) - 1
+        elif period in PERIOD_OFFSETS:
+            start = int(base.index.searchsorted(base.index[-1] - PERIOD_OFFSETS[period], side="right"))
+        else:
+            raise ValueError(f"Unsupported period: {period}")
+        window = slice(start, None)
+        columns = {name: values[window] for name, values in base.columns.items()}
+        return PriceHistory(self.ticker, base.index[window], columns, base, window)
+
+    def derived(self, key, compute):
+        """
+        `compute(full_history)` evaluated once per ticker and cached beside the bars,
+        sliced to this view. It may return an array/Series or a dict/tuple of them.
+        """
+        base = self._base
+        value = base._derived.get(key)
+        if value is None:
+            value = _freeze(compute(base))
+            with base._lock:
+                value = base._derived.setdefault(key, value)
+                base._derived_sizes[key] = memory.sizeof(value)
+            memory.enforce()
+        return _slice(value, self._window)
+
+    def derived_nbytes(self):
+        """{key: bytes} of the derived values kept beside the bars."""
+        return dict(self._base._derived_sizes)
+
+    def drop_derived(self, key):
+        """Forget a derived value (recomputed on its next use)."""
+        base = self._base
+        with base._lock:
+            base._derived.pop(key, None)
+            base._derived_sizes.pop(key, None)
+
+
+def _fetch_history(ticker, stock):
+    # Other server processes share the bars through the Arrow tier; Yahoo is asked only on a miss there
+    def produce():
+        history = PriceHistory.from_frame(ticker, stock.history(period="max", interval="1d"))
+        if history.empty:
+            raise EmptyResponse(f"no price history returned for {ticker}")
+        return history.to_table()
+
+    key = f"{stock.provider.name}/history/{ticker}.{np.dtype(PRICE_DTYPE).name}"
+    table = shared_table(key, HISTORY_TTL, produce)
+    return PriceHistory.from_table(ticker, table), written_at(table)
+
+
+@traced("fetch")
+def load_history(stock, period="max"):
+    """
+    Shared read-only daily bars for a Ticker (utils.providers), windowed to `period`.
+    Past HISTORY_TTL the old bars are served while they refresh in the background.
+    """
+    snapshot = revalidate(("history", stock.ticker), HISTORY_TTL, lambda: _fetch_history(stock.ticker, stock))
+    return snapshot.value.window(period)
@@ -0,0 +1,395 @@
+"""
+Market data providers: where prices, company info and statements come from.
+
+A provider answers four questions about a symbol, in yfinance's shapes:
+
+    history(symbol, period, interval)   daily OHLCV frame indexed by Date
+    info(symbol)                        flat `info` dict
+    fast_info(symbol)                   mapping with lastPrice, previousClose, marketCap, ...
+    statement(symbol, attribute)        line items x period ends (latest first); attribute
+                                        as on yfinance.Ticker: balance_sheet, quarterly_cashflow, ...
+
+`get_ticker` wraps the configured provider in a Ticker-like handle, so pages
+keep using stock.history(...), stock.info and stock.balance_sheet. DASHBOARD_PROVIDER picks it:
+
+    yfinance                  Yahoo Finance (default)
+    local:data/market         a directory of per-symbol files, see LocalProvider
+    local:data/market.sqlite  an SQLite database, see SQLiteProvider
+    record:data/recordings    Yahoo Finance, saving every response under the directory
+    replay:data/recordings    the recorded responses, no network (same as local:)
+"""
+import json
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+from config import settings
+from utils.refresh import YAHOO
+
+STATEMENT_ATTRIBUTES = (
+    "balance_sheet", "financials", "cashflow", "income_stmt",
+    "quarterly_balance_sheet", "quarterly_financials", "quarterly_cashflow", "quarterly_income_stmt",
+)
+# fast_info keys the metric formulas read (config/metric_name.py)
+FAST_INFO_KEYS = ("lastPrice", "open", "previousClose", "regularMarketPreviousClose", "dayHigh", "dayLow",
+                  "yearHigh", "yearLow", "marketCap")
+OHLCV_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+# Calendar days per yfinance period, for providers that hold the full history
+PERIOD_DAYS = {"1d": 1, "5d": 5, "1mo": 31, "3mo": 92, "6mo": 183, "1y": 366, "2y": 731,
+               "5y": 1827, "10y": 3653, "ytd": 366, "max": None}
+
+
+class EmptyResponse(LookupError):
+    """
+    A provider returned no data. yfinance reports many failures as an empty frame
+    or `{}` rather than raising, so loaders raise this instead of caching the empty
+    value: a stored copy is kept and the fetch is retried.
+    """
+
+
+# pandas is imported where frames are built: app.py imports this module before the
+# page header is painted (through utils.data), and pandas would delay it
+
+def window(bars, period):
+    """The last `period` of a full daily history (a copy)."""
+    import pandas as pd
+
+    days = PERIOD_DAYS.get(period)
+    if days is None or bars.empty:
+        return bars.copy()
+    if days == 1:
+        return bars.iloc[-1:].copy()
+    return bars[bars.index > bars.index[-1] - pd.Timedelta(days=days)].copy()
+
+
+def fast_info_from(info):
+    """fast_info mapping derived from an info dict, for providers without live quotes."""
+    return {
+        "lastPrice": info.get("currentPrice"),
+        "open": info.get("open"),
+        "previousClose": info.get("previousClose"),
+        "regularMarketPreviousClose": info.get("regularMarketPreviousClose", info.get("previousClose")),
+        "dayHigh": info.get("dayHigh"),
+        "dayLow": info.get("dayLow"),
+        "yearHigh": info.get("fiftyTwoWeekHigh"),
+        "yearLow": info.get("fiftyTwoWeekLow"),
+        "marketCap": info.get("marketCap"),
+    }
+
+
+class MarketDataProvider:
+    """Interface; `name` keeps cache entries of different providers apart."""
+
+    name = "provider"
+
+    def history(self, symbol, period="max", interval="1d"):
+        raise NotImplementedError
+
+    def info(self, symbol):
+        raise NotImplementedError
+
+    def fast_info(self, symbol):
+        return fast_info_from(self.info(symbol))
+
+    def statement(self, symbol, attribute):
+        raise NotImplementedError
+
+    def ticker(self, symbol):
+        return Ticker(symbol, self)
+
+
+class Ticker:
+    """yfinance.Ticker-shaped handle on one symbol of a provider."""
+
+    def __init__(self, symbol, provider):
+        self.ticker = symbol
+        self.provider = provider
+
+    def __repr__(self):
+        return f"Ticker({self.ticker!r}, {self.provider.name})"
+
+    @property
+    def info(self):
+        return self.provider.info(self.ticker)
+
+    @property
+    def fast_info(self):
+        return self.provider.fast_info(self.ticker)
+
+    def history(self, period="1mo", interval="1d", **kwargs):
+        return self.provider.history(self.ticker, period, interval)
+
+    def __getattr__(self, name):
+        if name in STATEMENT_ATTRIBUTES:
+            return self.provider.statement(self.ticker, name)
+        raise AttributeError(name)
+
+
+# ---- Yahoo Finance ----
+
+class YFinanceProvider(MarketDataProvider):
+    """
+    Yahoo Finance through yfinance (imported on first use to keep cold starts fast).
+    Calls go through the YAHOO circuit breaker, so an outage fails fast.
+    """
+
+    name = "yfinance"
+
+    def _ticker(self, symbol):
+        # A fresh yfinance Ticker per call: it memoizes info/fast_info on the instance
+        import yfinance as yf
+        return yf.Ticker(symbol)
+
+    def history(self, symbol, period="max", interval="1d"):
+        return YAHOO.call(lambda: self._ticker(symbol).history(period=period, interval=interval))
+
+    def info(self, symbol):
+        return YAHOO.call(lambda: self._ticker(symbol).info) or {}
+
+    def fast_info(self, symbol):
+        # Values load lazily, on first access of each key
+        return self._ticker(symbol).fast_info
+
+    def statement(self, symbol, attribute):
+        return YAHOO.call(getattr, self._ticker(symbol), attribute)
+
+
+# ---- Local files ----
+
+class LocalProvider(MarketDataProvider):
+    """
+    Per-symbol files under `directory`, as written by RecordingProvider:
+
+        <directory>/<SYMBOL>/info.json
+        <directory>/<SYMBOL>/fast_info.json          optional, else derived from info
+        <directory>/<SYMBOL>/history.parquet|csv     full daily history
+        <directory>/<SYMBOL>/<attribute>.parquet|csv statements, periods as columns
+
+    Missing files raise LookupError; nothing is fetched.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.name = f"local-{zlib.crc32(str(self.directory.resolve()).encode()):08x}"
+
+    def _file(self, symbol, stem, suffixes=(".parquet", ".csv")):
+        for suffix in suffixes:
+            path = self.directory / symbol / f"{stem}{suffix}"
+            if path.exists():
+                return path
+        raise LookupError(f"{symbol}: no {stem} in {self.directory}")
+
+    def _frame(self, path):
+        import pandas as pd
+
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path)
+        return pd.read_csv(path, index_col=0)
+
+    def history(self, symbol, period="max", interval="1d"):
+        if interval != "1d":
+            raise LookupError(f"{symbol}: only daily bars are stored locally")
+        import pandas as pd
+
+        bars = self._frame(self._file(symbol, "history"))
+        bars.index = pd.DatetimeIndex(pd.to_datetime(bars.index), name="Date")
+        return window(bars, period)
+
+    def info(self, symbol):
+        return json.loads(self._file(symbol, "info", (".json",)).read_text(encoding="utf-8"))
+
+    def fast_info(self, symbol):
+        try:
+            return json.loads(self._file(symbol, "fast_info", (".json",)).read_text(encoding="utf-8"))
+        except LookupError:
+            return fast_info_from(self.info(symbol))
+
+    def statement(self, symbol, attribute):
+        import pandas as pd
+
+        frame = self._frame(self._file(symbol, attribute))
+        frame.columns = pd.to_datetime(frame.columns)
+        return frame
+
+
+class SQLiteProvider(MarketDataProvider):
+    """
+    Tables in one SQLite file (created empty if missing, see SCHEMA):
+
+        history(symbol, date, open, high, low, close, volume)
+        info(symbol, data, fast_info)                       JSON text
+        statements(symbol, attribute, line_item, period, value, position)
+                                                            position: row order of the line item
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS history (
+            symbol TEXT NOT NULL, date TEXT NOT NULL,
+            open REAL, high REAL, low REAL, close REAL, volume INTEGER,
+            PRIMARY KEY (symbol, date)
+        );
+        CREATE TABLE IF NOT EXISTS info (
+            symbol TEXT PRIMARY KEY, data TEXT NOT NULL, fast_info TEXT
+        );
+        CREATE TABLE IF NOT EXISTS statements (
+            symbol TEXT NOT NULL, attribute TEXT NOT NULL, line_item TEXT NOT NULL,
+            period TEXT NOT NULL, value REAL, position INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (symbol, attribute, line_item, period)
+        );
+    """
+
+    def __getstate__(self):
+        # Connections stay with their process; job workers (utils.jobs) open their own
+        state = dict(self.__dict__)
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.name = f"sqlite-{zlib.crc32(str(self.path.resolve()).encode()):08x}"
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=30)
+        return db
+
+    def history(self, symbol, period="max", interval="1d"):
+        if interval != "1d":
+            raise LookupError(f"{symbol}: only daily bars are stored locally")
+        import pandas as pd
+
+        bars = pd.read_sql_query(
+            "SELECT date, open, high, low, close, volume FROM history WHERE symbol = ? ORDER BY date",
+            self._connection(), params=(symbol,))
+        if bars.empty:
+            raise LookupError(f"{symbol}: no history in {self.path}")
+        bars.index = pd.DatetimeIndex(pd.to_datetime(bars.pop("date")), name="Date")
+        bars.columns = list(OHLCV_COLUMNS)
+        return window(bars, period)
+
+    def _info_row(self, symbol):
+        row = self._connection().execute("SELECT data, fast_info FROM info WHERE symbol = ?", (symbol,)).fetchone()
+        if row is None:
+            raise LookupError(f"{symbol}: no info in {self.path}")
+        return row
+
+    def info(self, symbol):
+        return json.loads(self._info_row(symbol)[0])
+
+    def fast_info(self, symbol):
+        data, fast_info = self._info_row(symbol)
+        return json.loads(fast_info) if fast_info else fast_info_from(json.loads(data))
+
+    def statement(self, symbol, attribute):
+        import pandas as pd
+
+        cells = pd.read_sql_query(
+            "SELECT line_item, period, value FROM statements WHERE symbol = ? AND attribute = ? ORDER BY position",
+            self._connection(), params=(symbol, attribute))
+        if cells.empty:
+            raise LookupError(f"{symbol}: no {attribute} in {self.path}")
+        cells["period"] = pd.to_datetime(cells["period"])
+        frame = cells.pivot(index="line_item", columns="period", values="value")
+        frame = frame.reindex(index=pd.unique(cells["line_item"]))
+        frame.index.name = None
+        frame.columns.name = None
+        return frame.iloc[:, ::-1]
+
+
+# ---- Record / replay ----
+
+class RecordingProvider(MarketDataProvider):
+    """
+    Passes calls to `source` and saves every response under `directory` in
+    LocalProvider's layout, so `replay:<directory>` serves them back offline.
+    History is always fetched in full (period="max") and windowed on the way out.
+    """
+
+    def __init__(self, source, directory):
+        self.source = source
+        self.directory = Path(directory)
+        self.name = source.name
+
+    def _path(self, symbol, filename):
+        path = self.directory / symbol / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def history(self, symbol, period="max", interval="1d"):
+        bars = self.source.history(symbol, "max", interval)
+        if interval == "1d":
+            bars.to_parquet(self._path(symbol, "history.parquet"))
+        return window(bars, period)
+
+    def info(self, symbol):
+        info = self.source.info(symbol)
+        self._path(symbol, "info.json").write_text(json.dumps(info, default=str), encoding="utf-8")
+        return info
+
+    def fast_info(self, symbol):
+        fast_info = self.source.fast_info(symbol)
+        values = {}
+        for key in FAST_INFO_KEYS:
+            try:
+                values[key] = fast_info.get(key)
+            except Exception:
+                values[key] = None
+        self._path(symbol, "fast_info.json").write_text(json.dumps(values, default=str), encoding="utf-8")
+        return values
+
+    def statement(self, symbol, attribute):
+        frame = self.source.statement(symbol, attribute)
+        if frame is not None:
+            # Parquet column names are strings; LocalProvider parses them back to dates
+            stored = frame.copy()
+            stored.columns = [str(column) for column in stored.columns]
+            stored.to_parquet(self._path(symbol, f"{attribute}.parquet"))
+        return frame
+
+
+# ---- Configuration ----
+
+def provider_from_spec(spec):
+    """Provider for a DASHBOARD_PROVIDER value ("yfinance", "local:PATH", "record:DIR", "replay:DIR")."""
+    kind, _, location = (spec or "yfinance").partition(":")
+    if kind == "yfinance":
+        return YFinanceProvider()
+    if not location:
+        raise ValueError(f"DASHBOARD_PROVIDER={spec!r}: expected {kind}:PATH")
+    path = Path(location)
+    path = path if path.is_absolute() else settings.BASE_DIR / path
+    if kind in ("local", "replay"):
+        return SQLiteProvider(path) if path.suffix in (".sqlite", ".db") else LocalProvider(path)
+    if kind == "record":
+        return RecordingProvider(YFinanceProvider(), path)
+    raise ValueError(f"Unsupported market data provider: {spec!r}")
+
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_provider():
+    """The configured provider (one per process)."""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = provider_from_spec(settings.PROVIDER)
+        return _provider
+
+
+def set_provider(provider):
+    """Use `provider` for the rest of the process (tools and tests); returns the previous one."""
+    global _provider
+    with _provider_lock:
+        previous, _provider = _provider, provider
+    return previous
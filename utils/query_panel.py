@@ -0,0 +1,58 @@
+import streamlit as st
+import time
+from config.stock_categories import stock_categories
+from utils.jobs import forget, job_for, session_job, show_progress
+from utils.market_store import EXAMPLE_QUERIES, MAX_ROWS, QUERY_TIMEOUT, get_store, sync_file
+from utils.tracing import span, traced
+
+
+def pick_example():
+    st.session_state.sql_query = EXAMPLE_QUERIES[st.session_state.sql_example].strip()
+
+
+@st.fragment
+@traced(root=True)
+def show_query_panel(category, companies):
+    st.header("🧮 SQL Query")
+    store = get_store()
+    key = ("store_sync", category)
+    # Counted once, then again after a sync job (another process) has finished
+    job = job_for(key)
+    counts = store.row_counts(since=job.finished_at if job is not None else None)
+    st.caption(f"`{store.path}` · " + " · ".join(f"{table}: {rows:,} rows" for table, rows in counts.items()))
+
+    # Loading fetches every constituent not yet cached, so only on request, in a job process
+    if st.button(f"Load {category} ({len(companies)} companies) into the store", key="sql_sync"):
+        store.set_universe(stock_categories)
+        forget(key)
+        session_job(key, f"Loading {category} into the store", sync_file, str(store.path), companies)
+    job = job_for(key)
+    if job is not None and not job.finished:
+        show_progress(job)
+    elif job is not None and job.state == "done":
+        result = job.result()
+        st.success(f"{result['rows']:,} rows written for {result['symbols']} companies")
+        if result["failed"]:
+            st.warning(f"Could not load: {', '.join(result['failed'])}")
+    elif job is not None:
+        st.warning(f"Loading {category} stopped"
+                   + (f": {job.future.exception()}" if job.state == "failed" else " (cancelled)"))
+
+    st.selectbox("Examples", list(EXAMPLE_QUERIES), index=None, placeholder="Start from an example",
+                 key="sql_example", on_change=pick_example)
+    sql = st.text_area("Query (read-only)", key="sql_query", height=240,
+                       help="Tables: universe, history, price_stats, info, statements. "
+                            "Views: companies, statement_values.")
+    if not st.button("Run", type="primary", key="sql_run") or not sql.strip():
+        return
+
+    start = time.perf_counter()
+    try:
+        result = store.query(sql, timeout=QUERY_TIMEOUT, max_rows=MAX_ROWS)
+    except Exception as e:
+        st.error(f"Query failed: {e}")
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+    with span("results", "render", rows=len(result)):
+        st.caption(f"{len(result):,} rows in {elapsed:.1f} ms" + (f" (first {MAX_ROWS:,})" if len(result) == MAX_ROWS else ""))
+        st.dataframe(result, use_container_width=True, hide_index=True)
@@ -0,0 +1,293 @@
+"""
+Stale-while-revalidate store for data fetched from Yahoo Finance.
+
+    info = revalidate(("info", ticker), INFO_TTL, fetch).value
+
+Each key keeps its last good value and the time it was fetched. Within `ttl`
+the value is returned as is. Past `ttl` it is still returned at once, and a
+single background refresh per key replaces it when the upstream answers. A
+failed refresh keeps the old value (and is retried after RETRY_INTERVAL), so an
+outage shows older data instead of an error. Only a key with no value yet waits
+on its fetch, for at most FETCH_TIMEOUT seconds.
+
+Entries count against the in-process memory budget (utils.memory), one layer
+per kind of key; an evicted key is fetched again on its next use.
+
+Yahoo Finance calls (utils.providers) go through the YAHOO circuit breaker: after FAILURE_THRESHOLD
+consecutive failures it fails fast for RESET_TIMEOUT seconds, then lets one
+trial call through to decide whether to close again.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from functools import partial
+from utils import memory
+from utils.ttl_policy import resolve
+
+logger = logging.getLogger(__name__)
+
+# Enough workers for the category page, which loads up to 16 constituents at once
+REFRESH_WORKERS = 16
+# Longest a script run waits on a key that has no value yet
+FETCH_TIMEOUT = 20
+# Pause between refresh attempts of a key whose last attempt left it stale
+RETRY_INTERVAL = 60
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30
+
+
+# ---- Circuit breaker ----
+
+class CircuitOpenError(Exception):
+    """The upstream failed repeatedly and is not being called for now."""
+
+
+class CircuitBreaker:
+    """
+    Closed: calls pass through. Open: calls fail fast with CircuitOpenError.
+    After `reset_timeout` seconds one trial call is let through (half-open);
+    success closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def _allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._trial = True
+            return True
+
+    def _record(self, ok):
+        with self._lock:
+            self._trial = False
+            if ok:
+                self.failures, self.opened_at = 0, None
+                return
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning("%s: %d consecutive failures, pausing calls for %ss",
+                                   self.name, self.failures, self.reset_timeout)
+                self.opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        """`func(*args, **kwargs)`, or CircuitOpenError without calling it while the breaker is open."""
+        if not self._allow():
+            raise CircuitOpenError(f"{self.name} is not responding, calls paused")
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record(False)
+            raise
+        self._record(True)
+        return result
+
+
+YAHOO = CircuitBreaker("Yahoo Finance")
+
+
+# ---- Store ----
+
+class Snapshot:
+    """A value with the wall-clock time it was fetched, its size and the outcome of the last refresh."""
+
+    __slots__ = ("value", "fetched_at", "ttl", "error", "retry_at", "nbytes", "used_at")
+
+    def __init__(self, value, fetched_at, ttl):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.ttl = ttl
+        self.error = None
+        self.retry_at = 0.0
+        self.nbytes = memory.sizeof(value)
+        self.used_at = time.monotonic()
+
+    @property
+    def age(self):
+        return time.time() - self.fetched_at
+
+    @property
+    def stale(self):
+        return self.age > self.ttl
+
+
+_entries = {}   # key -> Snapshot
+_inflight = {}  # key -> Future of the running fetch
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(REFRESH_WORKERS, thread_name_prefix="refresh")
+
+
+def _run(key, ttl, fetch):
+    try:
+        value, fetched_at = fetch()
+    except Exception as e:
+        logger.warning("refresh of %s failed: %s", key, e)
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None:
+                entry.error = f"{type(e).__name__}: {e}"
+                entry.retry_at = time.time() + RETRY_INTERVAL
+            _inflight.pop(key, None)
+        raise
+    fetched_at = fetched_at or time.time()
+    entry = Snapshot(value, fetched_at, resolve(ttl, fetched_at))
+    # A fallback copy can already be stale; don't refetch it on every rerun
+    entry.retry_at = time.time() + RETRY_INTERVAL
+    with _lock:
+        _entries[key] = entry
+        _inflight.pop(key, None)
+    memory.register(key[0], partial(_layer_entries, key[0]), _evict)
+    memory.enforce()
+    return entry
+
+
+def _submit(key, ttl, fetch):
+    """Future of the fetch for `key`, starting one unless it is already running (call with _lock held)."""
+    future = _inflight.get(key)
+    if future is None:
+        future = _inflight[key] = _executor.submit(_run, key, ttl, fetch)
+    return future
+
+
+def revalidate(key, ttl, fetch):
+    """
+    Snapshot for `key`. `fetch()` returns `(value, fetched_at)` (None for now) and
+    runs on a worker thread: in the background once the stored value is older than
+    `ttl` (seconds or a utils.ttl_policy policy), or waited on (up to FETCH_TIMEOUT)
+    when there is no value yet.
+    """
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            entry.used_at = time.monotonic()
+            if entry.stale and time.time() >= entry.retry_at:
+                _submit(key, ttl, fetch)
+            return entry
+        future = _submit(key, ttl, fetch)
+    try:
+        return future.result(timeout=FETCH_TIMEOUT)
+    except FutureTimeout:
+        # The fetch keeps running; a later rerun picks up its result
+        raise TimeoutError(f"{key[0]} for {key[1]} is still loading") from None
+
+
+def peek(key):
+    """Stored value for `key` (stale or not) without fetching, or None."""
+    entry = _entries.get(key)
+    return None if entry is None else entry.value
+
+
+def export(keys):
+    """{key: (value, fetched_at)} for the stored keys among `keys`, to hand to another process (see seed)."""
+    with _lock:
+        entries = {key: _entries.get(key) for key in keys}
+    return {key: (entry.value, entry.fetched_at) for key, entry in entries.items() if entry is not None}
+
+
+def seed(values, ttl):
+    """
+    Store {key: (value, fetched_at)} exported by another process, except where this
+    one holds a newer value. Seeded keys are not refreshed here before RETRY_INTERVAL,
+    as the exporting process refreshes its own.
+    """
+    retry_at = time.time() + RETRY_INTERVAL
+    with _lock:
+        for key, (value, fetched_at) in values.items():
+            entry = _entries.get(key)
+            if entry is None or entry.fetched_at < fetched_at:
+                entry = _entries[key] = Snapshot(value, fetched_at, resolve(ttl, fetched_at))
+                entry.retry_at = retry_at
+    for kind in {key[0] for key in values}:
+        memory.register(kind, partial(_layer_entries, kind), _evict)
+    memory.enforce()
+
+
+def refreshing(key):
+    return key in _inflight
+
+
+def snapshots(ticker):
+    """(key, Snapshot) pairs stored for a ticker (keys are (kind, ticker, ...) tuples)."""
+    with _lock:
+        return [(key, entry) for key, entry in _entries.items() if key[1] == ticker]
+
+
+def clear():
+    """Forget every stored value (running fetches still complete and store theirs)."""
+    with _lock:
+        _entries.clear()
+
+
+# ---- Memory budget ----
+
+def _layer_entries(kind):
+    with _lock:
+        return [(key, entry.nbytes, entry.used_at) for key, entry in _entries.items() if key[0] == kind]
+
+
+def _evict(key):
+    with _lock:
+        _entries.pop(key, None)
+
+
+def _derived_entries():
+    """Values derived from stored ones (indicators on history, TTM and ratios on statements)."""
+    with _lock:
+        stored = list(_entries.items())
+    return [((key, name), nbytes, entry.used_at)
+            for key, entry in stored if hasattr(entry.value, "derived_nbytes")
+            for name, nbytes in entry.value.derived_nbytes().items()]
+
+
+def _evict_derived(key):
+    store_key, name = key
+    entry = _entries.get(store_key)
+    if entry is not None:
+        entry.value.drop_derived(name)
+
+
+memory.register("indicators", _derived_entries, _evict_derived)
+
+
+# ---- Display ----
+
+def format_age(seconds):
+    if seconds < 60:
+        return f"{seconds:.0f} s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} min"
+    if seconds < 2 * 86400:
+        return f"{seconds / 3600:.0f} h"
+    return f"{seconds / 86400:.0f} days"
+
+
+def show_data_age(container, ticker):
+    """Caption in `container` when data shown for `ticker` is past its TTL, with its age."""
+    stale = [(key, entry) for key, entry in snapshots(ticker) if entry.stale]
+    if not stale:
+        return
+    kinds = sorted({key[0] for key, _ in stale})
+    note = f"⏳ Showing {', '.join(kinds)} from {format_age(max(entry.age for _, entry in stale))} ago"
+    if YAHOO.state != "closed" or any(entry.error for _, entry in stale):
+        note += f" ({YAHOO.name} is not responding; retrying in the background)"
+    elif any(refreshing(key) for key, _ in stale):
+        note += " (refreshing in the background)"
+    container.caption(note)
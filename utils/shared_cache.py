@@ -0,0 +1,182 @@
+"""
+Cross-process cache tier of memory-mapped Arrow IPC files on local disk.
+
+Several server processes on one machine share the same files: the first
+process to fetch a ticker writes its table, every other process maps it and
+reads the columns zero-copy (the OS page cache holds one copy for all).
+
+    table = shared_table(f"history/{ticker}", max_age=ttl_policy.PRICE, produce=fetch_table)
+
+Files are written to a temporary name and renamed into place, so readers see
+either the old or the new version, never a partial file. Each file carries a
+version stamp in its schema metadata (format version, write time, writer);
+files from another format version or older than `max_age` (seconds, or a
+utils.ttl_policy policy applied to the write time) are misses.
+A lock file keeps concurrent processes from fetching the same key twice,
+and when the fetch fails an expired file is served instead (`written_at`
+tells how old it is). On a miss the table comes from the configured cache backend (utils.cache,
+e.g. Redis shared by several hosts) before anything is fetched.
+
+DASHBOARD_SHARED_CACHE_DIR sets the directory (default .cache/shared) and
+DASHBOARD_SHARED_CACHE=0 turns the tier off.
+"""
+import logging
+import os
+import socket
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pyarrow as pa
+
+from config import settings
+from utils.cache import cached_entry
+from utils.ttl_policy import resolve
+
+try:
+    import fcntl
+except ImportError:  # Windows: no inter-process lock, concurrent misses may both fetch
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+ENABLED = settings.SHARED_CACHE_ENABLED
+CACHE_DIR = settings.SHARED_CACHE_DIR
+
+# Bump when a table layout changes; files from other versions are ignored
+FORMAT_VERSION = "1"
+
+
+def cache_path(key):
+    """File for a key like "history/TCS.NS" under the current format version."""
+    return CACHE_DIR / f"v{FORMAT_VERSION}" / f"{key}.arrow"
+
+
+def stamp(table):
+    """Version stamp of a table read from the tier ({} for tables that were not)."""
+    metadata = table.schema.metadata or {}
+    return {key.decode(): value.decode() for key, value in metadata.items() if key.startswith(b"cache.")}
+
+
+def written_at(table):
+    """Unix time a tier table was written, or None for tables that did not come from the tier."""
+    value = stamp(table).get("cache.written_at")
+    return float(value) if value else None
+
+
+def read_table(path, max_age=None):
+    """Memory-mapped table at `path`, or None if missing, unreadable, from another version or too old."""
+    try:
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+    info = stamp(table)
+    if info.get("cache.format") != FORMAT_VERSION:
+        return None
+    if max_age is not None:
+        written = float(info.get("cache.written_at", 0))
+        if time.time() - written > resolve(max_age, written):
+            return None
+    return table
+
+
+def peek_table(key):
+    """Table for `key` whatever its age, or None (tier disabled or nothing written yet)."""
+    return read_table(cache_path(key)) if ENABLED else None
+
+
+def _stamped(table, written=None):
+    """`table` with a version stamp; `written` is when its data was fetched (default now)."""
+    metadata = dict(table.schema.metadata or {})
+    metadata.update({
+        b"cache.format": FORMAT_VERSION.encode(),
+        b"cache.written_at": repr(written or time.time()).encode(),
+        b"cache.writer": f"{socket.gethostname()}:{os.getpid()}".encode(),
+    })
+    return table.replace_schema_metadata(metadata)
+
+
+def write_table(path, table, written=None):
+    """Stamp and write `table` to `path` atomically (temporary file + rename)."""
+    table = _stamped(table, written)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive inter-process lock on a sidecar file (no-op where unsupported or not writable)."""
+    try:
+        if fcntl is None:
+            raise OSError("file locking unavailable")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lock = open(path.with_name(path.name + ".lock"), "a")
+    except OSError:
+        yield
+        return
+    with lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def shared_table(key, max_age, produce):
+    """
+    Table for `key` from the shared tier if a fresh copy exists, else `produce()`
+    (a pyarrow Table), written for the other processes and returned mapped.
+    With the tier disabled or the directory not writable, the produced table is returned
+    unmapped. A table taken from the cache backend keeps the backend's write time as
+    its `written_at`, so its age counts from the original fetch.
+    """
+    def produce_table():
+        return cached_entry(key, max_age, produce)
+
+    if not ENABLED:
+        produced, fetched_at = produce_table()
+        return _stamped(produced, fetched_at)
+    path = cache_path(key)
+    table = read_table(path, max_age)
+    if table is not None:
+        return table
+    with _file_lock(path):
+        # Another process may have written it while this one waited for the lock
+        table = read_table(path, max_age)
+        if table is not None:
+            return table
+        try:
+            produced, fetched_at = produce_table()
+        except Exception:
+            # An expired copy beats no data while the upstream is failing
+            table = read_table(path)
+            if table is None:
+                raise
+            logger.warning("serving expired %s: refresh failed", key)
+            return table
+        try:
+            write_table(path, produced, fetched_at)
+        except OSError:
+            return _stamped(produced, fetched_at)
+    table = read_table(path)
+    return _stamped(produced, fetched_at) if table is None else table
+
+
+def column_array(table, name):
+    """Column as a numpy array, zero-copy (read-only) when it is a single chunk without nulls."""
+    column = table.column(name)
+    if column.num_chunks == 1:
+        try:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            pass
+    return column.to_numpy()
@@ -0,0 +1,366 @@
+import json
+import time
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from utils import memory, ttl_policy
+from utils.providers import EmptyResponse
+from utils.refresh import peek, revalidate
+from utils.shared_cache import column_array, peek_table, shared_table, written_at
+from utils.tracing import traced
+
+# Frequency -> statement kind -> yfinance Ticker attribute
+STATEMENT_SOURCES = {
+    "annual": {
+        "balance_sheet": "balance_sheet",
+        "income": "financials",
+        "cashflow": "cashflow",
+    },
+    "quarterly": {
+        "balance_sheet": "quarterly_balance_sheet",
+        "income": "quarterly_financials",
+        "cashflow": "quarterly_cashflow",
+    },
+}
+
+# Flow statements are summed over periods for TTM; the balance sheet is a point-in-time snapshot
+FLOW_STATEMENTS = ("income", "cashflow")
+
+# Four consecutive quarter ends lie ~273 days apart; anything wider means a missing quarter
+MAX_TTM_SPAN = pd.Timedelta(days=300)
+
+# SEBI listing rules: quarterly results within 45 days of the quarter end, annual within 60 days
+PERIOD_LENGTH = {"annual": pd.DateOffset(years=1), "quarterly": pd.DateOffset(months=3), "ttm": pd.DateOffset(months=3)}
+# Period ends move by a few days (Jun 30 - 3 months is Mar 30), so periods match within this slack
+PERIOD_TOLERANCE = pd.Timedelta(days=15)
+REPORTING_LAG = {"annual": pd.Timedelta(days=60), "quarterly": pd.Timedelta(days=45)}
+
+# `stock.info` field with the latest period Yahoo has statements for: the freshness probe
+PROBE_KEYS = {"annual": "lastFiscalYearEnd", "quarterly": "mostRecentQuarter"}
+
+STATEMENT_TITLES = {
+    "income": "Financials (Income Statement)",
+    "balance_sheet": "Balance Sheet",
+    "cashflow": "Cashflow",
+}
+
+
+class Statement:
+    """
+    One financial statement as a compact (line item x period) float64 array.
+    Periods are sorted oldest first, so the latest period is always column -1.
+    """
+
+    __slots__ = ("values", "items", "periods", "item_index", "period_index")
+
+    def __init__(self, values, items, periods):
+        self.values = values
+        self.items = tuple(items)
+        self.periods = pd.DatetimeIndex(periods)
+        self.item_index = {item: i for i, item in enumerate(self.items)}
+        self.period_index = {period: j for j, period in enumerate(self.periods)}
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.periods.nbytes + memory.sizeof(self.items)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build from a yfinance statement frame (line items as index, periods as columns)."""
+        if df is None or df.empty:
+            return cls(np.empty((0, 0)), [], [])
+
+        df = df.copy()
+        df.index = df.index.map(str)
+        df = df[~df.index.duplicated(keep="first")]
+        df.columns = pd.to_datetime(df.columns, errors="coerce")
+        df = df.loc[:, df.columns.notna()].sort_index(axis=1)
+        values = df.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+        # Stores are shared across sessions, so keep them read-only
+        values.flags.writeable = False
+        return cls(values, df.index, df.columns)
+
+    @property
+    def empty(self):
+        return self.values.size == 0
+
+    def get(self, item, period=-1, default=np.nan):
+        """Value of a line item for a period (column position or Timestamp)."""
+        i = self.item_index.get(item)
+        if i is None or self.empty:
+            return default
+        j = self.period_index.get(period) if isinstance(period, pd.Timestamp) else period
+        if j is None:
+            return default
+        return self.values[i, j]
+
+    def latest(self, item, default=np.nan):
+        return self.get(item, -1, default)
+
+    def row(self, item):
+        """All periods of a line item (NaN-filled if the item is missing)."""
+        i = self.item_index.get(item)
+        if i is None:
+            return np.full(len(self.periods), np.nan)
+        return self.values[i]
+
+    def ttm(self, window=4):
+        """
+        Rolling `window`-period sums for every line item at once.
+        A period is NaN unless all `window` periods are reported and consecutive.
+        """
+        n_periods = len(self.periods)
+        if self.empty or n_periods < window:
+            return Statement(np.empty((len(self.items), 0)), self.items, [])
+
+        filled = np.nan_to_num(self.values)
+        counts = (~np.isnan(self.values)).cumsum(axis=1)
+        sums = filled.cumsum(axis=1)
+        totals = sums[:, window - 1:].copy()
+        totals[:, 1:] -= sums[:, :-window]
+        valid = counts[:, window - 1:].copy()
+        valid[:, 1:] -= counts[:, :-window]
+        totals[valid < window] = np.nan
+
+        span = self.periods[window - 1:] - self.periods[:n_periods - window + 1]
+        totals[:, np.asarray(span > MAX_TTM_SPAN)] = np.nan
+        totals.flags.writeable = False
+        return Statement(totals, self.items, self.periods[window - 1:])
+
+    def growth(self, lag=1, freq="annual"):
+        """
+        Growth ((current - previous) / |previous|) for every line item, against the period
+        `lag` periods of `freq` earlier by date. NaN where that period was not reported.
+        """
+        if self.empty:
+            return Statement(np.empty((len(self.items), 0)), self.items, [])
+
+        targets = self.periods - PERIOD_LENGTH[freq] * lag
+        # Periods too early to have a match are left out rather than shown as all NaN
+        keep = np.asarray(targets >= self.periods[0] - PERIOD_TOLERANCE)
+        previous_index = self.periods.get_indexer(targets[keep], method="nearest", tolerance=PERIOD_TOLERANCE)
+        current = self.values[:, keep]
+        previous = np.where(previous_index >= 0, self.values[:, previous_index], np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (current - previous) / np.abs(previous)
+        change[~np.isfinite(change)] = np.nan
+        change.flags.writeable = False
+        return Statement(change, self.items, self.periods[keep])
+
+    def to_frame(self):
+        """Back to the yfinance layout (latest period first) for display and downloads."""
+        return pd.DataFrame(self.values, index=list(self.items), columns=self.periods).iloc[:, ::-1]
+
+
+class StatementStore:
+    """All statements of a ticker for one frequency, fetched and parsed once."""
+
+    def __init__(self, ticker, statements, freq="annual"):
+        self.ticker = ticker
+        self.statements = statements
+        self.freq = freq
+        # Unix time new statements are expected (see expected_results); None if unknown
+        self.next_results = None
+        self._derived = {}
+        self._derived_sizes = {}
+
+    @classmethod
+    def empty(cls, ticker, freq="annual"):
+        """Store with no data, used when a ticker's statements cannot be fetched."""
+        statements = {kind: Statement.from_frame(None) for kind in STATEMENT_SOURCES[freq]}
+        return cls(ticker, statements, freq)
+
+    def __getitem__(self, kind):
+        return self.statements[kind]
+
+    def get(self, kind, item, period=-1, default=np.nan):
+        return self.statements[kind].get(item, period, default)
+
+    @property
+    def latest_period(self):
+        """Most recent period reported in any statement (None when empty)."""
+        periods = [statement.periods[-1] for statement in self.statements.values() if len(statement.periods)]
+        return max(periods) if periods else None
+
+    @property
+    def nbytes(self):
+        """Bytes held by the statement arrays and labels (not the derived values)."""
+        return sum(statement.nbytes for statement in self.statements.values())
+
+    def cached(self, key, compute):
+        """Memoize a value derived from this store, so it lives as long as the cached store."""
+        if key not in self._derived:
+            self._derived[key] = compute(self)
+            self._derived_sizes[key] = memory.sizeof(self._derived[key])
+            memory.enforce()
+        return self._derived[key]
+
+    def derived_nbytes(self):
+        """{key: bytes} of the memoized derived values."""
+        return dict(self._derived_sizes)
+
+    def drop_derived(self, key):
+        """Forget a derived value (recomputed on its next use)."""
+        self._derived.pop(key, None)
+        self._derived_sizes.pop(key, None)
+
+    def ttm(self):
+        """
+        Trailing-twelve-month view of a quarterly store: flow statements become
+        rolling 4-quarter sums, the balance sheet keeps its reported values.
+        Computed once and kept with the store.
+        """
+        return self.cached("ttm", lambda store: StatementStore(store.ticker, {
+            kind: statement.ttm() if kind in FLOW_STATEMENTS else statement
+            for kind, statement in store.statements.items()
+        }, "ttm"))
+
+    def growth(self, lag=1):
+        """Growth over `lag` periods, matched by date, for every statement (lag=4 on quarters is YoY)."""
+        return self.cached(("growth", lag), lambda store: StatementStore(store.ticker, {
+            kind: statement.growth(lag, store.freq) for kind, statement in store.statements.items()
+        }, store.freq))
+
+    def to_table(self):
+        """
+        Arrow table with every cell of every statement, row-major and grouped by
+        statement; the (items, periods) shape of each is kept in the schema metadata.
+        """
+        kinds, items, periods, values, shapes = [], [], [], [], {}
+        for kind, statement in self.statements.items():
+            n_items, n_periods = statement.values.shape if not statement.empty else (0, 0)
+            shapes[kind] = [n_items, n_periods]
+            kinds += [kind] * (n_items * n_periods)
+            items += [item for item in statement.items for _ in range(n_periods)]
+            periods.append(np.tile(statement.periods.to_numpy(), n_items))
+            values.append(statement.values.ravel() if n_periods else np.empty(0))
+        table = pa.table({
+            "statement": pa.array(kinds, pa.string()),
+            "line_item": pa.array(items, pa.string()),
+            "period": pa.array(np.concatenate(periods).astype("datetime64[ns]")),
+            "value": pa.array(np.concatenate(values), pa.float64()),
+        })
+        metadata = {b"statements.shapes": json.dumps(shapes).encode()}
+        if self.next_results is not None:
+            metadata[b"statements.next_results"] = repr(self.next_results).encode()
+        return table.replace_schema_metadata(metadata)
+
+    @classmethod
+    def from_table(cls, ticker, table, freq="annual"):
+        """From `to_table` output; statement values are views of the (memory-mapped) value column."""
+        metadata = table.schema.metadata
+        shapes = json.loads(metadata[b"statements.shapes"])
+        values = column_array(table, "value")
+        statements, offset = {}, 0
+        for kind, (n_items, n_periods) in shapes.items():
+            size = n_items * n_periods
+            if size:
+                items = table.column("line_item").slice(offset, size).to_pylist()[::n_periods]
+                periods = table.column("period").slice(offset, n_periods).to_pandas()
+                statements[kind] = Statement(values[offset:offset + size].reshape(n_items, n_periods), items, periods)
+            else:
+                statements[kind] = Statement.from_frame(None)
+            offset += size
+        store = cls(ticker, statements, freq)
+        if b"statements.next_results" in metadata:
+            store.next_results = float(metadata[b"statements.next_results"])
+        return store
+
+    def to_long(self):
+        """Long format (statement, line_item, period, value) with missing values dropped."""
+        frames = []
+        for kind, statement in self.statements.items():
+            if statement.empty:
+                continue
+            n_items, n_periods = statement.values.shape
+            frames.append(pd.DataFrame({
+                "statement": kind,
+                "line_item": np.repeat(np.array(statement.items, dtype=object), n_periods),
+                "period": np.tile(statement.periods, n_items),
+                "value": statement.values.ravel(),
+            }))
+        if not frames:
+            return pd.DataFrame(columns=["statement", "line_item", "period", "value"])
+        return pd.concat(frames, ignore_index=True).dropna(subset=["value"])
+
+
+def expected_results(store, info=None, now=None):
+    """
+    Unix time the next statements are expected: the next earnings date in `info`,
+    else the end of the period after the latest one plus the reporting deadline.
+    """
+    now = time.time() if now is None else now
+    upcoming = [date for date in ttl_policy.earnings_dates(info) if date > now]
+    if upcoming:
+        return upcoming[0]
+    latest = store.latest_period
+    if latest is None:
+        return now
+    return (latest + PERIOD_LENGTH[store.freq] + REPORTING_LAG[store.freq]).timestamp()
+
+
+def results_due(store, info=None, now=None):
+    """
+    True when `store` may be out of date: its expected results date has passed and
+    Yahoo's latest reported period (from `info`) is newer than the store's, or unknown.
+    """
+    now = time.time() if now is None else now
+    if store.next_results is not None and now < store.next_results:
+        return False
+    reported = (info or {}).get(PROBE_KEYS[store.freq])
+    latest = store.latest_period
+    if not isinstance(reported, (int, float)) or latest is None:
+        return True
+    return pd.Timestamp(reported, unit="s").normalize() > latest
+
+
+def _statements_ttl(ticker):
+    # Statements change with results: the earnings dates come from the ticker's info, if loaded
+    return ttl_policy.fundamentals(peek(("info", ticker)))
+
+
+def _fetch_statements(ticker, freq, stock):
+    key = f"{stock.provider.name}/statements/{ticker}.{freq}"
+    info = peek(("info", ticker))
+
+    # Statements change only when results come out: keep the stored ones until then
+    previous = peek(("statements", ticker, freq))
+    if previous is None:
+        table = peek_table(key)
+        previous = None if table is None else StatementStore.from_table(ticker, table, freq)
+    if previous is not None and not results_due(previous, info):
+        return previous, None
+
+    # Other server processes share the parsed statements through the Arrow tier
+    def produce():
+        statements, errors = {}, []
+        for kind, attr in STATEMENT_SOURCES[freq].items():
+            try:
+                df = getattr(stock, attr, None)
+            except Exception as e:
+                df = None
+                errors.append(e)
+            statements[kind] = Statement.from_frame(df)
+        # Nothing came back: fail, so an older copy is kept rather than replaced by an empty store
+        if len(errors) == len(statements):
+            raise errors[-1]
+        if all(statement.empty for statement in statements.values()):
+            raise EmptyResponse(f"no {freq} statements returned for {ticker}")
+        store = StatementStore(ticker, statements, freq)
+        store.next_results = expected_results(store, info)
+        return store.to_table()
+
+    table = shared_table(key, _statements_ttl(ticker), produce)
+    return StatementStore.from_table(ticker, table, freq), written_at(table)
+
+
+@traced("fetch")
+def load_statements(stock, freq="annual"):
+    """
+    Cached statement store ("annual" or "quarterly") for a Ticker (utils.providers), shared across sessions.
+    Fresh until the next earnings date; after that the old store is served while it
+    refreshes, which refetches only once Yahoo reports a newer period (`results_due`).
+    """
+    key = ("statements", stock.ticker, freq)
+    ttl = _statements_ttl(stock.ticker)
+    return revalidate(key, ttl, lambda: _fetch_statements(stock.ticker, freq, stock)).value
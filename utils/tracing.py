@@ -0,0 +1,235 @@
+"""
+Per-rerun tracing: a tree of timed spans (fetch, compute, render) for each script run.
+
+Enabled with DASHBOARD_TRACE=1. Each finished rerun is appended as one JSON line to
+DASHBOARD_TRACE_FILE (default .cache/traces.jsonl) and shown in a debug sidebar.
+When disabled, `traced` returns the function unchanged and `span` returns a shared
+no-op context manager, so instrumented code runs at full speed.
+
+    @traced("compute")
+    def compute_rsi(close): ...
+
+    with span("history", "fetch", period=period):
+        hist = stock.history(period=period)
+
+A st.fragment that reruns on its own runs outside the script's root span; with
+`@traced(root=True)` such a call is traced as a rerun of its own, shown below
+the fragment.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from config import settings
+
+ENABLED = settings.TRACE_ENABLED
+TRACE_FILE = settings.TRACE_FILE
+PHASES = ("fetch", "compute", "render")
+
+# Innermost open span of the current script run; None outside a traced rerun
+# (e.g. in worker threads), where spans are not recorded
+_current = contextvars.ContextVar("dashboard_trace_span", default=None)
+_write_lock = threading.Lock()
+
+
+class Span:
+    __slots__ = ("name", "phase", "attrs", "start", "end", "children")
+
+    def __init__(self, name, phase=None, attrs=None):
+        self.name = name
+        self.phase = phase
+        self.attrs = attrs or {}
+        self.start = time.perf_counter()
+        self.end = None
+        self.children = []
+
+    @property
+    def duration_ms(self):
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    def to_dict(self, origin=None):
+        origin = self.start if origin is None else origin
+        node = {
+            "name": self.name,
+            "phase": self.phase,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+        if self.attrs:
+            node["attrs"] = self.attrs
+        if self.children:
+            node["children"] = [child.to_dict(origin) for child in self.children]
+        return node
+
+    def walk(self, depth=0):
+        """(depth, span) pairs in depth-first order."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+class _SpanContext:
+    __slots__ = ("span", "_token")
+
+    def __init__(self, name, phase, attrs):
+        self.span = None
+        self._token = None
+        parent = _current.get()
+        if parent is not None:
+            self.span = Span(name, phase, attrs)
+            parent.children.append(self.span)
+
+    def __enter__(self):
+        if self.span is not None:
+            self.span.start = time.perf_counter()
+            self._token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is not None:
+            self.span.end = time.perf_counter()
+            if exc_type is not None:
+                self.span.attrs["error"] = exc_type.__name__
+            _current.reset(self._token)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name, phase=None, **attrs):
+    """Context manager timing a block as a child of the current span."""
+    if not ENABLED:
+        return _NOOP
+    return _SpanContext(name, phase, attrs)
+
+
+def traced(phase=None, name=None, root=False):
+    """
+    Decorator wrapping every call of a function in a span (module.function by default).
+    With `root=True` (st.fragment functions) a call made while no span is open, i.e. a
+    fragment rerun, opens and closes a root span of its own (see `_fragment_rerun`).
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if root and _current.get() is None:
+                return _fragment_rerun(span_name, phase, func, args, kwargs)
+            with _SpanContext(span_name, phase, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _fragment_rerun(span_name, phase, func, args, kwargs):
+    """Trace a fragment rerun like a script run; its trace goes below the fragment (not the sidebar)."""
+    trace = begin_rerun("fragment rerun", fragment=span_name)
+    try:
+        with _SpanContext(span_name, phase, {}):
+            result = func(*args, **kwargs)
+    finally:
+        trace = end_rerun(trace)
+    show_trace(trace)
+    return result
+
+
+# ---- Rerun lifecycle ----
+
+def begin_rerun(name="rerun", **attrs):
+    """Open the root span of this script run (a no-op when tracing is disabled)."""
+    if not ENABLED:
+        return None
+    root = Span(name, attrs=attrs)
+    _current.set(root)
+    return root
+
+
+def end_rerun(root, **attrs):
+    """Close the root span, append the tree to the trace file and return it."""
+    if root is None:
+        return None
+    root.end = time.perf_counter()
+    root.attrs.update(attrs)
+    _current.set(None)
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        "pid": os.getpid(),
+        **root.to_dict(),
+    }
+    line = json.dumps(record, default=str)
+    with _write_lock:
+        TRACE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with TRACE_FILE.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    return root
+
+
+def phase_totals(root):
+    """Milliseconds per phase, counting only the outermost span of each phase."""
+    totals = dict.fromkeys(PHASES, 0.0)
+
+    def visit(node, inside):
+        if node.phase in totals and node.phase not in inside:
+            totals[node.phase] += node.duration_ms
+            inside = inside | {node.phase}
+        for child in node.children:
+            visit(child, inside)
+
+    visit(root, frozenset())
+    return totals
+
+
+def show_trace_sidebar(root):
+    """Span tree and phase totals of the run that just finished, in the sidebar."""
+    if root is None:
+        return
+    import streamlit as st
+
+    with st.sidebar:
+        st.subheader(f"⏱️ Rerun trace - {root.duration_ms:,.0f} ms")
+        _trace_table(root)
+
+
+def show_trace(root):
+    """Span tree of a fragment rerun, collapsed where it is called (a fragment cannot write to the sidebar)."""
+    if root is None:
+        return
+    import streamlit as st
+
+    with st.expander(f"⏱️ Fragment trace - {root.duration_ms:,.0f} ms"):
+        _trace_table(root)
+
+
+def _trace_table(root):
+    import streamlit as st
+
+    totals = phase_totals(root)
+    st.caption(" · ".join(f"{phase} {ms:,.0f} ms" for phase, ms in totals.items()))
+    rows = [{
+        "Span": "\u2003" * (depth - 1) + node.name,
+        "Phase": node.phase or "",
+        "ms": round(node.duration_ms, 1),
+        "% of rerun": 100 * node.duration_ms / root.duration_ms if root.duration_ms else 0.0,
+    } for depth, node in root.walk() if depth]
+    st.dataframe(
+        rows, hide_index=True, use_container_width=True,
+        column_config={"% of rerun": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f%%")},
+    )
+    st.caption(f"Appended to {TRACE_FILE}")
@@ -0,0 +1,119 @@
+"""
+Cache lifetimes that follow the NSE trading calendar and the kind of data.
+
+A policy is a function of the fetch time (Unix seconds) returning how many
+seconds the value stays fresh. Every cache layer accepts either a policy or
+plain seconds as its TTL and resolves it with `resolve`:
+
+    PRICE                 30 s while NSE trades, otherwise until the next session opens
+    QUOTE                 5 min while NSE trades, otherwise until the next session opens
+    fundamentals(info)    until the next earnings date, polled while new results come in
+
+Sessions run 09:15-15:30 IST on weekdays that are not exchange holidays
+(config/nse_holidays.csv, to be extended from each year's NSE circular; dates
+past the listed years count as trading days). Prices are treated as live until
+16:00, while closing prices settle.
+"""
+import csv
+import time
+from datetime import datetime, time as clock, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+
+IST = timezone(timedelta(hours=5, minutes=30), "IST")
+SESSION_OPEN = clock(9, 15)
+LIVE_UNTIL = clock(16, 0)
+
+HOLIDAY_FILE = Path(__file__).resolve().parent.parent / "config" / "nse_holidays.csv"
+
+PRICE_LIVE_TTL = 30
+QUOTE_LIVE_TTL = 300
+
+# Without an upcoming earnings date statements are checked daily, and never cached past a week
+FUNDAMENTALS_DEFAULT_TTL = 86400
+FUNDAMENTALS_MAX_TTL = 7 * 86400
+# Yahoo fills in new statements over the days after results; poll until then
+RESULTS_LAG = 14 * 86400
+RESULTS_POLL_TTL = 6 * 3600
+
+EARNINGS_KEYS = ("earningsTimestamp", "earningsTimestampStart", "earningsTimestampEnd")
+
+
+# ---- Trading calendar ----
+
+@lru_cache(maxsize=1)
+def holidays():
+    """NSE trading holidays as a frozenset of dates."""
+    with open(HOLIDAY_FILE, newline="", encoding="utf-8") as f:
+        return frozenset(datetime.strptime(row["date"], "%Y-%m-%d").date() for row in csv.DictReader(f))
+
+
+def is_trading_day(day):
+    return day.weekday() < 5 and day not in holidays()
+
+
+def is_live(moment):
+    """True while prices move: a trading day between the open and LIVE_UNTIL (IST)."""
+    moment = moment.astimezone(IST)
+    return is_trading_day(moment.date()) and SESSION_OPEN <= moment.time() < LIVE_UNTIL
+
+
+def next_open(moment):
+    """Start of the first session opening after `moment`."""
+    moment = moment.astimezone(IST)
+    day = moment.date()
+    if moment.time() >= SESSION_OPEN:
+        day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return datetime.combine(day, SESSION_OPEN, IST)
+
+
+# ---- Policies ----
+
+def resolve(ttl, fetched_at=None):
+    """Seconds a value fetched at `fetched_at` (default now) stays fresh; `ttl` is seconds or a policy."""
+    if callable(ttl):
+        return max(0.0, ttl(time.time() if fetched_at is None else fetched_at))
+    return ttl
+
+
+def market_hours(live_ttl):
+    """Policy: `live_ttl` while NSE trades, otherwise until the next session opens."""
+    def ttl(fetched_at):
+        moment = datetime.fromtimestamp(fetched_at, IST)
+        if is_live(moment):
+            return live_ttl
+        return next_open(moment).timestamp() - fetched_at
+    return ttl
+
+
+PRICE = market_hours(PRICE_LIVE_TTL)
+QUOTE = market_hours(QUOTE_LIVE_TTL)
+
+
+def earnings_dates(info):
+    """Earnings timestamps (Unix seconds) announced in a `stock.info` dict."""
+    dates = set()
+    for key in EARNINGS_KEYS:
+        value = (info or {}).get(key)
+        if isinstance(value, (int, float)) and value > 0:
+            dates.add(float(value))
+    return sorted(dates)
+
+
+def fundamentals(info=None):
+    """
+    Policy for financial statements: fresh until the next earnings date in `info`,
+    every RESULTS_POLL_TTL for RESULTS_LAG after one, a day when no date is known.
+    """
+    dates = earnings_dates(info)
+
+    def ttl(fetched_at):
+        if any(fetched_at - RESULTS_LAG <= date <= fetched_at for date in dates):
+            return RESULTS_POLL_TTL
+        upcoming = [date for date in dates if date > fetched_at]
+        if upcoming:
+            return min(upcoming[0] - fetched_at, FUNDAMENTALS_MAX_TTL)
+        return FUNDAMENTALS_DEFAULT_TTL
+    return ttl